@@ -1,65 +1,213 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from typing import Any, Dict, List, Optional
 import uvicorn
 import json
+import signal
 import sys
 import os
+import threading
 
 # Import calculation functions from calculator.py
 sys.path.append(os.path.dirname(__file__))
-from calculator import create_baseline_projection, create_education_projection, create_job_projection, create_military_projection
+from calculator import create_baseline_projection, create_education_projection, create_job_projection, create_military_projection, parse_fields
+from serialization import dumps
+from projection_result import ProjectionResult, get_default_result_store
+from data_loader import DataFileWatcher, get_default_data_loader, reload_default_data_loader
+import columnar
 
-app = FastAPI()
+
+class ProjectionJSONResponse(JSONResponse):
+    """JSON response rendered with the fast projection serializer (orjson when available)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def projection_response(request: Request, result: Dict[str, Any]) -> Response:
+    """
+    Build the response for a projection result, honouring the Accept header.
+    
+    Clients that send Accept: application/vnd.launchplan.columnar receive the
+    compact columnar encoding (see columnar.py); everyone else gets JSON.
+    """
+    encoding = columnar.negotiate(request.headers.get("accept"))
+    if encoding is not None and "error" not in result:
+        return Response(content=columnar.encode(result, encoding),
+                        media_type=columnar.MEDIA_TYPE,
+                        headers={"Vary": "Accept"})
+    return ProjectionJSONResponse(content=result, headers={"Vary": "Accept"})
+
+
+def requested_fields(request: Request, body: Dict[str, Any]) -> Optional[List[str]]:
+    """
+    Read the projection fields a client asked for.
+    
+    Fields come from the ?fields=netWorth,cashFlow query parameter or a
+    "fields" key in the request body (list or comma-separated string);
+    the query parameter wins when both are present.
+    """
+    return parse_fields(request.query_params.get("fields", body.get("fields")))
+
+
+def wants_lazy_sections(request: Request, body: Dict[str, Any]) -> bool:
+    """
+    Check whether a client asked for deferred result sections.
+    
+    Clients opt in with ?lazy=true or "lazySections": true in the request body.
+    """
+    value = request.query_params.get("lazy", body.get("lazySections", False))
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
+
+
+def keep_lazy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Store a lazy projection so its deferred sections can be fetched later.
+    
+    Adds 'resultId' and the names of the 'deferredSections' to the response;
+    fetch a section with GET /api/calculate/results/{resultId}/{section}.
+    Only 'loanSchedules' is computed when fetched; the other sections are
+    computed with the projection and just left out of the first response.
+    
+    Results are kept in this worker's memory, so lazy projections need the API
+    to run as a single worker: a follow-up that reaches another worker gets a
+    404 as if the result had expired.
+    """
+    if isinstance(result, ProjectionResult) and "error" not in result:
+        deferred = result.pending_sections()
+        result["resultId"] = get_default_result_store().put(result)
+        result["deferredSections"] = deferred
+    return result
+
+
+app = FastAPI(default_response_class=ProjectionJSONResponse)
+
+@app.on_event("startup")
+def watch_reference_data():
+    """Reload the reference data on SIGHUP and, if DATA_RELOAD_INTERVAL is set, when its files change."""
+    get_default_data_loader().preload()
+    signal.signal(signal.SIGHUP, lambda signum, frame: threading.Thread(
+        target=reload_default_data_loader, name="data-reload", daemon=True).start())
+    interval = float(os.environ.get("DATA_RELOAD_INTERVAL", "0"))
+    if interval > 0:
+        DataFileWatcher(interval).start()
 
 @app.post("/api/calculate/financial-projection")
 async def calculate_baseline(request: Request):
     try:
         input_data = await request.json()
-        result = create_baseline_projection(input_data)
-        return JSONResponse(content=result)
+        fields = requested_fields(request, input_data)
+        lazy = wants_lazy_sections(request, input_data)
+        result = create_baseline_projection(input_data, fields, lazy)
+        return projection_response(request, keep_lazy_result(result) if lazy else result)
+    except ValueError as e:
+        return ProjectionJSONResponse(content={"error": str(e)}, status_code=400)
     except Exception as e:
-        return JSONResponse(content={"error": str(e)}, status_code=500)
+        return ProjectionJSONResponse(content={"error": str(e)}, status_code=500)
 
 @app.post("/api/calculate/education-projection")
 async def calculate_education(request: Request):
     try:
         body = await request.json()
         input_data = body.get("input_data", {})
+        fields = requested_fields(request, body)
+        lazy = wants_lazy_sections(request, body)
         college_id = body.get("college_id")
         occupation_id = body.get("occupation_id")
         if not college_id or not occupation_id:
-            return JSONResponse(content={"error": "college_id and occupation_id are required"}, status_code=400)
-        result = create_education_projection(input_data, college_id, occupation_id)
-        return JSONResponse(content=result)
+            return ProjectionJSONResponse(content={"error": "college_id and occupation_id are required"}, status_code=400)
+        result = create_education_projection(input_data, college_id, occupation_id, fields, lazy)
+        return projection_response(request, keep_lazy_result(result) if lazy else result)
+    except ValueError as e:
+        return ProjectionJSONResponse(content={"error": str(e)}, status_code=400)
     except Exception as e:
-        return JSONResponse(content={"error": str(e)}, status_code=500)
+        return ProjectionJSONResponse(content={"error": str(e)}, status_code=500)
 
 @app.post("/api/calculate/job-projection")
 async def calculate_job(request: Request):
     try:
         body = await request.json()
         input_data = body.get("input_data", {})
+        fields = requested_fields(request, body)
+        lazy = wants_lazy_sections(request, body)
         occupation_id = body.get("occupation_id")
         if not occupation_id:
-            return JSONResponse(content={"error": "occupation_id is required"}, status_code=400)
-        result = create_job_projection(input_data, occupation_id)
-        return JSONResponse(content=result)
+            return ProjectionJSONResponse(content={"error": "occupation_id is required"}, status_code=400)
+        result = create_job_projection(input_data, occupation_id, fields, lazy)
+        return projection_response(request, keep_lazy_result(result) if lazy else result)
+    except ValueError as e:
+        return ProjectionJSONResponse(content={"error": str(e)}, status_code=400)
     except Exception as e:
-        return JSONResponse(content={"error": str(e)}, status_code=500)
+        return ProjectionJSONResponse(content={"error": str(e)}, status_code=500)
 
 @app.post("/api/calculate/military-projection")
 async def calculate_military(request: Request):
     try:
         body = await request.json()
         input_data = body.get("input_data", {})
+        fields = requested_fields(request, body)
+        lazy = wants_lazy_sections(request, body)
         branch = body.get("branch")
         occupation_id = body.get("occupation_id")
         if not branch:
-            return JSONResponse(content={"error": "branch is required"}, status_code=400)
-        result = create_military_projection(input_data, branch, occupation_id)
-        return JSONResponse(content=result)
+            return ProjectionJSONResponse(content={"error": "branch is required"}, status_code=400)
+        result = create_military_projection(input_data, branch, occupation_id, fields, lazy)
+        return projection_response(request, keep_lazy_result(result) if lazy else result)
+    except ValueError as e:
+        return ProjectionJSONResponse(content={"error": str(e)}, status_code=400)
+    except Exception as e:
+        return ProjectionJSONResponse(content={"error": str(e)}, status_code=500)
+
+@app.get("/api/calculate/results/{result_id}/{section}")
+async def fetch_result_section(request: Request, result_id: str, section: str):
+    try:
+        value = get_default_result_store().get_section(result_id, section)
+        return projection_response(request, {section: value})
+    except KeyError as e:
+        return ProjectionJSONResponse(content={"error": str(e.args[0])}, status_code=404)
+    except Exception as e:
+        return ProjectionJSONResponse(content={"error": str(e)}, status_code=500)
+
+def college_search_filters(request: Request) -> Dict[str, Any]:
+    """
+    Read the search_colleges filters from query parameters.
+    
+    ?states=CA,NY&types=Public&sizes=small&maxTuition=20000&minAcceptance=10&maxAcceptance=60
+    """
+    params = request.query_params
+    filters: Dict[str, Any] = {}
+    for key in ("states", "types", "sizes"):
+        if params.get(key):
+            filters[key] = [value.strip() for value in params[key].split(",") if value.strip()]
+    if params.get("maxTuition"):
+        filters["maxTuition"] = float(params["maxTuition"])
+    if params.get("minAcceptance") or params.get("maxAcceptance"):
+        filters["acceptanceRange"] = (float(params.get("minAcceptance") or 0),
+                                      float(params.get("maxAcceptance") or 100))
+    return filters
+
+@app.get("/api/colleges/search")
+async def search_colleges(request: Request):
+    try:
+        params = request.query_params
+        order = params.get("order")
+        income = params.get("income")
+        page = get_default_data_loader().search_colleges_page(
+            params.get("q", ""),
+            college_search_filters(request),
+            sort=params.get("sort", "rank"),
+            descending=None if order is None else order.lower() == "desc",
+            limit=int(params.get("limit", 20)),
+            cursor=params.get("cursor"),
+            household_income=float(income) if income else None
+        )
+        return ProjectionJSONResponse(content=page)
+    except ValueError as e:
+        return ProjectionJSONResponse(content={"error": str(e)}, status_code=400)
     except Exception as e:
-        return JSONResponse(content={"error": str(e)}, status_code=500)
+        return ProjectionJSONResponse(content={"error": str(e)}, status_code=500)
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=5000) 
\ No newline at end of file
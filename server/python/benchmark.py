@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the projection engine.
+
+Runs a fixed corpus of representative scenarios through the create_*_projection
+entry points and PathBuilder.compare_paths, and reports for each one the calls
+per second, the p50/p95/p99 latency and the mean wall time spent per stage:
+
+    build      FinancialCalculator.from_input_data
+    project    FinancialCalculator.calculate_projection
+    serialize  JSON serialization of the result, as the API sends it
+    other      everything else (data lookups, milestone and path setup)
+
+Results are written as JSON so they can be stored and compared later:
+
+    python benchmark.py run --output baseline.json
+    python benchmark.py run --output current.json
+    python benchmark.py compare baseline.json current.json --threshold 0.15
+
+compare exits with status 1 when any benchmark got slower than the threshold.
+Timings depend on the machine, so only compare results taken on the same host.
+"""
+
+import argparse
+import contextlib
+import copy
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+
+try:
+    from financial_updated import FinancialCalculator
+    from calculator import (create_baseline_projection, create_education_projection,
+                            create_job_projection, create_military_projection)
+    from path_builder import EducationType, PathBuilder
+    from data_loader import get_default_data_loader
+    from serialization import dumps_str
+except ImportError:
+    from server.python.financial_updated import FinancialCalculator
+    from server.python.calculator import (create_baseline_projection, create_education_projection,
+                                          create_job_projection, create_military_projection)
+    from server.python.path_builder import EducationType, PathBuilder
+    from server.python.data_loader import get_default_data_loader
+    from server.python.serialization import dumps_str
+
+RESULTS_VERSION = 1
+STAGES = ('build', 'project', 'serialize', 'other')
+PERCENTILES = (50, 95, 99)
+
+# Reference records used by the corpus (college_data.csv / occupation_data.csv)
+COLLEGE_ID = '45'            # Samford University, 4-year private
+OCCUPATION_ID = '2452'       # Accountants and Auditors
+GRADUATE_OCCUPATION_ID = '2407'  # Financial Managers
+
+
+def _base_input(start_age: int = 18, **overrides: Any) -> Dict[str, Any]:
+    """
+    Build the input shared by the corpus scenarios: a young adult with some
+    savings, an entry-level salary and rent.
+
+    Args:
+        start_age: Age at the start of the projection
+        **overrides: Input keys to add or replace
+
+    Returns:
+        Calculator input data
+    """
+    input_data = {
+        "startAge": start_age,
+        "yearsToProject": 20,
+        "costOfLivingFactor": 1.0,
+        "emergencyFundAmount": 10000,
+        "personalLoanTermYears": 5,
+        "personalLoanInterestRate": 8,
+        "retirementContributionRate": 0.05,
+        "retirementGrowthRate": 0.07,
+        "discountRate": 0.03,
+        "incomeGrowthRate": 0.03,
+        "assets": [
+            {"type": "investment", "name": "Savings", "initialValue": 5000, "growthRate": 0.03}
+        ],
+        "liabilities": [],
+        "incomes": [
+            {"type": "salary", "name": "Primary Salary", "annualAmount": 42000, "growthRate": 0.03,
+             "startYear": 0, "endYear": 20}
+        ],
+        "expenditures": [
+            {"type": "housing", "name": "Rent", "annualAmount": 15600},
+            {"type": "living", "name": "Food", "annualAmount": 7200},
+            {"type": "living", "name": "Healthcare", "annualAmount": 3600}
+        ],
+        "milestones": []
+    }
+    input_data.update(overrides)
+    return input_data
+
+
+FAMILY_MILESTONES = [
+    {"type": "car", "year": 2, "carValue": 24000, "carDownPayment": 4000, "carMonthlyPayment": 420},
+    {"type": "marriage", "year": 4, "spouseIncome": 52000, "weddingCost": 18000},
+    {"type": "home", "year": 7, "homeValue": 340000, "homeDownPayment": 50000, "homeMonthlyPayment": 2100},
+    {"type": "children", "year": 9, "childrenCount": 2, "childrenExpensePerYear": 13000}
+]
+
+
+def _scenarios() -> List[Dict[str, Any]]:
+    """
+    Define the scenario corpus.
+
+    Each scenario names the entry point it exercises ('baseline', 'education',
+    'job', 'military' or 'compare_paths'), the input data and the entry
+    point's extra arguments. The corpus is fixed so that results stay
+    comparable between runs; add new scenarios rather than changing these.
+
+    Returns:
+        Scenario definitions
+    """
+    part_time_education = {
+        "type": "education", "educationType": "4year_college", "yearsAway": 0, "years": 4,
+        "workStatus": "part-time", "partTimeIncome": 14000, "tuition": 36725,
+        "educationLoans": 20000, "targetOccupation": "Accountants and Auditors"
+    }
+    graduate_school = {
+        "type": "education", "educationType": "masters", "yearsAway": 2, "years": 2,
+        "workStatus": "no", "tuition": 30000, "educationLoans": 30000, "scholarships": 0,
+        "savingsUsed": 0, "targetOccupation": "Financial Managers", "returnToSameProfession": False
+    }
+    return [
+        {"name": "baseline", "call": "baseline", "input": _base_input(22)},
+        {"name": "education_part_time", "call": "education",
+         "args": {"college_id": COLLEGE_ID, "occupation_id": OCCUPATION_ID},
+         "input": _base_input(18, incomes=[], milestones=[part_time_education])},
+        {"name": "graduate_school", "call": "baseline",
+         "input": _base_input(25, milestones=[graduate_school])},
+        {"name": "military", "call": "military",
+         "args": {"branch": "army", "occupation_id": OCCUPATION_ID},
+         "input": _base_input(18, incomes=[])},
+        {"name": "family_baseline", "call": "baseline",
+         "input": _base_input(24, milestones=copy.deepcopy(FAMILY_MILESTONES))},
+        {"name": "family_job", "call": "job", "args": {"occupation_id": OCCUPATION_ID},
+         "input": _base_input(22, incomes=[], milestones=copy.deepcopy(FAMILY_MILESTONES[:2]))},
+        {"name": "paths_work_vs_college", "call": "compare_paths",
+         "args": {"paths": [
+             ("work", {"occupation_id": OCCUPATION_ID}),
+             ("education", {"education_type": EducationType.FOUR_YEAR_COLLEGE,
+                            "target_occupation_id": OCCUPATION_ID, "part_time_income": 14000}),
+             ("education", {"education_type": EducationType.TWO_YEAR_COLLEGE,
+                            "target_occupation_id": OCCUPATION_ID, "work_status": "no"}),
+             ("education", {"education_type": EducationType.MASTERS,
+                            "target_occupation_id": GRADUATE_OCCUPATION_ID, "work_status": "no"})
+         ]},
+         "input": _base_input(18, milestones=copy.deepcopy(FAMILY_MILESTONES[2:]))}
+    ]
+
+
+SCENARIO_NAMES = [scenario['name'] for scenario in _scenarios()]
+
+
+def _compare_paths(input_data: Dict[str, Any], paths: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """Build the scenario's paths and compare them, as the path comparison endpoint does."""
+    builder = PathBuilder(input_data)
+    for kind, kwargs in paths:
+        if kind == 'work':
+            builder.add_immediate_work_path(**kwargs)
+        else:
+            builder.add_education_path(**kwargs)
+    return builder.compare_paths()
+
+
+ENTRY_POINTS: Dict[str, Tuple[str, Callable[..., Dict[str, Any]]]] = {
+    'baseline': ('create_baseline_projection', create_baseline_projection),
+    'education': ('create_education_projection', create_education_projection),
+    'job': ('create_job_projection', create_job_projection),
+    'military': ('create_military_projection', create_military_projection),
+    'compare_paths': ('PathBuilder.compare_paths', _compare_paths)
+}
+
+
+class _StageTimer:
+    """Accumulates wall time per stage while installed around the calculator."""
+
+    def __init__(self):
+        self.totals = dict.fromkeys(STAGES, 0.0)
+
+    def reset(self) -> None:
+        self.totals = dict.fromkeys(STAGES, 0.0)
+
+    @contextlib.contextmanager
+    def installed(self) -> Iterator['_StageTimer']:
+        """
+        Time FinancialCalculator.from_input_data and calculate_projection for
+        as long as the context is active, restoring the originals on exit.
+        """
+        from_input_data = FinancialCalculator.__dict__['from_input_data']
+        calculate_projection = FinancialCalculator.calculate_projection
+        timer = self
+
+        def timed_from_input_data(cls, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return from_input_data.__func__(cls, *args, **kwargs)
+            finally:
+                timer.totals['build'] += time.perf_counter() - start
+
+        def timed_calculate_projection(calculator, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return calculate_projection(calculator, *args, **kwargs)
+            finally:
+                timer.totals['project'] += time.perf_counter() - start
+
+        FinancialCalculator.from_input_data = classmethod(timed_from_input_data)
+        FinancialCalculator.calculate_projection = timed_calculate_projection
+        try:
+            yield self
+        finally:
+            FinancialCalculator.from_input_data = from_input_data
+            FinancialCalculator.calculate_projection = calculate_projection
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Compute a percentile with linear interpolation between the closest ranks.
+
+    Args:
+        samples: Measurements (need not be sorted)
+        pct: Percentile, 0-100
+
+    Returns:
+        The percentile value (0.0 for no samples)
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples: List[float], stage_totals: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Summarize the timed calls of one benchmark.
+
+    Args:
+        samples: Wall time of each call, in seconds
+        stage_totals: Wall time of each stage summed over the calls, in seconds
+
+    Returns:
+        Benchmark results, with times in milliseconds
+    """
+    total = sum(samples)
+    summary = {
+        'calls': len(samples),
+        'totalSeconds': round(total, 6),
+        'callsPerSecond': round(len(samples) / total, 3) if total else 0.0,
+        'meanMs': round(statistics.fmean(samples) * 1000, 4) if samples else 0.0,
+        'minMs': round(min(samples) * 1000, 4) if samples else 0.0,
+        'maxMs': round(max(samples) * 1000, 4) if samples else 0.0
+    }
+    for pct in PERCENTILES:
+        summary[f'p{pct}Ms'] = round(percentile(samples, pct) * 1000, 4)
+    calls = len(samples) or 1
+    summary['stagesMs'] = {stage: round(stage_totals.get(stage, 0.0) / calls * 1000, 4) for stage in STAGES}
+    return summary
+
+
+def run_scenario(scenario: Dict[str, Any], iterations: int, warmup: int,
+                 timer: _StageTimer) -> Dict[str, Any]:
+    """
+    Benchmark one scenario.
+
+    Each call gets a fresh copy of the input (create_baseline_projection
+    adjusts startAge in place); copying is not included in the timings.
+
+    Args:
+        scenario: Scenario definition from the corpus
+        iterations: Number of timed calls
+        warmup: Number of untimed calls made first
+        timer: Installed stage timer
+
+    Returns:
+        Benchmark results (see summarize)
+
+    Raises:
+        RuntimeError: If the entry point returns an error for the scenario
+    """
+    _, function = ENTRY_POINTS[scenario['call']]
+    args = scenario.get('args', {})
+    samples: List[float] = []
+    stage_totals = dict.fromkeys(STAGES, 0.0)
+
+    for i in range(warmup + iterations):
+        input_data = copy.deepcopy(scenario['input'])
+        timer.reset()
+        start = time.perf_counter()
+        result = function(input_data, **args)
+        called = time.perf_counter()
+        dumps_str(result)
+        elapsed = time.perf_counter() - start
+
+        if isinstance(result, dict) and 'error' in result:
+            raise RuntimeError(f"Scenario {scenario['name']} failed: {result['error']}")
+        if i < warmup:
+            continue
+        samples.append(elapsed)
+        stage_totals['build'] += timer.totals['build']
+        stage_totals['project'] += timer.totals['project']
+        stage_totals['serialize'] += elapsed - (called - start)
+        stage_totals['other'] += max(0.0, (called - start) - timer.totals['build'] - timer.totals['project'])
+
+    return summarize(samples, stage_totals)
+
+
+def run_benchmarks(iterations: int = 50, warmup: int = 3, scenarios: Optional[List[str]] = None,
+                   progress: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Run the scenario corpus.
+
+    The calculator writes debug logs to the working directory, so the
+    benchmarks run in a temporary directory; its print output is discarded.
+
+    Args:
+        iterations: Number of timed calls per scenario
+        warmup: Number of untimed calls per scenario (the first call also loads the reference data)
+        scenarios: Names of the scenarios to run (None = all)
+        progress: Optional callback receiving each benchmark's key and results as it finishes
+
+    Returns:
+        Machine-readable results: run metadata plus 'benchmarks', keyed
+        '<scenario>/<entry point>'
+    """
+    selected = [scenario for scenario in _scenarios() if scenarios is None or scenario['name'] in scenarios]
+    unknown = set(scenarios or ()) - set(SCENARIO_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    benchmarks: Dict[str, Any] = {}
+    timer = _StageTimer()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir, open(os.devnull, 'w') as devnull:
+        os.chdir(workdir)
+        try:
+            with contextlib.redirect_stdout(devnull):
+                get_default_data_loader().preload()
+            for scenario in selected:
+                key = f"{scenario['name']}/{ENTRY_POINTS[scenario['call']][0]}"
+                with timer.installed(), contextlib.redirect_stdout(devnull):
+                    benchmarks[key] = run_scenario(scenario, iterations, warmup, timer)
+                if progress:
+                    progress(key, benchmarks[key])
+        finally:
+            os.chdir(cwd)
+
+    return {
+        'version': RESULTS_VERSION,
+        'createdAt': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'iterations': iterations,
+        'warmup': warmup,
+        'benchmarks': benchmarks
+    }
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.15,
+                    metrics: Tuple[str, ...] = ('p50Ms', 'p95Ms')) -> List[Dict[str, Any]]:
+    """
+    Compare benchmark results against a stored baseline.
+
+    Args:
+        baseline: Results of an earlier run_benchmarks
+        current: Results to check
+        threshold: Allowed slowdown as a fraction (0.15 = 15% slower)
+        metrics: Latency metrics to compare
+
+    Returns:
+        One row per benchmark and metric present in both results, with the
+        baseline and current value, their ratio and a 'regression' flag
+    """
+    rows = []
+    for key, results in current.get('benchmarks', {}).items():
+        before = baseline.get('benchmarks', {}).get(key)
+        if before is None:
+            continue
+        for metric in metrics:
+            old, new = before.get(metric), results.get(metric)
+            if not old or new is None:
+                continue
+            ratio = new / old
+            rows.append({'benchmark': key, 'metric': metric, 'baseline': old, 'current': new,
+                         'ratio': round(ratio, 4), 'regression': ratio > 1 + threshold})
+    return rows
+
+
+def _print_result(key: str, results: Dict[str, Any]) -> None:
+    stages = ' '.join(f"{stage}={ms:.2f}" for stage, ms in results['stagesMs'].items())
+    print(f"{key:<58} {results['callsPerSecond']:>9.1f}/s  p50={results['p50Ms']:.2f}ms "
+          f"p95={results['p95Ms']:.2f}ms p99={results['p99Ms']:.2f}ms  [{stages}]", file=sys.stderr)
+
+
+def _load_results(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        results = json.load(f)
+    if results.get('version') != RESULTS_VERSION:
+        raise ValueError(f"{path} is not a version {RESULTS_VERSION} benchmark result")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Args:
+        argv: Arguments (defaults to sys.argv)
+
+    Returns:
+        Exit status: 0, or 1 when compare found a regression
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the projection engine on a fixed scenario corpus")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Run the benchmarks and write the results as JSON")
+    run_parser.add_argument('--output', '-o', default='-', help="Results file ('-' for stdout)")
+    run_parser.add_argument('--iterations', '-n', type=int, default=50, help="Timed calls per scenario")
+    run_parser.add_argument('--warmup', type=int, default=3, help="Untimed calls per scenario")
+    run_parser.add_argument('--scenario', action='append', choices=SCENARIO_NAMES,
+                            help="Run only this scenario (repeatable)")
+
+    compare_parser = commands.add_parser('compare', help="Flag regressions against a stored baseline")
+    compare_parser.add_argument('baseline', help="Baseline results file")
+    compare_parser.add_argument('current', help="Results file to check")
+    compare_parser.add_argument('--threshold', type=float, default=0.15,
+                                help="Allowed slowdown as a fraction (default 0.15)")
+    compare_parser.add_argument('--metric', action='append', choices=['meanMs', 'p50Ms', 'p95Ms', 'p99Ms'],
+                                help="Latency metric to compare (repeatable, default p50Ms and p95Ms)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run_benchmarks(args.iterations, args.warmup, args.scenario, progress=_print_result)
+        text = json.dumps(results, indent=2)
+        if args.output == '-':
+            print(text)
+        else:
+            with open(args.output, 'w') as f:
+                f.write(text + '\n')
+        return 0
+
+    rows = compare_results(_load_results(args.baseline), _load_results(args.current),
+                           args.threshold, tuple(args.metric or ('p50Ms', 'p95Ms')))
+    for row in rows:
+        flag = 'REGRESSION' if row['regression'] else 'ok'
+        print(f"{row['benchmark']:<58} {row['metric']:<6} {row['baseline']:>10.2f} -> {row['current']:>10.2f} ms "
+              f"({row['ratio'] - 1:+.1%})  {flag}")
+    regressions = [row for row in rows if row['regression']]
+    print(f"{len(regressions)} regression(s) over {args.threshold:.0%} in {len(rows)} comparisons")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,7 +33,8 @@ try:
     from models.liability import Liability, Mortgage, StudentLoan, AutoLoan
     from models.income import Income, SalaryIncome, SpouseIncome
     from models.expenditure import Expenditure, Housing, Transportation, Living, Tax
-    from data_loader import DataLoader
+    from data_loader import DataLoader, get_default_data_loader, pinned_data_loader
+    from serialization import dumps_str
 except ImportError:
     # Fallback to full imports (these will work when executed from parent directory)
     # Use the updated financial module with fixed expense categorization
@@ -42,10 +43,13 @@ except ImportError:
     from server.python.models.liability import Liability, Mortgage, StudentLoan, AutoLoan
     from server.python.models.income import Income, SalaryIncome, SpouseIncome
     from server.python.models.expenditure import Expenditure, Housing, Transportation, Living, Tax
-    from server.python.data_loader import DataLoader
+    from server.python.data_loader import DataLoader, get_default_data_loader, pinned_data_loader
+    from server.python.serialization import dumps_str
 
 
-def create_baseline_projection(input_data: Dict[str, Any]) -> Dict[str, Any]:
+@pinned_data_loader()
+def create_baseline_projection(input_data: Dict[str, Any], fields: Optional[List[str]] = None,
+                               lazy_sections: bool = False) -> Dict[str, Any]:
     """
     Create a baseline financial projection from input data.
     
@@ -59,6 +63,9 @@ def create_baseline_projection(input_data: Dict[str, Any]) -> Dict[str, Any]:
     2. Simple costOfLivingFactor (usually in the range of 0.7-1.3) applied to all income/expenses
     
     With the enhanced central calculator model, all projections use the same core engine.
+    
+    Pass fields (e.g. ['netWorth', 'cashFlow']) to compute and return only those series,
+    and lazy_sections=True to withhold the rarely viewed sections (see ProjectionResult).
     """
     # Handle age adjustment based on education type
     original_age = input_data.get('startAge', 22)
@@ -124,7 +131,7 @@ def create_baseline_projection(input_data: Dict[str, Any]) -> Dict[str, Any]:
         
         # Run the projection for the specified number of years
         years_to_project = input_data.get('yearsToProject', 10)
-        result_data = fc.calculate_projection()
+        result_data = fc.calculate_projection(fields=fields, lazy_sections=lazy_sections)
         
         # Add age adjustment information to the result
         if age_adjustment_years > 0:
@@ -151,7 +158,10 @@ def create_baseline_projection(input_data: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-def create_education_projection(input_data: Dict[str, Any], college_id: str, occupation_id: str) -> Dict[str, Any]:
+@pinned_data_loader()
+def create_education_projection(input_data: Dict[str, Any], college_id: str, occupation_id: str,
+                                fields: Optional[List[str]] = None,
+                                lazy_sections: bool = False) -> Dict[str, Any]:
     """
     Create a financial projection for an education path with a specific college and career.
     
@@ -159,12 +169,14 @@ def create_education_projection(input_data: Dict[str, Any], college_id: str, occ
         input_data: Dictionary containing baseline financial input parameters
         college_id: ID of selected college
         occupation_id: ID of selected occupation
+        fields: Optional list of result fields to compute and return (None = all)
+        lazy_sections: Keep the rarely viewed result sections out of the response until read
     
     Returns:
         Dictionary with education path projection results
     """
     # Load college and occupation data
-    data_loader = DataLoader()
+    data_loader = get_default_data_loader()
     college_data = data_loader.get_college_by_id(college_id)
     occupation_data = data_loader.get_occupation_by_id(occupation_id)
     
@@ -255,7 +267,7 @@ def create_education_projection(input_data: Dict[str, Any], college_id: str, occ
     })
     
     # Calculate projection
-    result = calculator.calculate_projection()
+    result = calculator.calculate_projection(fields=fields, lazy_sections=lazy_sections)
     
     # Add education-specific information to results
     result["educationPath"] = {
@@ -291,19 +303,24 @@ def create_education_projection(input_data: Dict[str, Any], college_id: str, occ
     return result
 
 
-def create_job_projection(input_data: Dict[str, Any], occupation_id: str) -> Dict[str, Any]:
+@pinned_data_loader()
+def create_job_projection(input_data: Dict[str, Any], occupation_id: str,
+                          fields: Optional[List[str]] = None,
+                          lazy_sections: bool = False) -> Dict[str, Any]:
     """
     Create a financial projection for immediately entering the workforce.
     
     Args:
         input_data: Dictionary containing baseline financial input parameters
         occupation_id: ID of selected occupation
+        fields: Optional list of result fields to compute and return (None = all)
+        lazy_sections: Keep the rarely viewed result sections out of the response until read
     
     Returns:
         Dictionary with job path projection results
     """
     # Load occupation data
-    data_loader = DataLoader()
+    data_loader = get_default_data_loader()
     occupation_data = data_loader.get_occupation_by_id(occupation_id)
     
     if not occupation_data:
@@ -362,7 +379,7 @@ def create_job_projection(input_data: Dict[str, Any], occupation_id: str) -> Dic
     })
     
     # Calculate projection
-    result = calculator.calculate_projection()
+    result = calculator.calculate_projection(fields=fields, lazy_sections=lazy_sections)
     
     # Add job-specific information to results
     result["jobPath"] = {
@@ -396,7 +413,10 @@ def create_job_projection(input_data: Dict[str, Any], occupation_id: str) -> Dic
     return result
 
 
-def create_military_projection(input_data: Dict[str, Any], branch: str, occupation_id: Optional[str] = None) -> Dict[str, Any]:
+@pinned_data_loader()
+def create_military_projection(input_data: Dict[str, Any], branch: str, occupation_id: Optional[str] = None,
+                               fields: Optional[List[str]] = None,
+                               lazy_sections: bool = False) -> Dict[str, Any]:
     """
     Create a financial projection for military service.
     
@@ -404,12 +424,14 @@ def create_military_projection(input_data: Dict[str, Any], branch: str, occupati
         input_data: Dictionary containing baseline financial input parameters
         branch: Military branch (e.g., "army", "navy")
         occupation_id: Optional ID of selected post-military occupation
+        fields: Optional list of result fields to compute and return (None = all)
+        lazy_sections: Keep the rarely viewed result sections out of the response until read
     
     Returns:
         Dictionary with military path projection results
     """
     # Load occupation data if provided
-    data_loader = DataLoader()
+    data_loader = get_default_data_loader()
     occupation_data = None
     if occupation_id:
         occupation_data = data_loader.get_occupation_by_id(occupation_id)
@@ -543,7 +565,7 @@ def create_military_projection(input_data: Dict[str, Any], branch: str, occupati
     })
     
     # Calculate projection
-    result = calculator.calculate_projection()
+    result = calculator.calculate_projection(fields=fields, lazy_sections=lazy_sections)
     
     # Add military-specific information to results
     result["militaryPath"] = {
@@ -579,6 +601,146 @@ def create_military_projection(input_data: Dict[str, Any], branch: str, occupati
     return result
 
 
+def parse_fields(value: Any) -> Optional[List[str]]:
+    """
+    Parse the 'fields' request option.
+    
+    Args:
+        value: List of field names, a comma-separated string, or None
+    
+    Returns:
+        List of field names, or None when every field is wanted
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(',')
+    if not isinstance(value, (list, tuple)):
+        raise ValueError("fields must be a list of field names or a comma-separated string")
+    fields = [str(field).strip() for field in value if str(field).strip()]
+    if not fields:
+        return None
+    unknown = [field for field in fields
+               if field not in FinancialCalculator.RESULT_FIELDS and field not in FinancialCalculator.LAZY_SECTIONS]
+    if unknown:
+        raise ValueError(f"Unknown projection fields: {', '.join(unknown)}")
+    return fields
+
+
+def run_projection(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the projection requested by an API payload and prepare it for the frontend.
+    
+    This is the request handler shared by the stdin entry point (main) and the
+    pre-fork worker server.
+    
+    Args:
+        input_data: Parsed request payload, including 'pathType' and optionally
+            'fields' to compute and return only some of the series
+    
+    Returns:
+        Dictionary with projection results
+    """
+    path_type = input_data.get("pathType", "baseline")
+    try:
+        fields = parse_fields(input_data.get("fields"))
+    except ValueError as e:
+        return {"error": str(e)}
+    
+    if path_type == "education":
+        college_id = input_data.get("collegeId")
+        occupation_id = input_data.get("occupationId")
+        if not college_id or not occupation_id:
+            result = {"error": "College ID and occupation ID required for education path"}
+        else:
+            result = create_education_projection(input_data, college_id, occupation_id, fields)
+    
+    elif path_type == "job":
+        occupation_id = input_data.get("occupationId")
+        if not occupation_id:
+            result = {"error": "Occupation ID required for job path"}
+        else:
+            result = create_job_projection(input_data, occupation_id, fields)
+    
+    elif path_type == "military":
+        branch = input_data.get("militaryBranch", "army")
+        occupation_id = input_data.get("occupationId")
+        result = create_military_projection(input_data, branch, occupation_id, fields)
+    
+    else:  # baseline or other
+        result = create_baseline_projection(input_data, fields)
+    
+    # Define all expense categories and their default percentages
+    expense_categories = {
+        # Base cost of living categories
+        'housing': 0.30,
+        'transportation': 0.15,
+        'food': 0.15,
+        'healthcare': 0.10,
+        'personal_insurance': 0.05,
+        'apparel': 0.04,
+        'services': 0.07,
+        'entertainment': 0.05,
+        'other': 0.05,
+        # Milestone-driven categories
+        'education': 0.0,  # Default to 0 as these are milestone-driven
+        'childcare': 0.0,  # Default to 0 as these are milestone-driven
+        'debt': 0.0,       # Default to 0 as these are milestone-driven
+        'discretionary': 0.04
+    }
+    
+    # Write some debug info to healthcare_debug.log (field-pruned requests skip the debug logs)
+    debug_logging = fields is None
+    if debug_logging:
+        with open('healthcare_debug.log', 'a') as f:
+            f.write("\n[CALCULATOR] Processing expense categories for frontend visualization...\n")
+            f.write(f"  Result keys: {sorted(result.keys())}\n")
+            if 'expenses' in result:
+                f.write(f"  Total expenses first few years: {result['expenses'][:5]}\n")
+            if 'housing' in result:
+                f.write(f"  Housing expenses first few years: {result['housing'][:5]}\n")
+            if 'healthcare' in result:
+                f.write(f"  Healthcare expenses first few years: {result['healthcare'][:5]}\n")
+    
+    # First, explicitly convert to camelCase for frontend compatibility
+    if 'personal_insurance' in result:
+        result['personalInsurance'] = result.pop('personal_insurance')
+    
+    # Verify expense categories exist and have values
+    for category, default_percentage in expense_categories.items():
+        # Convert snake_case to camelCase for frontend compatibility
+        frontend_key = category
+        if category == 'personal_insurance':
+            frontend_key = 'personalInsurance'
+        if fields is not None and frontend_key not in fields:
+            continue
+        
+        # Check if the category needs to be created or updated
+        if frontend_key not in result or not result[frontend_key] or len(result[frontend_key]) == 0:
+            # Create default expense breakdown based on total expenses
+            if 'expenses' in result and result['expenses']:
+                # Initialize the category with an empty list
+                # Tell the type checker this is a Dict that accepts various types
+                result: Dict[str, Any] = result
+                
+                if frontend_key not in result:
+                    # Initialize the category with an empty list
+                    result[frontend_key] = []
+                
+                # Apply percentage to each year's expenses
+                for year_expense in result['expenses']:
+                    expense_value = float(year_expense) * default_percentage
+                    # Add the calculated value to the list
+                    result[frontend_key].append(expense_value)
+                    
+                # Log what we generated
+                if debug_logging:
+                    with open('healthcare_debug.log', 'a') as f:
+                        f.write(f"  [GENERATED] {frontend_key} expenses first few years (generated from total): {result[frontend_key][:3]}\n")
+    
+    return result
+
+
 def main() -> None:
     """
     Main function to process input from stdin and output results.
@@ -598,95 +760,9 @@ def main() -> None:
             print(json.dumps({"error": f"Invalid JSON input: {str(e)}"}))
             sys.exit(1)
         
-        path_type = input_data.get("pathType", "baseline")
-        
-        if path_type == "education":
-            college_id = input_data.get("collegeId")
-            occupation_id = input_data.get("occupationId")
-            if not college_id or not occupation_id:
-                result = {"error": "College ID and occupation ID required for education path"}
-            else:
-                result = create_education_projection(input_data, college_id, occupation_id)
-        
-        elif path_type == "job":
-            occupation_id = input_data.get("occupationId")
-            if not occupation_id:
-                result = {"error": "Occupation ID required for job path"}
-            else:
-                result = create_job_projection(input_data, occupation_id)
-        
-        elif path_type == "military":
-            branch = input_data.get("militaryBranch", "army")
-            occupation_id = input_data.get("occupationId")
-            result = create_military_projection(input_data, branch, occupation_id)
-        
-        else:  # baseline or other
-            result = create_baseline_projection(input_data)
-        
-        # Define all expense categories and their default percentages
-        expense_categories = {
-            # Base cost of living categories
-            'housing': 0.30,
-            'transportation': 0.15,
-            'food': 0.15,
-            'healthcare': 0.10,
-            'personal_insurance': 0.05,
-            'apparel': 0.04,
-            'services': 0.07,
-            'entertainment': 0.05,
-            'other': 0.05,
-            # Milestone-driven categories
-            'education': 0.0,  # Default to 0 as these are milestone-driven
-            'childcare': 0.0,  # Default to 0 as these are milestone-driven
-            'debt': 0.0,       # Default to 0 as these are milestone-driven
-            'discretionary': 0.04
-        }
-        
-        # Write some debug info to healthcare_debug.log
-        with open('healthcare_debug.log', 'a') as f:
-            f.write("\n[CALCULATOR] Processing expense categories for frontend visualization...\n")
-            f.write(f"  Result keys: {sorted(result.keys())}\n")
-            if 'expenses' in result:
-                f.write(f"  Total expenses first few years: {result['expenses'][:5]}\n")
-            if 'housing' in result:
-                f.write(f"  Housing expenses first few years: {result['housing'][:5]}\n")
-            if 'healthcare' in result:
-                f.write(f"  Healthcare expenses first few years: {result['healthcare'][:5]}\n")
-        
-        # First, explicitly convert to camelCase for frontend compatibility
-        if 'personal_insurance' in result:
-            result['personalInsurance'] = result.pop('personal_insurance')
-        
-        # Verify expense categories exist and have values
-        for category, default_percentage in expense_categories.items():
-            # Convert snake_case to camelCase for frontend compatibility
-            frontend_key = category
-            if category == 'personal_insurance':
-                frontend_key = 'personalInsurance'
-            
-            # Check if the category needs to be created or updated
-            if frontend_key not in result or not result[frontend_key] or len(result[frontend_key]) == 0:
-                # Create default expense breakdown based on total expenses
-                if 'expenses' in result and result['expenses']:
-                    # Initialize the category with an empty list
-                    # Tell the type checker this is a Dict that accepts various types
-                    result: Dict[str, Any] = result
-                    
-                    if frontend_key not in result:
-                        # Initialize the category with an empty list
-                        result[frontend_key] = []
-                    
-                    # Apply percentage to each year's expenses
-                    for year_expense in result['expenses']:
-                        expense_value = float(year_expense) * default_percentage
-                        # Add the calculated value to the list
-                        result[frontend_key].append(expense_value)
-                        
-                    # Log what we generated
-                    with open('healthcare_debug.log', 'a') as f:
-                        f.write(f"  [GENERATED] {frontend_key} expenses first few years (generated from total): {result[frontend_key][:3]}\n")
+        result = run_projection(input_data)
         
-        print(json.dumps(result))
+        print(dumps_str(result))
     
     except Exception as e:
         import traceback
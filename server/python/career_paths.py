@@ -0,0 +1,236 @@
+"""
+Field-of-study career path index built from attached_assets/Top_5_Career_Paths_by_Field_of_Study.csv.
+
+The file lists the top five careers for each of about 30 fields of study. At
+load time every career is matched once to its occupation record (and salary)
+by comparing normalized title tokens, and every field is indexed by its
+normalized name and by its tokens. Looking up a field is then a dict read; a
+name that does not match exactly (e.g. 'Computer Science') is resolved by
+token overlap once and cached. Tokens that many fields share, such as
+'science', do not make a match on their own, so 'Nursing Science' resolves to
+no field rather than to 'Physical Sciences'.
+
+Careers only link to an occupation on an exact or unambiguous title match; a
+career like 'Writer' or 'Laboratory Technician', which several qualified
+occupations contain, is left without an occupation rather than given the
+salary of one of them.
+"""
+
+import csv
+import re
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+# Words that carry no meaning for matching field or occupation names
+STOPWORDS = frozenset({'and', 'of', 'the', 'in', 'related', 'other', 'all', 'general'})
+# A career links to an occupation with exactly its tokens, to one that names it as an alternative
+# ('Musicians and Singers'), or else to the single occupation it overlaps more than this (Jaccard)
+MIN_OCCUPATION_MATCH = 0.5
+# Tokens found in more than this share of the fields (e.g. 'science') do not make a field match on their own
+COMMON_FIELD_TOKEN_SHARE = 0.1
+# Maximum number of distinct field names kept in the lookup cache
+LOOKUP_CACHE_SIZE = 1024
+
+
+def _singular(token: str) -> str:
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def normalize_tokens(text: Any) -> Tuple[str, ...]:
+    """
+    Split a name into normalized matching tokens.
+
+    Args:
+        text: Field of study or occupation name
+
+    Returns:
+        Lower-cased, singularized tokens without stopwords, in order
+    """
+    words = re.findall(r'[a-z0-9]+', str(text or '').lower())
+    return tuple(_singular(word) for word in words if word not in STOPWORDS)
+
+
+def _occupation_alternatives(title: str) -> List[Set[str]]:
+    """
+    Split an occupation title into the alternatives it lists.
+
+    Args:
+        title: Occupation title without its 'Except ...' part
+
+    Returns:
+        Token sets of the listed alternatives ('Interpreters and Translators' ->
+        interpreter, translator), or an empty list if the title names one occupation
+    """
+    if re.search(r',\s*(?:and|or)\b', title, flags=re.I):
+        # 'Plumbers, Pipefitters, and Steamfitters'
+        parts = re.split(r',|\band\b|\bor\b|/', title, flags=re.I)
+    elif ',' in title:
+        # 'Special Education Teachers, Preschool': the rest of the title qualifies the first part
+        return []
+    else:
+        parts = re.split(r'\band\b|/', title, flags=re.I)
+    alternatives = [set(normalize_tokens(part)) for part in parts]
+    alternatives = [tokens for tokens in alternatives if tokens]
+    return alternatives if len(alternatives) > 1 else []
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class CareerPathIndex:
+    """Top careers by field of study, each linked to its occupation record."""
+
+    def __init__(self, rows: List[Dict[str, str]], occupations: List[Dict[str, Any]]):
+        """
+        Build the index.
+
+        Args:
+            rows: Rows of Top_5_Career_Paths_by_Field_of_Study.csv as read by csv.DictReader
+            occupations: Occupation records to link careers to
+        """
+        # 'Architects, Except Landscape and Naval': the excluded titles are not part of the match
+        occupation_titles = [re.split(r'\bexcept\b', str(o.get('title') or ''), flags=re.I)[0].rstrip(' ,')
+                             for o in occupations]
+        occupation_tokens = [set(normalize_tokens(title)) for title in occupation_titles]
+        occupation_alternatives = [_occupation_alternatives(title) for title in occupation_titles]
+        occupation_postings: Dict[str, Set[int]] = {}
+        for position, tokens in enumerate(occupation_tokens):
+            for token in tokens:
+                occupation_postings.setdefault(token, set()).add(position)
+
+        self.fields: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            field = (row.get('Field of Study') or '').strip()
+            career = (row.get('Career') or '').strip()
+            if not field or not career:
+                continue
+            entry = {
+                'fieldOfStudy': field,
+                'option': int(row['Career Option #']) if (row.get('Career Option #') or '').strip().isdigit() else None,
+                'title': career,
+                'occupationId': None,
+                'occupationTitle': None,
+                'salary': None
+            }
+            occupation = self._match_occupation(career, occupations, occupation_tokens,
+                                                occupation_alternatives, occupation_postings)
+            if occupation is not None:
+                entry['occupationId'] = occupation.get('id')
+                entry['occupationTitle'] = occupation.get('title')
+                entry['salary'] = occupation.get('salary')
+            self.fields.setdefault(field, []).append(entry)
+        for careers in self.fields.values():
+            careers.sort(key=lambda entry: entry['option'] if entry['option'] is not None else len(careers))
+
+        self._field_tokens: Dict[str, Set[str]] = {}
+        self._token_fields: Dict[str, Set[str]] = {}
+        self._cache: Dict[str, Optional[str]] = {}
+        for field in self.fields:
+            tokens = set(normalize_tokens(field))
+            self._field_tokens[field] = tokens
+            self._cache[' '.join(normalize_tokens(field))] = field
+            for token in tokens:
+                self._token_fields.setdefault(token, set()).add(field)
+        self._exact_entries = len(self._cache)
+        self._max_token_fields = max(1, int(len(self.fields) * COMMON_FIELD_TOKEN_SHARE))
+
+    @staticmethod
+    def _match_occupation(career: str, occupations: List[Dict[str, Any]], occupation_tokens: List[Set[str]],
+                          occupation_alternatives: List[List[Set[str]]],
+                          occupation_postings: Dict[str, Set[int]]) -> Optional[Dict[str, Any]]:
+        tokens = set(normalize_tokens(career))
+        candidates: Set[int] = set()
+        for token in tokens:
+            candidates |= occupation_postings.get(token, set())
+        candidates_in_order = sorted(candidates)
+
+        for position in candidates_in_order:
+            if occupation_tokens[position] == tokens:
+                return occupations[position]
+
+        # 'Writer' is one of 'Writers and Authors'; of several such titles take the one with the fewest
+        # extra words, unless two tie
+        named = sorted((len(occupation_tokens[position] - tokens), position) for position in candidates_in_order
+                       if tokens in occupation_alternatives[position])
+        if named:
+            if len(named) > 1 and named[1][0] == named[0][0]:
+                return None
+            return occupations[named[0][1]]
+
+        # 'Laboratory Technician' is held by 'Dental Laboratory Technicians' and 'Medical and Clinical
+        # Laboratory Technicians': a career that several occupations qualify has no single salary
+        if sum(1 for position in candidates_in_order if tokens <= occupation_tokens[position]) > 1:
+            return None
+        scores = sorted(((_jaccard(tokens, occupation_tokens[position]), position) for position in candidates_in_order),
+                        key=lambda item: -item[0])
+        if not scores or scores[0][0] <= MIN_OCCUPATION_MATCH:
+            return None
+        if len(scores) > 1 and scores[1][0] == scores[0][0]:
+            return None
+        return occupations[scores[0][1]]
+
+    @classmethod
+    def from_csv(cls, path: str, occupations: List[Dict[str, Any]]) -> 'CareerPathIndex':
+        """
+        Load the index from Top_5_Career_Paths_by_Field_of_Study.csv.
+
+        Args:
+            path: Path to the CSV file
+            occupations: Occupation records to link careers to
+
+        Returns:
+            Loaded index
+        """
+        with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+            return cls(list(csv.DictReader(f)), occupations)
+
+    def resolve_field(self, field_of_study: str) -> Optional[str]:
+        """
+        Find the indexed field of study a name refers to.
+
+        Args:
+            field_of_study: Field name as typed or stored by the client
+
+        Returns:
+            Indexed field name, or None if no field shares a distinctive token with it
+        """
+        key = ' '.join(normalize_tokens(field_of_study))
+        if key in self._cache:
+            return self._cache[key]
+
+        tokens = set(key.split())
+        candidates: Set[str] = set()
+        for token in tokens:
+            fields = self._token_fields.get(token, set())
+            if len(fields) <= self._max_token_fields:
+                candidates |= fields
+        best, best_score = None, 0.0
+        for field in sorted(candidates):
+            score = _jaccard(tokens, self._field_tokens[field])
+            if score > best_score:
+                best, best_score = field, score
+
+        if len(self._cache) >= self._exact_entries + LOOKUP_CACHE_SIZE:
+            # Keep the exact field names, drop the cached guesses
+            self._cache = dict(list(self._cache.items())[:self._exact_entries])
+        self._cache[key] = best
+        return best
+
+    def get_careers(self, field_of_study: str) -> List[Dict[str, Any]]:
+        """
+        Get the top careers for a field of study.
+
+        Args:
+            field_of_study: Field name
+
+        Returns:
+            Career entries in option order, or an empty list if the field is unknown
+        """
+        field = self.resolve_field(field_of_study)
+        return self.fields.get(field, []) if field else []
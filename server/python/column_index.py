@@ -0,0 +1,213 @@
+"""
+Column indexes and a filter planner for searching reference tables.
+
+Numeric columns are kept as sorted value arrays, so a range filter is two
+bisects. Categorical columns are kept as hash buckets of row positions. The
+planner asks every filter how many rows it would match, which is cheap for both
+kinds of index, and starts from the most selective one. Each remaining filter
+is intersected through its index when it is smaller than the current
+candidates; otherwise it is checked row by row against the candidates. Either
+way the work grows with the result size, not the table size.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, Iterable, List, Optional, Sequence
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class SortedColumnIndex:
+    """Sorted array of one numeric column, for range lookups."""
+
+    def __init__(self, records: List[Dict[str, Any]], field: str, default: Any = None):
+        """
+        Build the index.
+
+        Rows whose value is not a number (e.g. a blank CSV cell) never match a range.
+
+        Args:
+            records: Records to index
+            field: Name of the numeric field
+            default: Value used for records that do not have the field
+        """
+        self.records = records
+        self.field = field
+        self.values: List[Any] = []
+        for record in records:
+            value = record.get(field, default)
+            self.values.append(value if _is_number(value) else None)
+
+        order = sorted((i for i, v in enumerate(self.values) if v is not None), key=self.values.__getitem__)
+        self._sorted_values = [self.values[i] for i in order]
+        self._sorted_positions = order
+
+    def _bounds(self, low: Optional[float], high: Optional[float]):
+        start = 0 if low is None else bisect_left(self._sorted_values, low)
+        end = len(self._sorted_values) if high is None else bisect_right(self._sorted_values, high)
+        return start, max(start, end)
+
+    def count(self, low: Optional[float] = None, high: Optional[float] = None) -> int:
+        """
+        Count the rows with low <= value <= high.
+
+        Args:
+            low: Inclusive lower bound, or None for no bound
+            high: Inclusive upper bound, or None for no bound
+
+        Returns:
+            Number of matching rows
+        """
+        start, end = self._bounds(low, high)
+        return end - start
+
+    def positions(self, low: Optional[float] = None, high: Optional[float] = None) -> List[int]:
+        """
+        Get the rows with low <= value <= high.
+
+        Args:
+            low: Inclusive lower bound, or None for no bound
+            high: Inclusive upper bound, or None for no bound
+
+        Returns:
+            Positions of the matching rows, in value order
+        """
+        start, end = self._bounds(low, high)
+        return self._sorted_positions[start:end]
+
+
+class HashColumnIndex:
+    """Buckets of row positions by the value of one categorical column."""
+
+    def __init__(self, records: List[Dict[str, Any]], field: str, default: Any = ''):
+        """
+        Build the index.
+
+        Args:
+            records: Records to index
+            field: Name of the categorical field
+            default: Value used for records that do not have the field
+        """
+        self.records = records
+        self.field = field
+        self.values: List[Any] = []
+        self._buckets: Dict[Any, List[int]] = {}
+        for position, record in enumerate(records):
+            value = record.get(field, default)
+            self.values.append(value)
+            try:
+                self._buckets.setdefault(value, []).append(position)
+            except TypeError:
+                # Unhashable values cannot be matched by an equality filter anyway
+                pass
+
+    def _buckets_for(self, values: Iterable[Any]) -> List[List[int]]:
+        buckets = []
+        for value in set(values):
+            bucket = self._buckets.get(value)
+            if bucket:
+                buckets.append(bucket)
+        return buckets
+
+    def count(self, values: Iterable[Any]) -> int:
+        """
+        Count the rows whose value is one of the given values.
+
+        Args:
+            values: Accepted values
+
+        Returns:
+            Number of matching rows
+        """
+        return sum(len(bucket) for bucket in self._buckets_for(values))
+
+    def positions(self, values: Iterable[Any]) -> List[int]:
+        """
+        Get the rows whose value is one of the given values.
+
+        Args:
+            values: Accepted values
+
+        Returns:
+            Positions of the matching rows, grouped by value
+        """
+        positions: List[int] = []
+        for bucket in self._buckets_for(values):
+            positions.extend(bucket)
+        return positions
+
+
+class RangeFilter:
+    """Filter matching low <= value <= high on a sorted column index."""
+
+    def __init__(self, index: SortedColumnIndex, low: Optional[float] = None, high: Optional[float] = None):
+        self.index = index
+        self.low = low
+        self.high = high
+
+    def estimate(self) -> int:
+        return self.index.count(self.low, self.high)
+
+    def positions(self) -> List[int]:
+        return self.index.positions(self.low, self.high)
+
+    def matches(self, position: int) -> bool:
+        value = self.index.values[position]
+        if value is None:
+            return False
+        return (self.low is None or value >= self.low) and (self.high is None or value <= self.high)
+
+
+class InFilter:
+    """Filter matching rows whose value is one of a set of values on a hash column index."""
+
+    def __init__(self, index: HashColumnIndex, values: Iterable[Any]):
+        self.index = index
+        self.values = set(values)
+
+    def estimate(self) -> int:
+        return self.index.count(self.values)
+
+    def positions(self) -> List[int]:
+        return self.index.positions(self.values)
+
+    def matches(self, position: int) -> bool:
+        try:
+            return self.index.values[position] in self.values
+        except TypeError:
+            return False
+
+
+def apply_filters(filters: Sequence[Any], table_size: int,
+                  candidates: Optional[Sequence[int]] = None) -> List[int]:
+    """
+    Find the rows that pass every filter, most selective filter first.
+
+    Args:
+        filters: RangeFilter / InFilter conditions, all over the same table
+        table_size: Number of rows in the table
+        candidates: Rows already selected by another step (e.g. a text search), or None for all rows
+
+    Returns:
+        Positions of the matching rows, in table order
+    """
+    if not filters:
+        return list(candidates) if candidates is not None else list(range(table_size))
+
+    plan = sorted(filters, key=lambda condition: condition.estimate())
+    if candidates is None:
+        rows = set(plan[0].positions())
+        plan = plan[1:]
+    else:
+        rows = set(candidates)
+
+    for condition in plan:
+        if not rows:
+            break
+        if condition.estimate() < len(rows):
+            rows.intersection_update(condition.positions())
+        else:
+            rows = {position for position in rows if condition.matches(position)}
+
+    return sorted(rows)
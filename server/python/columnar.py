@@ -0,0 +1,328 @@
+"""
+Compact columnar encoding for projection responses.
+
+Projection responses are dominated by long numeric series (netWorth, income,
+expenses, the expense categories, tax and loan series). This module packs every
+numeric series as a typed little-endian column behind a small JSON schema
+header; everything else in the response (milestones, path metadata, ...) is
+carried in the header as ordinary JSON. Integer columns can optionally be
+zigzag/varint encoded, with or without delta encoding.
+
+Layout:
+    4 bytes   magic b'LPCB'
+    1 byte    format version
+    1 byte    reserved (0)
+    4 bytes   header length, unsigned little-endian
+    N bytes   UTF-8 JSON header: {"c": [...columns], "x": {...extra}}
+    ...       column payloads, concatenated in header order
+
+Each column descriptor is [path, code, count, size]. The path is the key of a
+top-level series, or a list of keys for nested series such as path comparisons
+(paths -> yearlyBreakdown -> netWorth), so those round-trip as well. The code
+is the value type ('i' int32, 'q' int64, 'd' float64) followed by the encoding
+('r' raw, 'v' varint, 'd' delta-varint), e.g. 'ir' or 'qd'.
+
+Clients opt in by sending  Accept: application/vnd.launchplan.columnar
+optionally with an encoding parameter, e.g.
+    Accept: application/vnd.launchplan.columnar; encoding=delta-varint
+"""
+
+import json
+import struct
+import sys
+from array import array
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+MEDIA_TYPE = 'application/vnd.launchplan.columnar'
+MAGIC = b'LPCB'
+FORMAT_VERSION = 1
+ENCODINGS = ('raw', 'varint', 'delta-varint')
+
+_PREAMBLE = struct.Struct('<4sBBI')
+_ARRAY_TYPECODES = {'i32': 'i', 'i64': 'q', 'f64': 'd'}
+_TYPES_BY_TYPECODE = {typecode: column_type for column_type, typecode in _ARRAY_TYPECODES.items()}
+_ENCODING_CODES = {'raw': 'r', 'varint': 'v', 'delta-varint': 'd'}
+_ENCODINGS_BY_CODE = {code: encoding for encoding, code in _ENCODING_CODES.items()}
+_NUMPY_DTYPES = {'i32': '<i4', 'i64': '<i8', 'f64': '<f8'}
+_INT32_MIN = -(2 ** 31)
+_INT32_MAX = 2 ** 31 - 1
+_BIG_ENDIAN_HOST = sys.byteorder == 'big'
+
+
+def negotiate(accept_header: Optional[str]) -> Optional[str]:
+    """
+    Decide whether the client asked for the columnar format.
+
+    Args:
+        accept_header: Value of the request's Accept header
+
+    Returns:
+        The column encoding to use ('raw', 'varint' or 'delta-varint'),
+        or None if the client did not ask for the columnar format
+    """
+    if not accept_header:
+        return None
+    for media_range in accept_header.split(','):
+        parts = [part.strip() for part in media_range.split(';')]
+        if parts[0].lower() != MEDIA_TYPE:
+            continue
+        encoding = 'raw'
+        for param in parts[1:]:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'encoding':
+                encoding = value.strip().strip('"').lower()
+            elif key.strip().lower() == 'q' and value.strip() in ('0', '0.0'):
+                encoding = None
+                break
+        if encoding is None:
+            continue
+        if encoding not in ENCODINGS:
+            encoding = 'raw'
+        return encoding
+    return None
+
+
+def _column_type(values: Any) -> Optional[str]:
+    """
+    Determine the column type for a value, or None if it is not a numeric series.
+
+    Args:
+        values: Candidate series
+
+    Returns:
+        'i32', 'i64', 'f64' or None
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        if values.ndim != 1 or values.dtype.kind not in 'iuf':
+            return None
+        if values.dtype.kind == 'f':
+            return 'f64'
+        if values.size and (values.min() < _INT32_MIN or values.max() > _INT32_MAX):
+            return 'i64'
+        return 'i32'
+
+    if not isinstance(values, list) or not values:
+        return None
+
+    is_float = False
+    low = high = 0
+    for value in values:
+        value_type = type(value)
+        if value_type is int:
+            if value < low:
+                low = value
+            elif value > high:
+                high = value
+        elif value_type is float:
+            is_float = True
+        elif np is not None and isinstance(value, np.number) and not isinstance(value, np.bool_):
+            if isinstance(value, np.floating):
+                is_float = True
+            else:
+                low, high = min(low, int(value)), max(high, int(value))
+        else:
+            # Booleans, strings, dicts and None are not columnar
+            return None
+    if is_float:
+        return 'f64'
+    if low < _INT32_MIN or high > _INT32_MAX:
+        return 'i64'
+    return 'i32'
+
+
+def _zigzag_varint(values: List[int], delta: bool) -> bytes:
+    """
+    Encode integers as zigzag LEB128 varints, optionally as deltas.
+
+    Args:
+        values: Integers to encode
+        delta: Encode each value as the difference from the previous one
+
+    Returns:
+        Encoded bytes
+    """
+    out = bytearray()
+    previous = 0
+    for value in values:
+        value = int(value)
+        if delta:
+            value, previous = value - previous, value
+        zigzag = (value << 1) if value >= 0 else ((-value << 1) - 1)
+        while zigzag > 0x7F:
+            out.append((zigzag & 0x7F) | 0x80)
+            zigzag >>= 7
+        out.append(zigzag)
+    return bytes(out)
+
+
+def _decode_zigzag_varint(data: bytes, count: int, delta: bool) -> List[int]:
+    """
+    Decode integers written by _zigzag_varint.
+
+    Args:
+        data: Encoded bytes
+        count: Number of values to decode
+        delta: Values were delta encoded
+
+    Returns:
+        Decoded integers
+    """
+    values = []
+    position = 0
+    previous = 0
+    for _ in range(count):
+        shift = 0
+        zigzag = 0
+        while True:
+            byte = data[position]
+            position += 1
+            zigzag |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        value = (zigzag >> 1) if not zigzag & 1 else -((zigzag + 1) >> 1)
+        if delta:
+            value += previous
+            previous = value
+        values.append(value)
+    return values
+
+
+def _pack_column(values: Any, column_type: str, encoding: str) -> bytes:
+    """
+    Pack one series into its column payload.
+
+    Args:
+        values: Series values (list or NumPy array)
+        column_type: 'i32', 'i64' or 'f64'
+        encoding: Requested integer encoding
+
+    Returns:
+        Column bytes
+    """
+    if column_type != 'f64' and encoding != 'raw':
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()
+        return _zigzag_varint(values, delta=(encoding == 'delta-varint'))
+
+    if np is not None and isinstance(values, np.ndarray):
+        return values.astype(_NUMPY_DTYPES[column_type], copy=False).tobytes()
+
+    if column_type == 'f64':
+        packed = array('d', [float(value) for value in values])
+    else:
+        packed = array(_ARRAY_TYPECODES[column_type], [int(value) for value in values])
+    if _BIG_ENDIAN_HOST:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _split_series(document: Any, path: List[Any],
+                  columns: List[Tuple[List[Any], Any, str]]) -> Any:
+    """
+    Walk a document, moving numeric series into columns.
+
+    Args:
+        document: Value being encoded
+        path: Keys leading to this value
+        columns: Accumulator of (path, values, column_type)
+
+    Returns:
+        The document with numeric series removed
+    """
+    if isinstance(document, dict):
+        remaining = {}
+        for key, value in document.items():
+            column_type = _column_type(value)
+            if column_type is not None:
+                columns.append((path + [key], value, column_type))
+            else:
+                remaining[key] = _split_series(value, path + [key], columns)
+        return remaining
+    return document
+
+
+def encode(document: Dict[str, Any], encoding: str = 'raw') -> bytes:
+    """
+    Encode a projection response in the columnar format.
+
+    Args:
+        document: Response dictionary
+        encoding: Integer column encoding ('raw', 'varint' or 'delta-varint')
+
+    Returns:
+        Encoded response body
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown column encoding '{encoding}', expected one of {ENCODINGS}")
+
+    found: List[Tuple[List[Any], Any, str]] = []
+    extra = _split_series(document, [], found)
+
+    descriptors = []
+    payloads = []
+    for path, values, column_type in found:
+        column_encoding = encoding if column_type != 'f64' else 'raw'
+        payload = _pack_column(values, column_type, column_encoding)
+        descriptors.append([
+            path[0] if len(path) == 1 else path,
+            _ARRAY_TYPECODES[column_type] + _ENCODING_CODES[column_encoding],
+            len(values),
+            len(payload)
+        ])
+        payloads.append(payload)
+
+    header = json.dumps({'c': descriptors, 'x': extra},
+                        separators=(',', ':'), default=str).encode('utf-8')
+    return b''.join([_PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, len(header)), header] + payloads)
+
+
+def decode(data: bytes) -> Dict[str, Any]:
+    """
+    Decode a columnar response back into a dictionary of lists.
+
+    Args:
+        data: Encoded response body
+
+    Returns:
+        The response dictionary
+    """
+    magic, version, _, header_length = _PREAMBLE.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a columnar projection response")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar format version {version}")
+
+    offset = _PREAMBLE.size
+    header = json.loads(data[offset:offset + header_length].decode('utf-8'))
+    offset += header_length
+
+    document = header.get('x', {})
+    for path, code, count, size in header['c']:
+        payload = data[offset:offset + size]
+        offset += size
+        encoding = _ENCODINGS_BY_CODE[code[1]]
+
+        if encoding == 'raw':
+            values = array(_ARRAY_TYPECODES[_TYPES_BY_TYPECODE[code[0]]])
+            values.frombytes(payload)
+            if _BIG_ENDIAN_HOST:
+                values.byteswap()
+            values = values.tolist()
+        else:
+            values = _decode_zigzag_varint(payload, count, delta=(encoding == 'delta-varint'))
+
+        if not isinstance(path, list):
+            path = [path]
+        target = document
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        target[path[-1]] = values
+
+    return document
@@ -9,6 +9,8 @@ MARRIAGE_EXPENSE_INCREASE = 0.20  # 20% increase in expenses after marriage
 HOME_PURCHASE_RENT_REDUCTION = 0.75  # 75% reduction in rent after home purchase
 MORTGAGE_TERM_YEARS = 30  # Standard mortgage term
 MORTGAGE_INTEREST_RATE = 0.065  # 6.5% mortgage interest rate
+DEFAULT_HOME_VALUE = 300000  # Home price when neither the milestone nor local data gives one
+HOME_DOWN_PAYMENT_PERCENT = 0.20  # Down payment on a home priced from local data
 
 # Child assumptions
 CHILD_ANNUAL_EXPENSE = 17000  # $17,000 per year per child
@@ -0,0 +1,176 @@
+"""
+Column schemas and typed CSV reading for the files DataLoader loads from its data directory.
+
+Each file declares the type of its columns, and each column is parsed with one
+converter chosen when the header is read, instead of testing every cell against
+every number format. Blank numeric cells become None, amounts may carry
+thousands separators ("1,234"), and identifier-like columns such as zip codes
+stay strings. Columns a schema does not declare fall back to infer_value.
+"""
+
+import csv
+import re
+from typing import Dict, Any, Callable, List, Optional, Union
+
+Converter = Callable[[str], Any]
+
+_NUMBER = re.compile(r'^-?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?$')
+
+
+def parse_int(text: str) -> Optional[Union[int, float]]:
+    """
+    Parse an integer column cell.
+
+    Args:
+        text: Cell text such as '4920', '-12' or '1,234'
+
+    Returns:
+        The integer (a float if the cell has a fractional part), or None if blank or not a number
+    """
+    text = text.strip().replace(',', '')
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        value = parse_float(text)
+        return int(value) if value is not None and value.is_integer() else value
+
+
+def parse_float(text: str) -> Optional[float]:
+    """
+    Parse a decimal column cell.
+
+    Args:
+        text: Cell text such as '83.26', '-0.5' or '$1,234.50'
+
+    Returns:
+        The number, or None if blank or not a number
+    """
+    text = text.strip().replace(',', '').replace('$', '')
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def parse_str(text: str) -> str:
+    """Keep a text column cell as it is."""
+    return text
+
+
+def infer_value(text: str) -> Any:
+    """
+    Parse a cell of an undeclared column.
+
+    Args:
+        text: Cell text
+
+    Returns:
+        An int or float if the cell is a plain number, otherwise the text unchanged.
+        Numbers with leading zeros ('02138') are identifiers and stay strings.
+    """
+    if not _NUMBER.match(text):
+        return text
+    digits = text.lstrip('-')
+    if len(digits) > 1 and digits[0] == '0' and digits[1] != '.':
+        return text
+    text = text.replace(',', '')
+    return float(text) if '.' in text else int(text)
+
+
+COLLEGE_SCHEMA: Dict[str, Converter] = {
+    'id': parse_int,
+    'name': parse_str,
+    'location': parse_str,
+    'state': parse_str,
+    'type': parse_str,
+    'tuition': parse_int,
+    'roomAndBoard': parse_int,
+    'acceptanceRate': parse_float,
+    'rating': parse_float,
+    'size': parse_str,
+    'rank': parse_int,
+    'feesByIncome': parse_str
+}
+
+OCCUPATION_SCHEMA: Dict[str, Converter] = {
+    'id': parse_int,
+    'title': parse_str,
+    'description': parse_str,
+    'salary': parse_int,
+    'growthRate': parse_str,
+    'education': parse_str,
+    'category': parse_str
+}
+
+COLI_SCHEMA: Dict[str, Converter] = {
+    'zipCode': parse_str,
+    'city': parse_str,
+    'state': parse_str,
+    'overall': parse_float,
+    'housing': parse_float,
+    'groceries': parse_float,
+    'transportation': parse_float,
+    'utilities': parse_float,
+    'healthcare': parse_float
+}
+
+IRS_SCHEMA: Dict[str, Converter] = {
+    'zipCode': parse_str,
+    'avgIncome': parse_float,
+    'medianIncome': parse_float,
+    'avgHomeValue': parse_float,
+    'avgInvestments': parse_float
+}
+
+CAREER_PATH_SCHEMA: Dict[str, Converter] = {
+    'fieldOfStudy': parse_str,
+    'title': parse_str,
+    'years': parse_int,
+    'salary': parse_int
+}
+
+# Data directory file name -> column schema
+CSV_SCHEMAS: Dict[str, Dict[str, Converter]] = {
+    'college_data.csv': COLLEGE_SCHEMA,
+    'occupation_data.csv': OCCUPATION_SCHEMA,
+    'coli_data.csv': COLI_SCHEMA,
+    'irs_data.csv': IRS_SCHEMA,
+    'career_paths.csv': CAREER_PATH_SCHEMA
+}
+
+
+def read_typed_csv(path: str, schema: Dict[str, Converter]) -> List[Dict[str, Any]]:
+    """
+    Read a CSV file into records with typed values.
+
+    Args:
+        path: Path to the CSV file
+        schema: Converter for each declared column
+
+    Returns:
+        One dictionary per non-empty row, keyed by the header
+    """
+    with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return []
+        width = len(header)
+        # Text columns are taken as read; only the other columns run a converter
+        converters = [(name, convert) for name, convert in
+                      ((name, schema.get(name, infer_value)) for name in header) if convert is not parse_str]
+        records = []
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            record = dict(zip(header, row))
+            for name, convert in converters:
+                record[name] = convert(record[name])
+            records.append(record)
+        return records
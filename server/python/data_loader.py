@@ -3,11 +3,55 @@ Data loader module for the financial calculator.
 Provides functionality to load data from CSV files and other sources.
 """
 
-import csv
+import contextvars
 import os
 import json
-from typing import Dict, List, Any, Optional
-import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Any, Callable, Iterator, Optional, Sequence, Tuple, Union
+
+try:
+    from text_index import TrigramIndex
+    from column_index import SortedColumnIndex, HashColumnIndex, RangeFilter, InFilter, apply_filters
+    from pagination import sort_key, top_k_page, encode_cursor, decode_cursor
+    from fee_matrix import FeeMatrix
+    from location_costs import LocationCostTable
+    from zip_income import ZipIncomeTable
+    from career_paths import CareerPathIndex
+    from csv_schema import CSV_SCHEMAS, read_typed_csv
+    from snapshot import SNAPSHOT_FILE, Snapshot, read_snapshot
+except ImportError:
+    from server.python.text_index import TrigramIndex
+    from server.python.column_index import SortedColumnIndex, HashColumnIndex, RangeFilter, InFilter, apply_filters
+    from server.python.pagination import sort_key, top_k_page, encode_cursor, decode_cursor
+    from server.python.fee_matrix import FeeMatrix
+    from server.python.location_costs import LocationCostTable
+    from server.python.zip_income import ZipIncomeTable
+    from server.python.career_paths import CareerPathIndex
+    from server.python.csv_schema import CSV_SCHEMAS, read_typed_csv
+    from server.python.snapshot import SNAPSHOT_FILE, Snapshot, read_snapshot
+
+# Fields matched by the search_colleges and search_occupations queries
+COLLEGE_SEARCH_FIELDS = ('name', 'location')
+OCCUPATION_SEARCH_FIELDS = ('title', 'description')
+# Categorical search filters and the field each one matches
+COLLEGE_CATEGORY_FILTERS = {'types': 'type', 'states': 'state', 'sizes': 'size'}
+OCCUPATION_CATEGORY_FILTERS = {'categories': 'category', 'education': 'education', 'growthRate': 'growthRate'}
+# College sort keys for paginated search, and whether each sorts largest first by default
+COLLEGE_SORT_KEYS = {
+    'rank': False,
+    'tuition': False,
+    'netPrice': False,
+    'acceptanceRate': False,
+    'rating': True
+}
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+# Reference datasets read from the assets directory
+LOCATION_COSTS_FILE = 'COLI by Location.csv'
+ZIP_INCOME_FILE = 'Zip_Code_Income.csv'
+CAREER_PATHS_FILE = 'Top_5_Career_Paths_by_Field_of_Study.csv'
+ASSET_FILES = (LOCATION_COSTS_FILE, ZIP_INCOME_FILE, CAREER_PATHS_FILE)
 
 
 class DataLoader:
@@ -15,12 +59,13 @@ class DataLoader:
     Loads and manages data from various sources for the financial calculator.
     """
     
-    def __init__(self, data_dir: Optional[str] = None):
+    def __init__(self, data_dir: Optional[str] = None, assets_dir: Optional[str] = None):
         """
         Initialize the data loader.
         
         Args:
             data_dir: Directory containing data files (defaults to server/data)
+            assets_dir: Directory containing the full reference datasets (defaults to attached_assets)
         """
         # Set default data directory if not provided
         if data_dir is None:
@@ -32,12 +77,35 @@ class DataLoader:
         else:
             self.data_dir = data_dir
         
+        if assets_dir is None:
+            repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            assets_dir = os.path.join(repo_root, 'attached_assets')
+        self.assets_dir = assets_dir
+        
         # Cache for loaded data
         self._college_data: List[Dict[str, Any]] = []
         self._occupation_data: List[Dict[str, Any]] = []
         self._coli_data: Dict[str, Dict[str, Any]] = {}
         self._irs_data: Dict[str, Dict[str, Any]] = {}
         self._career_path_data: Dict[str, List[Dict[str, Any]]] = {}
+        # Names of the tables that have been loaded from disk (sample data is only a fallback)
+        self._loaded_tables: set = set()
+        # Substring search indexes, keyed by table name
+        self._search_indexes: Dict[str, TrigramIndex] = {}
+        # Filter indexes, keyed by (table name, field)
+        self._column_indexes: Dict[Tuple[str, str], Union[SortedColumnIndex, HashColumnIndex]] = {}
+        # Parsed feesByIncome of the college table
+        self._fee_matrix: Optional[FeeMatrix] = None
+        # Zip-code cost of living table (loaded from COLI by Location.csv on first use)
+        self._location_costs: Optional[LocationCostTable] = None
+        # Zip-code income and home value table (loaded from Zip_Code_Income.csv on first use)
+        self._zip_income: Optional[ZipIncomeTable] = None
+        # Top careers by field of study (loaded from Top_5_Career_Paths_by_Field_of_Study.csv on first use)
+        self._career_path_index: Optional[CareerPathIndex] = None
+        # Typed tables from the data directory's binary snapshot, if it has one
+        self._snapshot: Optional[Snapshot] = None
+        # str(id) -> row position, keyed by the table's file name, with the records it indexes
+        self._id_indexes: Dict[str, Tuple[List[Dict[str, Any]], Dict[str, int]]] = {}
         
         # In-memory cache for sample data (used when CSV files are not available)
         self._load_sample_data()
@@ -243,37 +311,176 @@ class DataLoader:
         Load data from a CSV file.
         
         Args:
-            filename: Name of CSV file to load
+            filename: Name of CSV file to load (columns are typed by its schema in csv_schema.CSV_SCHEMAS)
             
         Returns:
-            List of dictionaries containing the CSV data
+            List of dictionaries containing the CSV data (or the table from the data snapshot)
         """
         file_path = os.path.join(self.data_dir, filename)
         
+        # A snapshot of the table is used unless the CSV file was written after it
+        snapshot = self._get_snapshot()
+        if snapshot is not None and filename in snapshot.tables:
+            if not os.path.exists(file_path) or os.path.getmtime(file_path) <= snapshot.mtime:
+                return snapshot.tables[filename]
+        
         # Check if file exists
         if not os.path.exists(file_path):
             print(f"Warning: File {file_path} not found. Using sample data instead.")
             return []
         
         try:
-            with open(file_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                result = []
-                for row in reader:
-                    # Convert numeric strings to numbers
-                    for key, value in row.items():
-                        if isinstance(value, str):
-                            # Try to convert to number if appropriate
-                            if value.isdigit():
-                                row[key] = int(value)
-                            elif re.match(r'^-?\d+\.\d+$', value):
-                                row[key] = float(value)
-                    result.append(row)
-                return result
+            return read_typed_csv(file_path, CSV_SCHEMAS.get(filename, {}))
         except Exception as e:
             print(f"Error loading {filename}: {str(e)}")
             return []
     
+    def _get_snapshot(self) -> Optional[Snapshot]:
+        """
+        Get the data directory's binary snapshot, reading it on first use.
+        
+        Returns:
+            Snapshot, or None if there is none or it cannot be read
+        """
+        if 'snapshot' not in self._loaded_tables:
+            self._loaded_tables.add('snapshot')
+            file_path = os.path.join(self.data_dir, SNAPSHOT_FILE)
+            if os.path.exists(file_path):
+                try:
+                    self._snapshot = read_snapshot(file_path)
+                except (OSError, ValueError) as e:
+                    print(f"Error loading {SNAPSHOT_FILE}: {str(e)}")
+        return self._snapshot
+    
+    def _id_index(self, filename: str, records: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Get the id index of a table, building it if the table changed.
+        
+        Args:
+            filename: The table's CSV file name
+            records: Current records of the table
+            
+        Returns:
+            str(id) -> position of the first record with that id
+        """
+        indexed = self._id_indexes.get(filename)
+        if indexed is not None and indexed[0] is records:
+            return indexed[1]
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.tables.get(filename) is records:
+            positions = snapshot.id_indexes[filename]
+        else:
+            positions = {}
+            for position, record in enumerate(records):
+                positions.setdefault(str(record.get('id', '')), position)
+        self._id_indexes[filename] = (records, positions)
+        return positions
+    
+    def _build_fee_matrix(self, colleges: List[Dict[str, Any]]) -> FeeMatrix:
+        """Build the fee matrix of a college table, from the snapshot's parsed prices when it came from there."""
+        snapshot = self._snapshot
+        if (snapshot is not None and snapshot.tables.get('college_data.csv') is colleges
+                and 'college_data.csv' in snapshot.fee_matrices):
+            brackets, prices = snapshot.fee_matrices['college_data.csv']
+            return FeeMatrix.from_prices(colleges, brackets, prices)
+        return FeeMatrix(colleges)
+    
+    def _search_index(self, table: str, records: List[Dict[str, Any]],
+                      fields: Sequence[str]) -> TrigramIndex:
+        """
+        Get the substring search index for a table, building it if the table changed.
+        
+        Args:
+            table: Table name
+            records: Current records of the table
+            fields: Fields to search
+            
+        Returns:
+            Trigram index over the records
+        """
+        index = self._search_indexes.get(table)
+        if index is None or index.records is not records:
+            index = TrigramIndex(records, fields)
+            self._search_indexes[table] = index
+        return index
+    
+    def _sorted_index(self, table: str, records: List[Dict[str, Any]], field: str,
+                      default: Any = 0) -> SortedColumnIndex:
+        """
+        Get the sorted index of a numeric column, building it if the table changed.
+        
+        Args:
+            table: Table name
+            records: Current records of the table
+            field: Numeric field
+            default: Value for records without the field
+            
+        Returns:
+            Sorted column index
+        """
+        index = self._column_indexes.get((table, field))
+        if index is None or index.records is not records:
+            index = SortedColumnIndex(records, field, default)
+            self._column_indexes[(table, field)] = index
+        return index
+    
+    def _hash_index(self, table: str, records: List[Dict[str, Any]], field: str) -> HashColumnIndex:
+        """
+        Get the hash index of a categorical column, building it if the table changed.
+        
+        Args:
+            table: Table name
+            records: Current records of the table
+            field: Categorical field
+            
+        Returns:
+            Hash column index
+        """
+        index = self._column_indexes.get((table, field))
+        if index is None or index.records is not records:
+            index = HashColumnIndex(records, field)
+            self._column_indexes[(table, field)] = index
+        return index
+    
+    def preload(self) -> 'DataLoader':
+        """
+        Load every reference table up front instead of on first use.
+        
+        Long-running servers call this once at startup so that requests never
+        pay the CSV parsing cost, and so that forked workers inherit the tables.
+        
+        Returns:
+            Self for method chaining
+        """
+        self.get_college_data()
+        self.get_fee_matrix()
+        self.get_occupation_data()
+        self.get_coli_data('')
+        self.get_location_cost_table()
+        self.get_irs_data('')
+        self.get_career_path_data('')
+        return self
+    
+    def source_signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        """
+        Describe the current state of the files this loader reads.
+        
+        Returns:
+            (path, modification time in ns, size) for every data and asset file
+            (-1, -1 for files that do not exist), so two signatures differ when
+            any of the files was added, removed or rewritten
+        """
+        paths = [os.path.join(self.data_dir, filename) for filename in list(CSV_SCHEMAS) + [SNAPSHOT_FILE]]
+        paths += [os.path.join(self.assets_dir, filename) for filename in ASSET_FILES]
+        signature = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((path, -1, -1))
+        return tuple(signature)
+    
     def get_college_data(self) -> List[Dict[str, Any]]:
         """
         Get college institutional data.
@@ -281,11 +488,19 @@ class DataLoader:
         Returns:
             List of college data
         """
-        if not self._college_data:
+        if 'college' not in self._loaded_tables:
             # Try to load from CSV file
             data = self._load_csv_file('college_data.csv')
             if data:
                 self._college_data = data
+            self._loaded_tables.add('college')
+            self._search_index('college', self._college_data, COLLEGE_SEARCH_FIELDS)
+            for field in ('tuition', 'acceptanceRate', 'rank', 'rating'):
+                self._sorted_index('college', self._college_data, field)
+            for field in COLLEGE_CATEGORY_FILTERS.values():
+                self._hash_index('college', self._college_data, field)
+            self._fee_matrix = self._build_fee_matrix(self._college_data)
+            self._id_index('college_data.csv', self._college_data)
         
         return self._college_data
     
@@ -300,13 +515,34 @@ class DataLoader:
             College data or None if not found
         """
         colleges = self.get_college_data()
+        position = self._id_index('college_data.csv', colleges).get(str(college_id))
+        return colleges[position] if position is not None else None
+    
+    def get_fee_matrix(self) -> FeeMatrix:
+        """
+        Get the colleges-by-income-bracket net price matrix.
         
-        # Find college with matching ID
-        for college in colleges:
-            if str(college.get('id', '')) == str(college_id):
-                return college
+        Returns:
+            Fee matrix whose rows follow get_college_data()
+        """
+        colleges = self.get_college_data()
+        if self._fee_matrix is None or self._fee_matrix.records is not colleges:
+            self._fee_matrix = self._build_fee_matrix(colleges)
+        return self._fee_matrix
+    
+    def net_price(self, college_ids: List[Any], household_income: float) -> Any:
+        """
+        Get the net price of several colleges for one household income.
         
-        return None
+        Args:
+            college_ids: College ids
+            household_income: Annual household income
+            
+        Returns:
+            Net price per id (NaN for unknown colleges or brackets without data),
+            as a numpy array when numpy is available
+        """
+        return self.get_fee_matrix().net_price(college_ids, household_income)
     
     def get_occupation_data(self) -> List[Dict[str, Any]]:
         """
@@ -315,11 +551,17 @@ class DataLoader:
         Returns:
             List of occupation data
         """
-        if not self._occupation_data:
+        if 'occupation' not in self._loaded_tables:
             # Try to load from CSV file
             data = self._load_csv_file('occupation_data.csv')
             if data:
                 self._occupation_data = data
+            self._loaded_tables.add('occupation')
+            self._search_index('occupation', self._occupation_data, OCCUPATION_SEARCH_FIELDS)
+            self._sorted_index('occupation', self._occupation_data, 'salary')
+            for field in OCCUPATION_CATEGORY_FILTERS.values():
+                self._hash_index('occupation', self._occupation_data, field)
+            self._id_index('occupation_data.csv', self._occupation_data)
         
         return self._occupation_data
     
@@ -334,13 +576,8 @@ class DataLoader:
             Occupation data or None if not found
         """
         occupations = self.get_occupation_data()
-        
-        # Find occupation with matching ID
-        for occupation in occupations:
-            if str(occupation.get('id', '')) == str(occupation_id):
-                return occupation
-        
-        return None
+        position = self._id_index('occupation_data.csv', occupations).get(str(occupation_id))
+        return occupations[position] if position is not None else None
     
     def get_coli_data(self, zip_code: str) -> Optional[Dict[str, Any]]:
         """
@@ -352,43 +589,154 @@ class DataLoader:
         Returns:
             COLI data or None if not found
         """
-        if not self._coli_data:
+        if 'coli' not in self._loaded_tables:
             # Try to load from CSV file
             data = self._load_csv_file('coli_data.csv')
             if data:
                 self._coli_data = {item['zipCode']: item for item in data}
+            self._loaded_tables.add('coli')
         
         return self._coli_data.get(zip_code)
     
-    def get_irs_data(self, zip_code: str) -> Optional[Dict[str, Any]]:
+    def _load_asset_table(self, filename: str, table_class: Any, *args: Any) -> Any:
+        """
+        Load one of the full reference datasets from the assets directory.
+        
+        Args:
+            filename: CSV file name in the assets directory
+            table_class: Table class with a from_csv(path, *args) constructor
+            *args: Extra arguments for from_csv
+            
+        Returns:
+            Loaded table, or None if the file is missing or cannot be read
+        """
+        file_path = os.path.join(self.assets_dir, filename)
+        if not os.path.exists(file_path):
+            print(f"Warning: File {file_path} not found. Using sample data instead.")
+            return None
+        try:
+            return table_class.from_csv(file_path, *args)
+        except Exception as e:
+            print(f"Error loading {filename}: {str(e)}")
+            return None
+    
+    def get_location_cost_table(self) -> Optional[LocationCostTable]:
+        """
+        Get the zip-code cost of living table.
+        
+        Returns:
+            Table loaded from COLI by Location.csv, or None if the file is not available
+        """
+        if 'location_costs' not in self._loaded_tables:
+            self._location_costs = self._load_asset_table(LOCATION_COSTS_FILE, LocationCostTable)
+            self._loaded_tables.add('location_costs')
+        
+        return self._location_costs
+    
+    def get_location_costs(self, zip_code: str, state: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the monthly cost of living for a zip code.
+        
+        Args:
+            zip_code: ZIP code
+            state: State whose average is used if the zip code is not in the table
+            
+        Returns:
+            Monthly costs by category plus the income adjustment factor, or None if
+            neither the zip code nor the state is known
+        """
+        table = self.get_location_cost_table()
+        if table is None:
+            return None
+        return table.lookup(zip_code, state)
+    
+    def get_zip_income_table(self) -> Optional[ZipIncomeTable]:
+        """
+        Get the zip-code income, investment and home value table.
+        
+        Returns:
+            Table loaded from Zip_Code_Income.csv, or None if the file is not available
+        """
+        if 'zip_income' not in self._loaded_tables:
+            self._zip_income = self._load_asset_table(ZIP_INCOME_FILE, ZipIncomeTable)
+            self._loaded_tables.add('zip_income')
+        
+        return self._zip_income
+    
+    def get_irs_data(self, zip_code: str, state: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get IRS income and property data for a specific zip code.
         
         Args:
             zip_code: ZIP code
+            state: State whose values are used if the zip code is not in the table
             
         Returns:
             IRS data or None if not found
         """
-        if not self._irs_data:
+        table = self.get_zip_income_table()
+        if table is not None:
+            return table.lookup(zip_code, state)
+        
+        if 'irs' not in self._loaded_tables:
             # Try to load from CSV file
             data = self._load_csv_file('irs_data.csv')
             if data:
                 self._irs_data = {item['zipCode']: item for item in data}
+            self._loaded_tables.add('irs')
         
         return self._irs_data.get(zip_code)
     
+    def get_home_value(self, zip_code: Optional[str], state: Optional[str] = None) -> Optional[float]:
+        """
+        Get the typical home value for a location.
+        
+        Args:
+            zip_code: ZIP code
+            state: State to fall back to if the zip code is unknown
+            
+        Returns:
+            Average home value, or None if the location has no home value data
+        """
+        data = self.get_irs_data(zip_code, state) if zip_code or state else None
+        if not data:
+            return None
+        return data.get('avgHomeValue')
+    
+    def get_career_path_index(self) -> Optional[CareerPathIndex]:
+        """
+        Get the top careers by field of study, linked to the occupation table.
+        
+        Returns:
+            Career path index, or None if the dataset is not available
+        """
+        if 'career_path_index' not in self._loaded_tables:
+            self._career_path_index = self._load_asset_table(
+                CAREER_PATHS_FILE, CareerPathIndex, self.get_occupation_data())
+            self._loaded_tables.add('career_path_index')
+        
+        return self._career_path_index
+    
     def get_career_path_data(self, field_of_study: str) -> List[Dict[str, Any]]:
         """
         Get career path data for a specific field of study.
         
+        The top careers by field of study are used when that dataset is
+        available and the field matches one of its fields.
+        
         Args:
             field_of_study: Field of study
             
         Returns:
             List of career path stages or empty list if not found
         """
-        if not self._career_path_data:
+        index = self.get_career_path_index()
+        if index is not None:
+            careers = index.get_careers(field_of_study)
+            if careers:
+                return careers
+        
+        if 'career_path' not in self._loaded_tables:
             # Try to load from CSV file
             data = self._load_csv_file('career_paths.csv')
             if data:
@@ -400,9 +748,43 @@ class DataLoader:
                         result[field] = []
                     result[field].append(item)
                 self._career_path_data = result
+            self._loaded_tables.add('career_path')
         
         return self._career_path_data.get(field_of_study, [])
     
+    def _college_positions(self, colleges: List[Dict[str, Any]], query: str,
+                           filters: Optional[Dict[str, Any]]) -> List[int]:
+        """
+        Find the colleges matching a search query and filters.
+        
+        Args:
+            colleges: College table
+            query: Search query string
+            filters: Additional filters
+            
+        Returns:
+            Positions of the matching colleges, in table order
+        """
+        # Filter by search query
+        candidates = None
+        if query:
+            candidates = self._search_index('college', colleges, COLLEGE_SEARCH_FIELDS).search(query)
+        
+        # Apply additional filters
+        conditions = []
+        for key, value in (filters or {}).items():
+            if key == 'maxTuition' and value is not None:
+                conditions.append(RangeFilter(self._sorted_index('college', colleges, 'tuition'), high=value))
+            elif key == 'acceptanceRange' and value is not None:
+                min_rate, max_rate = value
+                conditions.append(RangeFilter(self._sorted_index('college', colleges, 'acceptanceRate'),
+                                              low=min_rate, high=max_rate))
+            elif key in COLLEGE_CATEGORY_FILTERS and value:
+                values = [value] if isinstance(value, str) else value
+                conditions.append(InFilter(self._hash_index('college', colleges, COLLEGE_CATEGORY_FILTERS[key]), values))
+        
+        return apply_filters(conditions, len(colleges), candidates)
+    
     def search_colleges(self, query: str, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
         Search for colleges by name or other criteria.
@@ -415,37 +797,62 @@ class DataLoader:
             List of matching colleges
         """
         colleges = self.get_college_data()
+        return [colleges[position] for position in self._college_positions(colleges, query, filters)]
+    
+    def search_colleges_page(self, query: str, filters: Dict[str, Any] = None, sort: str = 'rank',
+                             descending: Optional[bool] = None, limit: int = DEFAULT_PAGE_SIZE,
+                             cursor: Optional[str] = None,
+                             household_income: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Search for colleges and return one sorted page of the results.
         
-        # Filter by search query
-        if query:
-            query = query.lower()
-            results = [
-                college for college in colleges
-                if query in college.get('name', '').lower() or
-                   query in college.get('location', '').lower()
-            ]
+        Only the rows on the page are selected and returned; pass the returned
+        'nextCursor' back as cursor (with the same sort options) for the next page.
+        
+        Args:
+            query: Search query string
+            filters: Additional filters (same as search_colleges)
+            sort: Sort key, one of COLLEGE_SORT_KEYS
+            descending: Sort largest first (defaults to the sort key's natural direction)
+            limit: Page size, up to MAX_PAGE_SIZE
+            cursor: Cursor from the previous page, or None for the first page
+            household_income: Household income for the 'netPrice' sort key
+            
+        Returns:
+            Dictionary with the page 'results', the 'total' number of matches and
+            the 'nextCursor' (None on the last page)
+            
+        Raises:
+            ValueError: If the sort options or the cursor are invalid
+        """
+        if sort not in COLLEGE_SORT_KEYS:
+            raise ValueError(f"Unknown sort key '{sort}'. Valid keys: {', '.join(COLLEGE_SORT_KEYS)}")
+        if sort == 'netPrice' and household_income is None:
+            raise ValueError("Sorting by netPrice requires a household income")
+        if descending is None:
+            descending = COLLEGE_SORT_KEYS[sort]
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        
+        params = {'sort': sort, 'descending': descending}
+        if sort == 'netPrice':
+            params['householdIncome'] = household_income
+        after = decode_cursor(cursor, params) if cursor else None
+        
+        colleges = self.get_college_data()
+        positions = self._college_positions(colleges, query, filters)
+        
+        if sort == 'netPrice':
+            values = self.get_fee_matrix().prices_for_income(household_income)
         else:
-            results = colleges.copy()
+            values = self._sorted_index('college', colleges, sort).values
+        key = lambda position: sort_key(values[position], position, descending)
         
-        # Apply additional filters
-        if filters:
-            for key, value in filters.items():
-                if key == 'maxTuition' and value is not None:
-                    results = [c for c in results if c.get('tuition', 0) <= value]
-                elif key == 'acceptanceRange' and value is not None:
-                    min_rate, max_rate = value
-                    results = [
-                        c for c in results
-                        if c.get('acceptanceRate', 0) >= min_rate and c.get('acceptanceRate', 100) <= max_rate
-                    ]
-                elif key == 'types' and value:
-                    results = [c for c in results if c.get('type', '') in value]
-                elif key == 'states' and value:
-                    results = [c for c in results if c.get('state', '') in value]
-                elif key == 'sizes' and value:
-                    results = [c for c in results if c.get('size', '') in value]
-        
-        return results
+        page, next_key = top_k_page(positions, key, limit, after)
+        return {
+            'results': [colleges[position] for position in page],
+            'total': len(positions),
+            'nextCursor': encode_cursor(params, next_key) if next_key is not None else None
+        }
     
     def search_occupations(self, query: str, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
@@ -461,26 +868,157 @@ class DataLoader:
         occupations = self.get_occupation_data()
         
         # Filter by search query
+        candidates = None
         if query:
-            query = query.lower()
-            results = [
-                occupation for occupation in occupations
-                if query in occupation.get('title', '').lower() or
-                   query in occupation.get('description', '').lower()
-            ]
-        else:
-            results = occupations.copy()
+            candidates = self._search_index('occupation', occupations, OCCUPATION_SEARCH_FIELDS).search(query)
         
         # Apply additional filters
-        if filters:
-            for key, value in filters.items():
-                if key == 'minSalary' and value is not None:
-                    results = [o for o in results if o.get('salary', 0) >= value]
-                elif key == 'categories' and value:
-                    results = [o for o in results if o.get('category', '') in value]
-                elif key == 'education' and value:
-                    results = [o for o in results if o.get('education', '') in value]
-                elif key == 'growthRate' and value:
-                    results = [o for o in results if o.get('growthRate', '') in value]
-        
-        return results
+        conditions = []
+        for key, value in (filters or {}).items():
+            if key == 'minSalary' and value is not None:
+                conditions.append(RangeFilter(self._sorted_index('occupation', occupations, 'salary'), low=value))
+            elif key in OCCUPATION_CATEGORY_FILTERS and value:
+                values = [value] if isinstance(value, str) else value
+                conditions.append(InFilter(self._hash_index('occupation', occupations, OCCUPATION_CATEGORY_FILTERS[key]), values))
+        
+        return [occupations[position] for position in apply_filters(conditions, len(occupations), candidates)]
+
+
+# Shared loader used by the calculator entry points so that reference data is
+# parsed once per process rather than once per request. A reload replaces it
+# with a fully loaded new generation; the old generation is never modified.
+_default_loader: Optional[DataLoader] = None
+_default_loader_lock = threading.Lock()
+# Loader generation pinned for the current request (see pinned_data_loader)
+_pinned_loader: contextvars.ContextVar = contextvars.ContextVar('pinned_data_loader', default=None)
+
+
+def get_default_data_loader() -> DataLoader:
+    """
+    Get the process-wide data loader, creating it on first use.
+    
+    Inside a pinned_data_loader block this is the generation pinned by the block.
+    
+    Returns:
+        Shared DataLoader instance
+    """
+    pinned = _pinned_loader.get()
+    if pinned is not None:
+        return pinned
+    global _default_loader
+    if _default_loader is None:
+        with _default_loader_lock:
+            if _default_loader is None:
+                _default_loader = DataLoader()
+    return _default_loader
+
+
+@contextmanager
+def pinned_data_loader() -> Iterator[DataLoader]:
+    """
+    Use one loader generation for everything inside the block.
+    
+    A request that looks up reference data several times sees the same tables
+    even if a reload swaps the default loader halfway through. Nested blocks
+    keep the outermost pin. Can also be used as a function decorator.
+    
+    Yields:
+        The pinned DataLoader
+    """
+    if _pinned_loader.get() is not None:
+        yield _pinned_loader.get()
+        return
+    token = _pinned_loader.set(get_default_data_loader())
+    try:
+        yield _pinned_loader.get()
+    finally:
+        _pinned_loader.reset(token)
+
+
+def reload_default_data_loader() -> DataLoader:
+    """
+    Load a new generation of the reference data and make it the default loader.
+    
+    The new loader reads the same directories and is fully preloaded before
+    the swap, so requests never see a partly loaded generation; requests that
+    already hold (or pinned) the old loader finish on it.
+    
+    Returns:
+        The new default DataLoader
+    """
+    global _default_loader
+    current = _default_loader or get_default_data_loader()
+    loader = DataLoader(current.data_dir, current.assets_dir).preload()
+    with _default_loader_lock:
+        _default_loader = loader
+    return loader
+
+
+class DataFileWatcher:
+    """Reloads the default data loader in a background thread when its files change."""
+    
+    def __init__(self, interval: float = 5.0, on_reload: Optional[Callable[[DataLoader], None]] = None):
+        """
+        Initialize the watcher.
+        
+        Args:
+            interval: Seconds between checks of the files' modification times
+            on_reload: Called with the new loader after each reload
+        """
+        self.interval = interval
+        self.on_reload = on_reload
+        self._signature = get_default_data_loader().source_signature()
+        # Signature seen changed at the last check, reloaded once it stops changing
+        self._pending: Optional[Tuple[Tuple[str, int, int], ...]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def check(self) -> bool:
+        """
+        Reload the default loader if any of its files changed.
+        
+        A change is only picked up once the files look the same on two
+        consecutive checks, so a file that is still being written is not loaded.
+        
+        Returns:
+            True if a new generation was loaded
+        """
+        signature = get_default_data_loader().source_signature()
+        if signature == self._signature:
+            self._pending = None
+            return False
+        if signature != self._pending:
+            self._pending = signature
+            return False
+        self._signature = signature
+        self._pending = None
+        loader = reload_default_data_loader()
+        if self.on_reload is not None:
+            self.on_reload(loader)
+        return True
+    
+    def start(self) -> 'DataFileWatcher':
+        """
+        Start checking in a daemon thread.
+        
+        Returns:
+            Self for method chaining
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='data-file-watcher', daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Error reloading reference data: {str(e)}")
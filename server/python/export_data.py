@@ -1,93 +1,420 @@
 import os
 import csv
+import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv
 
+try:
+    from csv_schema import COLLEGE_SCHEMA, OCCUPATION_SCHEMA, parse_str
+    from fee_matrix import FeeMatrix
+    from snapshot import SNAPSHOT_FILE, write_snapshot
+except ImportError:
+    from server.python.csv_schema import COLLEGE_SCHEMA, OCCUPATION_SCHEMA, parse_str
+    from server.python.fee_matrix import FeeMatrix
+    from server.python.snapshot import SNAPSHOT_FILE, write_snapshot
+
 # Load environment variables
 load_dotenv()
 
+# Rows fetched from the server per round trip while exporting
+EXPORT_BATCH_SIZE = 2000
+# Most tables or partitions exported at the same time
+DEFAULT_EXPORT_WORKERS = 4
+
+COLLEGES_QUERY = """
+    SELECT
+        id,
+        name,
+        location,
+        state,
+        type,
+        tuition,
+        room_and_board as "roomAndBoard",
+        acceptance_rate as "acceptanceRate",
+        rating,
+        size,
+        rank,
+        fees_by_income as "feesByIncome"
+    FROM colleges
+"""
+
+CAREERS_QUERY = """
+    SELECT
+        id,
+        title,
+        description,
+        salary_median as salary,
+        growth_rate as "growthRate",
+        education,
+        category
+    FROM careers
+"""
+
 def get_db_connection():
     """Create a database connection."""
     return psycopg2.connect(os.getenv('DATABASE_URL'))
 
-def export_colleges():
-    """Export college data to CSV."""
+def begin_export_transaction(conn, snapshot_id=None):
+    """
+    Start a read-only REPEATABLE READ transaction for an export.
+
+    With a snapshot id (from pg_export_snapshot) the transaction sees exactly
+    the same data as the transaction that exported it, so tables and
+    partitions exported on different connections are consistent.
+    """
+    conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+    if snapshot_id is not None:
+        with conn.cursor() as cur:
+            cur.execute("SET TRANSACTION SNAPSHOT %s", (snapshot_id,))
+
+@contextmanager
+def pooled_connection(pool, snapshot_id=None):
+    """Borrow a connection from the pool inside an export transaction."""
+    conn = pool.getconn()
+    try:
+        begin_export_transaction(conn, snapshot_id)
+        yield conn
+    finally:
+        conn.rollback()
+        pool.putconn(conn)
+
+def watermark_path(path):
+    """Path of the row hash watermark kept next to an exported CSV."""
+    return path + '.watermark.json'
+
+def discard_watermark(path):
+    """
+    Remove the row hash watermark of a CSV that is about to be rewritten in full.
+
+    Called before the new file replaces the old one, so a watermark never
+    describes a CSV it was not computed for; the next incremental export then
+    starts over with a full export.
+    """
+    try:
+        os.remove(watermark_path(path))
+    except FileNotFoundError:
+        pass
+
+def export_query(conn, name, query, path, batch_size=EXPORT_BATCH_SIZE, params=None):
+    """
+    Stream the rows of a query into a CSV file.
+
+    The query runs on a named (server-side) cursor and rows are written batch by
+    batch, so memory use does not grow with the size of the table. The file has
+    a header row of the query's column names; an empty result gives an empty file.
+    Rows are written to a temporary file that replaces the CSV once complete, so
+    readers never see a half-written file. The CSV's watermark is discarded
+    (see discard_watermark).
+
+    Returns the number of rows written.
+    """
+    count = 0
+    temp_path = path + '.tmp'
+    try:
+        with conn.cursor(name=f'export_{name}') as cur:
+            cur.itersize = batch_size
+            cur.execute(query, params)
+            rows = cur.fetchmany(batch_size)
+            with open(temp_path, 'w', newline='') as f:
+                if rows:
+                    writer = csv.writer(f)
+                    writer.writerow([column[0] for column in cur.description])
+                while rows:
+                    writer.writerows(rows)
+                    count += len(rows)
+                    rows = cur.fetchmany(batch_size)
+        discard_watermark(path)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return count
+
+def id_ranges(conn, query, partitions):
+    """
+    Split the ids of a query's rows into contiguous ranges.
+
+    Returns up to `partitions` (low, high) pairs covering every id, with the
+    high bound exclusive; an empty result gives no ranges.
+    """
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT min(t.id), max(t.id) FROM ({query}) AS t")
+        low, high = cur.fetchone()
+    if low is None:
+        return []
+    step = max(1, -(-(high - low + 1) // partitions))
+    return [(start, min(start + step, high + 1)) for start in range(low, high + 1, step)]
+
+def concatenate_parts(part_paths, path):
+    """
+    Join partition CSVs into one file, keeping only the first header, and
+    atomically replace the target with it (discarding its watermark).
+    """
+    temp_path = path + '.tmp'
+    header_written = False
+    with open(temp_path, 'w', newline='') as dst:
+        for part_path in part_paths:
+            with open(part_path, newline='') as src:
+                header = src.readline()
+                if not header:
+                    continue
+                if not header_written:
+                    dst.write(header)
+                    header_written = True
+                for line in src:
+                    dst.write(line)
+    discard_watermark(path)
+    os.replace(temp_path, path)
+    for part_path in part_paths:
+        os.remove(part_path)
+
+def fetch_row_hashes(conn, name, query, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Hash every row of a query on the server.
+
+    Returns a dictionary of id (as text) -> md5 of the row's text form.
+    """
+    hashes = {}
+    with conn.cursor(name=f'hash_{name}') as cur:
+        cur.itersize = batch_size
+        cur.execute(f"SELECT t.id::text, md5(t::text) FROM ({query}) AS t")
+        for row_id, row_hash in cur:
+            hashes[row_id] = row_hash
+    return hashes
+
+def merge_rows(path, columns, changed_rows, deleted_ids):
+    """
+    Merge changed and deleted rows into an exported CSV.
+
+    The file is streamed into a temporary file that then replaces it: changed
+    rows replace the row with the same id (the first column) in place, new rows
+    are appended and deleted rows are dropped.
+    """
+    remaining = dict(changed_rows)
+    temp_path = path + '.tmp'
+    with open(path, newline='') as src, open(temp_path, 'w', newline='') as dst:
+        reader = csv.reader(src)
+        header = next(reader, None) or columns
+        writer = csv.writer(dst)
+        if header:
+            writer.writerow(header)
+        for row in reader:
+            if not row or row[0] in deleted_ids:
+                continue
+            writer.writerow(remaining.pop(row[0], row))
+        writer.writerows(remaining.values())
+    os.replace(temp_path, path)
+
+def export_incremental(conn, name, query, path, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Bring an exported CSV up to date with only the rows that changed.
+
+    The watermark file next to the CSV holds an md5 hash of every exported row.
+    Rows whose hash changed (or that are new) are fetched and merged into the
+    CSV, and rows that no longer exist are removed. Without a watermark or CSV
+    this falls back to a full export. The connection must be in an export
+    transaction (begin_export_transaction) so both queries read the same data.
+
+    Returns (number of changed rows, number of deleted rows).
+    """
+    hashes = fetch_row_hashes(conn, name, query, batch_size)
+
+    try:
+        with open(watermark_path(path)) as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = None
+
+    if previous is None or not os.path.exists(path):
+        changed = export_query(conn, name, query, path, batch_size)
+        deleted = 0
+    else:
+        changed_ids = [row_id for row_id, row_hash in hashes.items() if previous.get(row_id) != row_hash]
+        deleted_ids = set(previous) - set(hashes)
+        changed_rows = {}
+        columns = []
+        if changed_ids:
+            with conn.cursor(name=f'changes_{name}') as cur:
+                cur.itersize = batch_size
+                cur.execute(f"SELECT * FROM ({query}) AS t WHERE t.id::text = ANY(%s)", (changed_ids,))
+                for row in cur:
+                    changed_rows[str(row[0])] = row
+                columns = [column[0] for column in cur.description]
+        if changed_rows or deleted_ids:
+            merge_rows(path, columns, changed_rows, deleted_ids)
+        changed, deleted = len(changed_rows), len(deleted_ids)
+
+    temp_path = watermark_path(path) + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(hashes, f)
+    os.replace(temp_path, watermark_path(path))
+    return changed, deleted
+
+def export_tables(tables, incremental=False, partitions=1, workers=DEFAULT_EXPORT_WORKERS):
+    """
+    Export tables to CSV in parallel over a small connection pool.
+
+    Each table is exported on its own pooled connection; with partitions > 1 a
+    full export also splits every table into id ranges that are exported in
+    parallel and then joined. All connections read one exported snapshot of the
+    database, so the files are consistent with each other, and every file is
+    replaced atomically when complete.
+
+    tables is a list of (name, query, path) tuples. Incremental exports are not
+    partitioned (each table's changes are fetched by one query), so combining
+    incremental with partitions > 1 raises ValueError.
+    """
+    if incremental and partitions > 1:
+        raise ValueError("Incremental exports cannot be partitioned")
+    for _, _, path in tables:
+        # Ensure data directory exists
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    pool = ThreadedConnectionPool(1, workers + 1, os.getenv('DATABASE_URL'))
+    coordinator = pool.getconn()
+    jobs = []
+    try:
+        # Held open until every worker is done so the exported snapshot stays valid
+        begin_export_transaction(coordinator)
+        with coordinator.cursor() as cur:
+            cur.execute("SELECT pg_export_snapshot()")
+            snapshot_id = cur.fetchone()[0]
+
+        def export_full(name, query, path, params=None):
+            with pooled_connection(pool, snapshot_id) as conn:
+                return export_query(conn, name, query, path, params=params)
+
+        def export_changes(name, query, path):
+            with pooled_connection(pool, snapshot_id) as conn:
+                return export_incremental(conn, name, query, path)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for name, query, path in tables:
+                if incremental:
+                    jobs.append((name, path, None, [executor.submit(export_changes, name, query, path)]))
+                elif partitions > 1:
+                    ranges = id_ranges(coordinator, query, partitions)
+                    part_query = f"SELECT * FROM ({query}) AS t WHERE t.id >= %s AND t.id < %s"
+                    part_paths = [f"{path}.part{i}" for i in range(len(ranges))]
+                    futures = [executor.submit(export_full, f"{name}_{i}", part_query, part_path, bounds)
+                               for i, (bounds, part_path) in enumerate(zip(ranges, part_paths))]
+                    jobs.append((name, path, part_paths, futures))
+                else:
+                    jobs.append((name, path, None, [executor.submit(export_full, name, query, path)]))
+
+            for name, path, part_paths, futures in jobs:
+                try:
+                    results = [future.result() for future in futures]
+                except Exception:
+                    for _, _, _, pending in jobs:
+                        for future in pending:
+                            future.cancel()
+                    raise
+                if incremental:
+                    changed, deleted = results[0]
+                    print(f"Updated {os.path.basename(path)}: {changed} changed, {deleted} deleted")
+                    continue
+                if part_paths is not None:
+                    concatenate_parts(part_paths, path)
+                print(f"Exported {sum(results)} {name} to {os.path.basename(path)}")
+    finally:
+        # Partition files left by a failed export (the executor has finished by now)
+        for _, _, part_paths, _ in jobs:
+            for part_path in part_paths or []:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+        coordinator.rollback()
+        pool.putconn(coordinator)
+        pool.closeall()
+
+def fetch_records(conn, name, query, batch_size=EXPORT_BATCH_SIZE):
+    """Fetch the rows of a query as dictionaries, in batches from a server-side cursor."""
+    records = []
+    with conn.cursor(name=f'snapshot_{name}') as cur:
+        cur.itersize = batch_size
+        cur.execute(query)
+        rows = cur.fetchmany(batch_size)
+        columns = [column[0] for column in cur.description] if rows else []
+        while rows:
+            records.extend(dict(zip(columns, row)) for row in rows)
+            rows = cur.fetchmany(batch_size)
+    return records
+
+def export_snapshot(path=os.path.join('data', SNAPSHOT_FILE)):
+    """
+    Export colleges and careers straight to the DataLoader binary snapshot.
+
+    Values keep their database types, the fee matrix is built from the
+    fees_by_income JSON as fetched, and nothing is written or parsed as CSV
+    text. Text columns are stored the way the CSV export would load ('' for
+    NULL, feesByIncome as its Python-literal text). The watermarks of the CSV
+    files next to the snapshot are discarded, so the next incremental export
+    rewrites those files in full instead of merging into CSVs older than the
+    snapshot.
+    """
     conn = get_db_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-    
-    # Query colleges table
-    cur.execute("""
-        SELECT 
-            id,
-            name,
-            location,
-            state,
-            type,
-            tuition,
-            room_and_board as "roomAndBoard",
-            acceptance_rate as "acceptanceRate",
-            rating,
-            size,
-            rank,
-            fees_by_income as "feesByIncome"
-        FROM colleges
-    """)
-    
-    colleges = cur.fetchall()
-    
+
     # Ensure data directory exists
-    os.makedirs('data', exist_ok=True)
-    
-    # Write to CSV
-    with open('data/college_data.csv', 'w', newline='') as f:
-        if colleges:
-            writer = csv.DictWriter(f, fieldnames=colleges[0].keys())
-            writer.writeheader()
-            writer.writerows(colleges)
-    
-    print(f"Exported {len(colleges)} colleges to college_data.csv")
-    
-    cur.close()
-    conn.close()
-
-def export_careers():
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    try:
+        begin_export_transaction(conn)
+        colleges = fetch_records(conn, 'colleges', COLLEGES_QUERY)
+        careers = fetch_records(conn, 'careers', CAREERS_QUERY)
+    finally:
+        conn.close()
+
+    fee_matrix = FeeMatrix(colleges)
+    for records, schema in ((colleges, COLLEGE_SCHEMA), (careers, OCCUPATION_SCHEMA)):
+        text_fields = [field for field, convert in schema.items() if convert is parse_str]
+        for record in records:
+            for field in text_fields:
+                value = record.get(field)
+                if not isinstance(value, str):
+                    record[field] = '' if value is None else str(value)
+
+    for _, _, csv_path in EXPORT_TABLES:
+        discard_watermark(os.path.join(os.path.dirname(path), os.path.basename(csv_path)))
+    write_snapshot(path, {'college_data.csv': colleges, 'occupation_data.csv': careers},
+                   {'college_data.csv': fee_matrix})
+    print(f"Exported {len(colleges)} colleges and {len(careers)} careers to {os.path.basename(path)}")
+
+EXPORT_TABLES = [
+    ('colleges', COLLEGES_QUERY, 'data/college_data.csv'),
+    ('careers', CAREERS_QUERY, 'data/occupation_data.csv')
+]
+
+def export_colleges(incremental=False, partitions=1):
+    """Export college data to CSV."""
+    export_tables(EXPORT_TABLES[:1], incremental, partitions)
+
+def export_careers(incremental=False, partitions=1):
     """Export career data to CSV."""
-    conn = get_db_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-    
-    # Query careers table
-    cur.execute("""
-        SELECT 
-            id,
-            title,
-            description,
-            salary_median as salary,
-            growth_rate as "growthRate",
-            education,
-            category
-        FROM careers
-    """)
-    
-    careers = cur.fetchall()
-    
-    # Ensure data directory exists
-    os.makedirs('data', exist_ok=True)
-    
-    # Write to CSV
-    with open('data/occupation_data.csv', 'w', newline='') as f:
-        if careers:
-            writer = csv.DictWriter(f, fieldnames=careers[0].keys())
-            writer.writeheader()
-            writer.writerows(careers)
-    
-    print(f"Exported {len(careers)} careers to occupation_data.csv")
-    
-    cur.close()
-    conn.close()
+    export_tables(EXPORT_TABLES[1:], incremental, partitions)
 
 if __name__ == '__main__':
-    print("Exporting data from database to CSV files...")
-    export_colleges()
-    export_careers()
-    print("Done!") 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Export reference data from the database to CSV files")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only fetch rows that changed since the last export")
+    parser.add_argument('--snapshot', action='store_true',
+                        help="Write the binary data snapshot DataLoader loads instead of CSV files")
+    parser.add_argument('--partitions', type=int, default=1,
+                        help="Split each table into this many id ranges exported in parallel "
+                             "(full exports only)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_EXPORT_WORKERS,
+                        help="Number of tables or partitions exported at the same time")
+    args = parser.parse_args()
+    if args.incremental and args.partitions > 1:
+        parser.error("--partitions cannot be combined with --incremental")
+
+    if args.snapshot:
+        print("Exporting data from database to a data snapshot...")
+        export_snapshot()
+    else:
+        print("Exporting data from database to CSV files...")
+        export_tables(EXPORT_TABLES, args.incremental, args.partitions, max(1, args.workers))
+    print("Done!")
@@ -0,0 +1,193 @@
+"""
+Colleges-by-income-bracket net price matrix.
+
+college_data.csv stores each college's net price by household income bracket as
+a Python-literal string, e.g. "{'0-30000': 1838, '30001-48000': 2694, ...}".
+FeeMatrix parses those strings once, when the college table loads, into one row
+per college and one column per bracket, so that a family's net price at every
+college is a single column lookup instead of a parse per row.
+
+A price of 0 in the source data means the college reported no figure for that
+bracket, so it is stored as missing (NaN) rather than as free.
+"""
+
+import ast
+import math
+from bisect import bisect_right
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def parse_bracket(label: str) -> Tuple[float, float]:
+    """
+    Parse an income bracket label.
+
+    Args:
+        label: Bracket such as '30001-48000' or '110001+'
+
+    Returns:
+        (lower bound, upper bound), with an infinite upper bound for open brackets
+
+    Raises:
+        ValueError: If the label is not a bracket
+    """
+    low, dash, high = str(label).strip().rstrip('+').partition('-')
+    return float(low), float(high) if dash else math.inf
+
+
+def parse_fees(fees: Any) -> Dict[str, float]:
+    """
+    Parse a college's feesByIncome value.
+
+    Args:
+        fees: Dictionary of bracket -> price, or its Python-literal string form
+
+    Returns:
+        Dictionary of bracket label -> price (empty if the value cannot be parsed)
+    """
+    if isinstance(fees, str):
+        try:
+            fees = ast.literal_eval(fees)
+        except (ValueError, SyntaxError):
+            return {}
+    if not isinstance(fees, dict):
+        return {}
+    return {
+        str(label): float(price) for label, price in fees.items()
+        if isinstance(price, (int, float)) and not isinstance(price, bool)
+    }
+
+
+class FeeMatrix:
+    """Net prices of every college for every household income bracket."""
+
+    def __init__(self, colleges: List[Dict[str, Any]]):
+        """
+        Parse the colleges' feesByIncome values.
+
+        Args:
+            colleges: College records; rows of the matrix follow this order
+        """
+        self.records = colleges
+        parsed = [parse_fees(college.get('feesByIncome')) for college in colleges]
+
+        brackets = set()
+        for fees in parsed:
+            for label in fees:
+                try:
+                    brackets.add((parse_bracket(label), label))
+                except ValueError:
+                    pass
+        labels = [label for _, label in sorted(brackets)]
+        column = {label: i for i, label in enumerate(labels)}
+
+        prices = []
+        for fees in parsed:
+            row = [math.nan] * len(labels)
+            for label, price in fees.items():
+                if label in column and price > 0:
+                    row[column[label]] = price
+            prices.extend(row)
+        self._set_prices(labels, prices)
+
+    @classmethod
+    def from_prices(cls, colleges: List[Dict[str, Any]], brackets: List[str], prices: Any) -> 'FeeMatrix':
+        """
+        Build a matrix from already parsed prices (e.g. a data snapshot).
+
+        Args:
+            colleges: College records; rows of the matrix follow this order
+            brackets: Bracket labels in ascending order
+            prices: Row-major prices, one row per college and one column per bracket (NaN where unknown)
+
+        Returns:
+            Fee matrix
+        """
+        matrix = cls.__new__(cls)
+        matrix.records = colleges
+        matrix._set_prices(list(brackets), prices)
+        return matrix
+
+    def _set_prices(self, brackets: List[str], prices: Any) -> None:
+        self.brackets: List[str] = brackets
+        self._lows: List[float] = [parse_bracket(label)[0] for label in brackets]
+        self._row_of: Dict[str, int] = {}
+        for position, college in enumerate(self.records):
+            self._row_of.setdefault(str(college.get('id', '')), position)
+        width = len(brackets)
+        if np is not None:
+            self.prices = np.asarray(prices, dtype=float).reshape(len(self.records), width)
+        else:
+            self.prices = [list(prices[i * width:(i + 1) * width]) for i in range(len(self.records))]
+
+    def bracket_index(self, household_income: float) -> Optional[int]:
+        """
+        Find the bracket column for a household income.
+
+        Incomes between two brackets' bounds (e.g. 30000.50) fall in the lower one.
+
+        Args:
+            household_income: Annual household income
+
+        Returns:
+            Column index, or None if the income is below every bracket
+        """
+        index = bisect_right(self._lows, household_income) - 1
+        return index if index >= 0 else None
+
+    def prices_for_income(self, household_income: float) -> Any:
+        """
+        Get every college's net price for one household income.
+
+        Args:
+            household_income: Annual household income
+
+        Returns:
+            Prices in college order (NaN where unknown), as a numpy array when numpy is available
+        """
+        column = self.bracket_index(household_income)
+        if np is not None:
+            if column is None:
+                return np.full(len(self.records), np.nan)
+            return self.prices[:, column]
+        if column is None:
+            return [math.nan] * len(self.records)
+        return [row[column] for row in self.prices]
+
+    def rows(self, college_ids: Iterable[Any]) -> List[int]:
+        """
+        Map college ids to matrix rows.
+
+        Args:
+            college_ids: College ids
+
+        Returns:
+            Row per id, -1 for unknown ids
+        """
+        return [self._row_of.get(str(college_id), -1) for college_id in college_ids]
+
+    def net_price(self, college_ids: Iterable[Any], household_income: float) -> Any:
+        """
+        Look up the net price of several colleges for one household income.
+
+        Args:
+            college_ids: College ids
+            household_income: Annual household income
+
+        Returns:
+            Net price per id (NaN for unknown ids or missing data), as a numpy
+            array when numpy is available and a list otherwise
+        """
+        rows = self.rows(college_ids)
+        prices = self.prices_for_income(household_income)
+        if np is not None:
+            rows = np.asarray(rows, dtype=np.intp)
+            result = np.full(len(rows), np.nan)
+            known = rows >= 0
+            result[known] = prices[rows[known]]
+            return result
+        return [prices[row] if row >= 0 else math.nan for row in rows]
@@ -0,0 +1,224 @@
+"""
+Zip-code cost of living table built from attached_assets/COLI by Location.csv.
+
+The file has about 44,000 rows of monthly costs per expense category and an
+income adjustment factor, covering about 38,000 zip codes; zips listed more
+than once (one row per place) are averaged. The table keeps each category as a
+typed array and maps a zip code to its row through a 100,000-entry array
+indexed by the numeric zip, so a lookup is two array reads. State averages are
+computed once at load and answer lookups for zips that are not in the file.
+"""
+
+import csv
+from array import array
+from typing import Dict, Any, List, Optional
+
+# Dataset column -> key used in location cost records (the frontend's locationCostData keys)
+COST_COLUMNS = {
+    'Housing': 'housing',
+    'Transportation': 'transportation',
+    'Food': 'food',
+    'Healthcare': 'healthcare',
+    'Personal Insurance': 'personal_insurance',
+    'Apparel': 'apparel',
+    'Services': 'services',
+    'Entertainment': 'entertainment',
+    'Other': 'other',
+    'Monthly Expense': 'monthly_expense',
+    'Income Adjustment Factor': 'income_adjustment_factor'
+}
+
+# Expense categories synthesized into expenditures: (cost key, type, name, annual inflation rate)
+EXPENSE_CATEGORIES = [
+    ('housing', 'housing', 'Housing', 0.03),
+    ('transportation', 'transportation', 'Transportation', 0.03),
+    ('food', 'living', 'Food', 0.03),
+    ('healthcare', 'living', 'Healthcare', 0.04),
+    ('personal_insurance', 'living', 'Personal Insurance', 0.03),
+    ('apparel', 'living', 'Apparel', 0.02),
+    ('services', 'living', 'Services', 0.03),
+    ('entertainment', 'living', 'Entertainment', 0.02),
+    ('other', 'living', 'Other', 0.02)
+]
+
+ZIP_CODE_SPACE = 100000
+
+
+def _to_float(value: Optional[str]) -> float:
+    try:
+        return float(str(value).replace(',', '').strip())
+    except ValueError:
+        return 0.0
+
+
+def normalize_zip(zip_code: Any) -> Optional[str]:
+    """
+    Normalize a zip code to its 5-digit form.
+
+    Args:
+        zip_code: Zip code as a string or number, optionally ZIP+4 ('98101-1234')
+
+    Returns:
+        5-digit zip string, or None if the value is not a zip code
+    """
+    if zip_code is None:
+        return None
+    digits = str(zip_code).strip().split('-')[0]
+    if not digits.isdigit() or len(digits) > 5:
+        return None
+    return digits.zfill(5)
+
+
+class LocationCostTable:
+    """Monthly cost of living by zip code, with state-level averages as a fallback."""
+
+    def __init__(self, rows: List[Dict[str, str]]):
+        """
+        Build the table.
+
+        Args:
+            rows: Rows of COLI by Location.csv as read by csv.DictReader
+        """
+        self._row_of_zip = array('i', [-1]) * ZIP_CODE_SPACE
+        self.zip_codes: List[str] = []
+        self.cities: List[str] = []
+        self.states: List[str] = []
+        self.columns: Dict[str, array] = {key: array('d') for key in COST_COLUMNS.values()}
+
+        state_names: Dict[str, str] = {}
+        row_counts = array('i')
+        for row in rows:
+            zip_code = normalize_zip(row.get('Zipcode'))
+            if zip_code is None:
+                continue
+            position = self._row_of_zip[int(zip_code)]
+            if position >= 0:
+                # Another place in the same zip code: accumulate, averaged below
+                row_counts[position] += 1
+                for column, key in COST_COLUMNS.items():
+                    self.columns[key][position] += _to_float(row.get(column))
+                continue
+            self._row_of_zip[int(zip_code)] = len(self.zip_codes)
+            row_counts.append(1)
+            self.zip_codes.append(zip_code)
+            self.cities.append((row.get('City') or '').strip())
+            state = (row.get('State') or '').strip().upper()
+            self.states.append(state_names.setdefault(state, state))
+            for column, key in COST_COLUMNS.items():
+                self.columns[key].append(_to_float(row.get(column)))
+
+        for position, count in enumerate(row_counts):
+            if count > 1:
+                for values in self.columns.values():
+                    values[position] = round(values[position] / count, 4)
+
+        self.state_averages: Dict[str, Dict[str, float]] = {}
+        counts: Dict[str, int] = {}
+        for position, state in enumerate(self.states):
+            totals = self.state_averages.setdefault(state, dict.fromkeys(self.columns, 0.0))
+            counts[state] = counts.get(state, 0) + 1
+            for key, values in self.columns.items():
+                totals[key] += values[position]
+        for state, totals in self.state_averages.items():
+            for key in totals:
+                totals[key] = round(totals[key] / counts[state], 4)
+
+    @classmethod
+    def from_csv(cls, path: str) -> 'LocationCostTable':
+        """
+        Load the table from COLI by Location.csv.
+
+        Args:
+            path: Path to the CSV file
+
+        Returns:
+            Loaded table
+        """
+        with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+            return cls(list(csv.DictReader(f)))
+
+    def __len__(self) -> int:
+        return len(self.zip_codes)
+
+    def get(self, zip_code: Any) -> Optional[Dict[str, Any]]:
+        """
+        Look up the costs of one zip code.
+
+        Args:
+            zip_code: Zip code
+
+        Returns:
+            Location cost record, or None if the zip code is not in the table
+        """
+        zip_code = normalize_zip(zip_code)
+        if zip_code is None:
+            return None
+        position = self._row_of_zip[int(zip_code)]
+        if position < 0:
+            return None
+        record = {'zip_code': zip_code, 'city': self.cities[position], 'state': self.states[position]}
+        for key, values in self.columns.items():
+            record[key] = values[position]
+        return record
+
+    def get_state_average(self, state: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Get the average costs across a state's zip codes.
+
+        Args:
+            state: Two-letter state code
+
+        Returns:
+            Location cost record for the state, or None if the state is unknown
+        """
+        averages = self.state_averages.get((state or '').strip().upper())
+        if averages is None:
+            return None
+        record = {'zip_code': None, 'city': None, 'state': state.strip().upper(), 'stateAverage': True}
+        record.update(averages)
+        return record
+
+    def lookup(self, zip_code: Any, state: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a zip code, falling back to the state average.
+
+        Args:
+            zip_code: Zip code
+            state: State to fall back to if the zip code is not in the table
+
+        Returns:
+            Location cost record, or None if neither the zip code nor the state is known
+        """
+        return self.get(zip_code) or self.get_state_average(state)
+
+
+def build_expenditures(costs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Turn a location's monthly costs into calculator expenditure inputs.
+
+    This mirrors the expenditures the frontend used to build from the same
+    data, so a request can send just a zip code.
+
+    Args:
+        costs: Location cost record from LocationCostTable
+
+    Returns:
+        Expenditure dictionaries in the format FinancialCalculator.from_input_data expects
+    """
+    expenditures = []
+    for key, expenditure_type, name, inflation_rate in EXPENSE_CATEGORIES:
+        monthly = costs.get(key) or 0
+        if monthly <= 0:
+            continue
+        expenditure = {
+            'type': expenditure_type,
+            'name': name,
+            'annualAmount': monthly * 12,
+            'inflationRate': inflation_rate
+        }
+        if expenditure_type == 'transportation':
+            # Car replacement is handled explicitly through milestones
+            expenditure['auto_replace'] = False
+        expenditures.append(expenditure)
+    return expenditures
+
@@ -5,6 +5,11 @@ Represents different types of assets with varying behavior over time.
 
 from typing import Optional
 
+try:
+    from models.base import copy_model
+except ImportError:
+    from server.python.models.base import copy_model
+
 
 class Asset:
     """Base class for all assets."""
@@ -21,6 +26,10 @@ class Asset:
         self.initial_value = initial_value
         self.value_history = {0: initial_value}  # Track value over time
     
+    def copy(self) -> 'Asset':
+        """Create an independent copy of this asset (see copy_model)."""
+        return copy_model(self)
+    
     def get_value(self, year: int) -> float:
         """
         Get the value of the asset at a given year.
@@ -0,0 +1,30 @@
+"""
+Helpers shared by the financial model classes.
+"""
+
+import copy
+from typing import TypeVar
+
+Model = TypeVar('Model')
+
+
+def copy_model(model: Model) -> Model:
+    """
+    Create an independent copy of an asset, liability, income or expenditure.
+
+    The model's dict and list attributes are copied too, so that a projection
+    run on the copy does not change the original's history. The copies are
+    one level deep: the models only keep flat containers (year -> amount maps
+    such as value_history or payment_history), so nothing nested is shared.
+
+    Args:
+        model: Model instance to copy
+
+    Returns:
+        Copy of the model
+    """
+    clone = copy.copy(model)
+    for key, value in vars(model).items():
+        if isinstance(value, (dict, list)):
+            setattr(clone, key, value.copy())
+    return clone
@@ -5,6 +5,11 @@ Represents different types of expenses and costs.
 
 from typing import Optional, Dict, List
 
+try:
+    from models.base import copy_model
+except ImportError:
+    from server.python.models.base import copy_model
+
 
 class Expenditure:
     """Base class for all expenditures (expenses/costs)."""
@@ -24,6 +29,10 @@ class Expenditure:
         self.inflation_rate = inflation_rate
         self.expense_history = {0: annual_amount}  # Track expenses over time
     
+    def copy(self) -> 'Expenditure':
+        """Create an independent copy of this expenditure (see copy_model)."""
+        return copy_model(self)
+    
     def get_expense(self, year: int) -> float:
         """
         Get the expense amount for a given year.
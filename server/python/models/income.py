@@ -5,6 +5,11 @@ Represents different types of income sources.
 
 from typing import Optional, Dict
 
+try:
+    from models.base import copy_model
+except ImportError:
+    from server.python.models.base import copy_model
+
 
 class Income:
     """Base class for all income sources."""
@@ -29,6 +34,10 @@ class Income:
         self.end_year = end_year
         self.income_history = {}  # Track income over time
     
+    def copy(self) -> 'Income':
+        """Create an independent copy of this income source (see copy_model)."""
+        return copy_model(self)
+    
     def get_income(self, year: int) -> float:
         """
         Get the income amount for a given year.
@@ -6,6 +6,11 @@ Represents different types of debts and loans.
 from typing import Optional, Dict
 import math
 
+try:
+    from models.base import copy_model
+except ImportError:
+    from server.python.models.base import copy_model
+
 
 class Liability:
     """Base class for all liabilities (debts and loans)."""
@@ -42,6 +47,10 @@ class Liability:
         else:
             self.monthly_payment = 0
     
+    def copy(self) -> 'Liability':
+        """Create an independent copy of this liability (see copy_model)."""
+        return copy_model(self)
+    
     def get_balance(self, year: int) -> float:
         """
         Get the balance of the liability at a given year.
@@ -0,0 +1,84 @@
+"""
+Zip code prefix to state lookup.
+
+ZIP_PREFIX_STATES has one entry per 3-digit zip prefix (000-999), so resolving
+a zip code's state is a single tuple read. The table is generated from the
+State columns of attached_assets/COLI by Location.csv and Zip_Code_Income.csv
+(the few prefixes that span a state line go to the state with most of their zip
+codes); prefixes that appear in neither dataset map to None. Regenerate it with:
+
+    python models/zip_states.py
+"""
+
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple
+
+# Two characters per prefix, 100 prefixes per line ('..' = no data)
+_ENCODED_TABLE = (
+    '............PRPRVIPRMAMAMAMAMAMAMAMAMAMAMAMAMAMAMAMAMAMARIRINHNHNHNHNHNHNHNHNHMEMEMEMEMEMEMEMEMEMEMEVTVTVTVTVT..VTVTVTVTCTCTCTCTCTCTCTCTCTCTNJNJNJNJNJNJNJNJNJNJNJNJNJNJNJNJNJNJNJNJ....................'
+    'NYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYNYPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPAPA..PAPAPAPADEDEDE'
+    'DCVA........MDMDMDMDMDMDMD..MDMDMDMDMDMDVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAVAWVWVWVWVWVWVWVWVWVWVWVWVWVWVWVWVWVWVWVWVWVWV..NCNCNCNCNCNCNCNCNCNCNCNCNCNCNCNCNCNCNCNCSCSCSCSCSCSCSCSCSCSC'
+    'GAGAGAGAGAGAGAGAGAGAGAGAGAGAGAGAGAGAGAGAFLFLFLFLFLFLFLFLFLFLFLFLFLFLFLFLFLFLFLFL..FLFL..FL..FLFL..FLALALAL..ALALALALALALALALALALALALALALALALTNTNTNTNTN..TNTNTNTNTNTNTNTNTNTNMSMSMSMSMSMSMSMSMSMSMSMSGA..'
+    'KYKYKYKYKYKYKYKYKYKYKYKYKYKYKYKYKYKYKY..KYKYKYKYKYKYKYKY....OHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOHOH..ININININININININININININININININININININMIMIMIMIMIMIMIMIMIMIMIMIMIMIMIMIMIMIMIMI'
+    'IAIAIAIAIAIAIAIAIAIAIAIAIAIAIAIAIA......IAIAIAIAIAIAIAIAIA..WIWIWI..WIWI..WIWIWIWIWIWIWIWIWIWIWIWIWIMNMN..MNMNMNMNMNMNMNMNMNMNMNMNMNMNMN....SDSDSDSDSDSDSDSD....NDNDNDNDNDNDNDNDND..MTMTMTMTMTMTMTMTMTMT'
+    'ILILILILILILILILILILILILILILILILILILILILIL..ILILILILILILILILMOMO..MOMOMOMOMOMOMOMOMO....MOMOMOMOMO..MOMOMOMOMOMOMOMOMO..KSKSKS..KSKSKSKSKSKSKSKSKSKSKSKSKSKSKSKSNENE..NENENENENENENENENENENE............'
+    'LALA..LALALALALALA..LALALALALA..ARARARARARARARARARARARARARAROKOK....OKOKOKOKOKOKOKOK..OKOKOKOKOKOKOKTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTX..TXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTXTX'
+    'COCOCOCOCOCOCOCOCOCOCOCOCOCOCOCOCO......WYWYWYWYWYWYWYWYWYWYWYWYIDIDIDIDIDIDID..UTUT..UTUTUTUTUT....AZAZAZAZ..AZAZAZ..AZAZ....AZAZAZ........NMNM..NMNMNM..NMNMNMNMNMNMNMNMTX........NVNV..NVNVNV..NVNV..'
+    'CA..CACACACACACACA..CACACACACACACACACACACACACACACACACACACA..CACACACACACACACA..CACACA..CACACACACACACACACACACACACACACACACACACA..........HIHIGUORORORORORORORORORORWAWAWAWAWAWAWA..WAWAWAWAWAWAWAAKAKAKAKAK'
+)
+
+ZIP_PREFIX_STATES: Tuple[Optional[str], ...] = tuple(
+    None if _ENCODED_TABLE[i:i + 2] == '..' else _ENCODED_TABLE[i:i + 2]
+    for i in range(0, len(_ENCODED_TABLE), 2)
+)
+
+
+def state_from_zip(zip_code) -> Optional[str]:
+    """
+    Look up the state of a zip code from its 3-digit prefix.
+
+    Args:
+        zip_code: 5-digit zip code (string or number; ZIP+4 is accepted)
+
+    Returns:
+        Two-letter state code, or None if the zip code is invalid or its prefix is unknown
+    """
+    if zip_code is None:
+        return None
+    digits = str(zip_code).strip().split('-')[0]
+    if not digits.isdigit() or len(digits) > 5:
+        return None
+    return ZIP_PREFIX_STATES[int(digits.zfill(5)[:3])]
+
+
+def build_prefix_states(zip_states: Iterable[Tuple[str, str]]) -> List[Optional[str]]:
+    """
+    Build the prefix table from (zip code, state) pairs.
+
+    Args:
+        zip_states: Pairs of 5-digit zip code and state code
+
+    Returns:
+        State per prefix, by majority of the prefix's zip codes
+    """
+    votes = [Counter() for _ in range(1000)]
+    for zip_code, state in zip_states:
+        if zip_code and state and len(zip_code) == 5 and zip_code.isdigit():
+            votes[int(zip_code[:3])][state] += 1
+    return [counts.most_common(1)[0][0] if counts else None for counts in votes]
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data_loader import DataLoader
+
+    loader = DataLoader()
+    pairs = []
+    for table in (loader.get_location_cost_table(), loader.get_zip_income_table()):
+        pairs.extend(zip(table.zip_codes, table.states))
+    states = build_prefix_states(pairs)
+    encoded = ''.join(state or '..' for state in states)
+    for start in range(0, len(encoded), 200):
+        print(f"    '{encoded[start:start + 200]}'")
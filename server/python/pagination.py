@@ -0,0 +1,102 @@
+"""
+Top-K selection and opaque keyset cursors for paginated search results.
+
+A page is selected with a bounded heap over the matching row positions, so only
+the rows on the page are ever sorted or returned. Each row's sort key is
+(missing, value, position): rows without a value sort last in either direction,
+and the table position breaks ties so that the order is total. The cursor
+carries the key of the last row on a page; the next page is the K smallest keys
+after it, so pages stay consistent without an offset scan.
+"""
+
+import base64
+import heapq
+import json
+import math
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
+
+SortKey = Tuple[int, float, int]
+
+
+def sort_key(value: Any, position: int, descending: bool = False) -> SortKey:
+    """
+    Build the total-order sort key of a row.
+
+    Args:
+        value: The row's sort value (None, NaN or non-numeric when missing)
+        position: The row's position in the table
+        descending: Whether larger values come first
+
+    Returns:
+        Sort key tuple
+    """
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or math.isnan(value):
+        return (1, 0.0, position)
+    return (0, -float(value) if descending else float(value), position)
+
+
+def top_k_page(positions: Iterable[int], key: Callable[[int], SortKey], limit: int,
+               after: Optional[SortKey] = None) -> Tuple[List[int], Optional[SortKey]]:
+    """
+    Select one page of rows in sort order.
+
+    Args:
+        positions: Positions of all matching rows
+        key: Function giving a row's sort key
+        limit: Page size
+        after: Sort key of the last row of the previous page, or None for the first page
+
+    Returns:
+        (positions on the page, sort key of the last row if there is another page, else None)
+    """
+    keyed = ((key(position), position) for position in positions)
+    if after is not None:
+        keyed = (item for item in keyed if item[0] > after)
+    # One extra row tells us whether another page exists
+    page = heapq.nsmallest(limit + 1, keyed)
+    has_more = len(page) > limit
+    page = page[:limit]
+    next_key = page[-1][0] if has_more and page else None
+    return [position for _, position in page], next_key
+
+
+def encode_cursor(params: Dict[str, Any], after: SortKey) -> str:
+    """
+    Encode an opaque cursor for the next page.
+
+    Args:
+        params: Sort parameters the cursor is only valid for
+        after: Sort key of the last row on the current page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({'params': params, 'after': list(after)}, separators=(',', ':'), sort_keys=True)
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, params: Dict[str, Any]) -> SortKey:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+        params: Sort parameters of the current request
+
+    Returns:
+        Sort key to continue after
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for different sort parameters
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        missing, value, position = payload['after']
+        after = (int(missing), float(value), int(position))
+        issued_for = payload['params']
+    except (ValueError, TypeError, KeyError, UnicodeError):
+        raise ValueError("Invalid cursor")
+    if issued_for != json.loads(json.dumps(params)):
+        raise ValueError("Cursor does not match the requested sort order")
+    return after
@@ -4,8 +4,12 @@ This class uses the milestone system under the hood but provides a cleaner inter
 for comparing different scenarios.
 """
 
-from typing import List, Dict, Any, Optional
-from financial_updated import FinancialCalculator
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
+from financial_updated import FinancialCalculator, career_path_ids, evaluate_path_metrics
+from data_loader import get_default_data_loader
+from path_grid import PathGrid, DEFAULT_CHUNK_SIZE, DEFAULT_LIVING_EXPENSES
 from enum import Enum
 
 class EducationType(Enum):
@@ -17,6 +21,33 @@ class EducationType(Enum):
     DOCTORATE = "doctorate"
     PROFESSIONAL = "professional"
 
+def _evaluate_path(calculator: FinancialCalculator, path: Dict[str, Any],
+                   discount_rate: float) -> Dict[str, Any]:
+    """
+    Run one path's projection and build its comparison entry.
+    
+    Args:
+        calculator: Calculator for this path, forked from the base calculator
+        path: Path definition created by one of the add_*_path methods
+        discount_rate: Rate used to discount future earnings
+        
+    Returns:
+        Comparison entry for the path
+    """
+    # Add all milestones for this path
+    for milestone in path['milestones']:
+        calculator.add_milestone(milestone)
+    
+    entry = {'title': path['title']}
+    entry.update(evaluate_path_metrics(calculator, discount_rate))
+    entry['milestones'] = path['milestones']
+    if 'education_type' in path:
+        entry['education_type'] = path['education_type']
+    if 'growth_rates' in path:
+        entry['growth_rates'] = path['growth_rates']
+    return entry
+
+
 class PathBuilder:
     """Builder class for creating and comparing career paths."""
     
@@ -45,6 +76,7 @@ class PathBuilder:
         """
         self.base_input_data = base_input_data
         self.paths = []
+        self._base_calculator: Optional[FinancialCalculator] = None
         
         # Set growth rates from input data or use defaults
         self.income_growth = base_input_data.get('incomeGrowthRate', self.DEFAULT_INCOME_GROWTH)
@@ -52,6 +84,29 @@ class PathBuilder:
         self.education_cost_growth = base_input_data.get('educationCostGrowthRate', self.DEFAULT_EDUCATION_COST_GROWTH)
         self.inflation = base_input_data.get('inflationRate', self.DEFAULT_INFLATION)
     
+    def _get_base_calculator(self) -> FinancialCalculator:
+        """
+        Get the calculator parsed from the base input data.
+        
+        The base input is parsed once per builder; it is used directly for
+        read-only lookups and forked for every path that runs a projection.
+        
+        Returns:
+            The shared base calculator (do not mutate it)
+        """
+        if self._base_calculator is None:
+            self._base_calculator = FinancialCalculator.from_input_data(self.base_input_data)
+        return self._base_calculator
+    
+    def _fork_base_calculator(self) -> FinancialCalculator:
+        """
+        Create a calculator for one path from the base calculator.
+        
+        Returns:
+            Copy-on-write fork of the base calculator (see FinancialCalculator.fork)
+        """
+        return self._get_base_calculator().fork()
+    
     def _calculate_future_value(self, present_value: float, growth_rate: float, years: int) -> float:
         """
         Calculate future value using compound growth.
@@ -120,7 +175,7 @@ class PathBuilder:
             Self for method chaining
         """
         # Get occupation data
-        calculator = FinancialCalculator.from_input_data(self.base_input_data)
+        calculator = self._get_base_calculator()
         occupation_data = calculator._get_occupation_data(occupation_id)
         
         if not occupation_data:
@@ -168,7 +223,7 @@ class PathBuilder:
         Returns:
             Self for method chaining
         """
-        calculator = FinancialCalculator.from_input_data(self.base_input_data)
+        calculator = self._get_base_calculator()
         
         # Get education duration
         duration = self._get_education_duration(education_type)
@@ -257,48 +312,137 @@ class PathBuilder:
         
         return self
     
-    def compare_paths(self) -> Dict[str, Any]:
+    def iter_compare_paths(self, parallel: bool = False,
+                           max_workers: Optional[int] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Evaluate all added paths, yielding each path's results as soon as it is done.
+        
+        Args:
+            parallel: Run the paths concurrently in a pool of worker processes
+            max_workers: Number of worker processes (defaults to one per path, up to the CPU count)
+            
+        Yields:
+            (path key, comparison entry) pairs, in path order when serial and in
+            completion order when parallel
+        """
+        keys = career_path_ids(self.paths)
+        discount_rate = self.base_input_data.get('discountRate', 0.03)
+        
+        if not parallel or len(self.paths) < 2:
+            for key, path in zip(keys, self.paths):
+                yield key, _evaluate_path(self._fork_base_calculator(), path, discount_rate)
+            return
+        
+        workers = max_workers or min(len(self.paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_evaluate_path, self._fork_base_calculator(), path, discount_rate): key
+                for key, path in zip(keys, self.paths)
+            }
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                # Stop queued paths if the caller stops iterating or a path fails
+                for future in futures:
+                    future.cancel()
+    
+    def compare_paths(self, parallel: bool = False, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Compare all added paths.
         
+        Paths are keyed like compare_career_paths keys them: by their 'id' when
+        they have one, otherwise by type, with a numeric suffix for later paths
+        of the same type (e.g. 'education_2').
+        
+        Args:
+            parallel: Run the paths concurrently in a pool of worker processes
+            max_workers: Number of worker processes (defaults to one per path, up to the CPU count)
+        
         Returns:
-            Dictionary containing comparison results for each path
+            Dictionary containing comparison results for each path, in the order the paths were added
         """
-        comparison_results = {}
+        finished = dict(self.iter_compare_paths(parallel=parallel, max_workers=max_workers))
+        return {key: finished[key] for key in career_path_ids(self.paths)}
+
+    def _resolve_records(self, items: Optional[List[Union[str, int, Dict[str, Any]]]],
+                         all_records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Turn a list of ids and/or records into records.
         
-        for path in self.paths:
-            # Create calculator for this path
-            calculator = FinancialCalculator.from_input_data(self.base_input_data)
-            
-            # Add all milestones for this path
-            for milestone in path['milestones']:
-                calculator.add_milestone(milestone)
-            
-            # Calculate projection
-            results = calculator.calculate_projection()
-            
-            # Calculate key metrics
-            total_income = sum(results.get('income', []))
-            total_expenses = sum(results.get('expenses', []))
-            net_worth = results.get('netWorth', [])[-1] if results.get('netWorth') else 0
+        Args:
+            items: Ids or record dictionaries, or None for every record
+            all_records: Reference table to resolve ids against
             
-            # Calculate present value of earnings
-            present_value = calculator._calculate_present_value_of_earnings(
-                results.get('income', []),
-                self.base_input_data.get('discountRate', 0.03)
-            )
+        Returns:
+            Matching records (unknown ids are skipped)
+        """
+        if items is None:
+            return all_records
+        by_id = {str(record.get('id')): record for record in all_records}
+        records = []
+        for item in items:
+            if isinstance(item, dict):
+                records.append(item)
+            elif str(item) in by_id:
+                records.append(by_id[str(item)])
+        return records
+    
+    def rank_college_occupation_grid(self,
+                                     colleges: Optional[List[Union[str, int, Dict[str, Any]]]] = None,
+                                     occupations: Optional[List[Union[str, int, Dict[str, Any]]]] = None,
+                                     metric: str = 'netWorth',
+                                     top_k: int = 20,
+                                     part_time_income: float = 0,
+                                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        """
+        Rank every college x occupation education path and return the best ones.
+        
+        Uses the batched screening model in path_grid rather than a full
+        projection per combination, so the whole reference data set (about
+        6,500 colleges x 830 occupations) can be ranked in one call. Run
+        compare_paths on the winners for full yearly breakdowns.
+        
+        Args:
+            colleges: College ids or records (None = every college in the reference data)
+            occupations: Occupation ids or records (None = every occupation)
+            metric: 'netWorth', 'presentValueOfEarnings' or 'debtFreeYear'
+            top_k: Number of combinations to return
+            part_time_income: Annual part-time income while in school, in today's dollars
+            chunk_size: Colleges evaluated per batch
             
-            comparison_results[path['type']] = {
-                'title': path['title'],
-                'totalIncome': total_income,
-                'totalExpenses': total_expenses,
-                'netWorth': net_worth,
-                'presentValueOfEarnings': present_value,
-                'yearlyBreakdown': results,
-                'milestones': path['milestones']
-            }
+        Returns:
+            The top_k combinations, best first, with their metrics
+        """
+        loader = get_default_data_loader()
+        college_records = self._resolve_records(colleges, loader.get_college_data())
+        occupation_records = self._resolve_records(occupations, loader.get_occupation_data())
+        
+        initial_savings = self.base_input_data.get('initialSavings')
+        if initial_savings is None:
+            initial_savings = sum(asset.get('initialValue', 0) for asset in self.base_input_data.get('assets', []))
+        living_expenses = sum(
+            expense.get('annualAmount', 0) for expense in self.base_input_data.get('expenditures', [])
+        ) or DEFAULT_LIVING_EXPENSES
         
-        return comparison_results
+        grid = PathGrid(
+            college_records,
+            occupation_records,
+            years_to_project=self.base_input_data.get('yearsToProject', 20),
+            education_multipliers={
+                2: self.EDUCATION_MULTIPLIERS[EducationType.TWO_YEAR_COLLEGE],
+                4: self.EDUCATION_MULTIPLIERS[EducationType.FOUR_YEAR_COLLEGE]
+            },
+            income_growth=self.income_growth,
+            cost_of_living_growth=self.cost_of_living_growth,
+            education_cost_growth=self.education_cost_growth,
+            discount_rate=self.base_input_data.get('discountRate', 0.03),
+            initial_savings=initial_savings,
+            living_expenses=living_expenses,
+            part_time_income=part_time_income,
+            filing_status=self.base_input_data.get('taxFilingStatus', 'single')
+        )
+        return grid.top_k(metric=metric, k=top_k, chunk_size=chunk_size)
 
 def create_path_comparison(input_data: Dict[str, Any]) -> PathBuilder:
     """
@@ -0,0 +1,373 @@
+"""
+Batched college x occupation screening for PathBuilder.
+
+Running calculate_projection for every combination of ~6,500 colleges and ~830
+occupations would take millions of full projections. This module instead runs
+a reduced screening model of an education path for a whole block of
+combinations at once, with NumPy arrays of shape (colleges, occupations), and
+keeps only a running top-K per metric. No yearly breakdowns are materialized.
+
+Screening model, per college c and occupation o, for years 0..yearsToProject:
+    - The first D years are spent in school, where D is 2 for community
+      colleges and 4 otherwise. Each school year costs tuition + room and
+      board, growing at the education cost growth rate, and is financed by
+      an education loan at EDUCATION_LOAN_INTEREST_RATE.
+    - Optional part-time income during school, growing at the income growth rate.
+    - After graduation the salary is the occupation salary times the
+      PathBuilder education multiplier, grown at the income growth rate
+      (the same as add_education_path).
+    - Taxes come from TaxCalculator, interpolated from a table over the income range.
+    - After graduation, living expenses (the base input's expenditures, growing
+      with the cost of living) are paid first. Any surplus pays down the
+      education loan and then goes to savings. Deficits draw savings down, and
+      negative savings accrue interest at the personal loan rate.
+
+Metrics:
+    netWorth                 final savings minus the remaining education loan
+    presentValueOfEarnings   discounted gross income (as compare_paths reports it)
+    debtFreeYear             first year the education loan is fully repaid
+"""
+
+import heapq
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # First try direct imports (these will work when executed directly)
+    from models.tax import TaxCalculator
+    from constants import (
+        EDUCATION_LOAN_INTEREST_RATE, DEFAULT_PERSONAL_LOAN_INTEREST_RATE,
+        DEFAULT_TAX_FILING_STATUS, DEFAULT_TAX_STANDARD_DEDUCTION_SINGLE,
+        DEFAULT_TAX_STANDARD_DEDUCTION_MARRIED, DEFAULT_TAX_ADDITIONAL_DEDUCTIONS,
+        DEFAULT_TAX_CREDITS
+    )
+except ImportError:
+    # Fallback to full imports (these will work when executed from parent directory)
+    from server.python.models.tax import TaxCalculator
+    from server.python.constants import (
+        EDUCATION_LOAN_INTEREST_RATE, DEFAULT_PERSONAL_LOAN_INTEREST_RATE,
+        DEFAULT_TAX_FILING_STATUS, DEFAULT_TAX_STANDARD_DEDUCTION_SINGLE,
+        DEFAULT_TAX_STANDARD_DEDUCTION_MARRIED, DEFAULT_TAX_ADDITIONAL_DEDUCTIONS,
+        DEFAULT_TAX_CREDITS
+    )
+
+
+# Metric name -> True if larger values rank higher
+GRID_METRICS = {
+    'netWorth': True,
+    'presentValueOfEarnings': True,
+    'debtFreeYear': False,
+}
+
+DEFAULT_CHUNK_SIZE = 256
+DEFAULT_SAVINGS_RATE = 0.02
+DEFAULT_LIVING_EXPENSES = 30000
+TAX_TABLE_STEP = 250
+
+# Sentinel for combinations whose loan is never repaid within the projection
+NEVER = 10 ** 6
+
+
+def _number(value: Any) -> Optional[float]:
+    """Convert a reference data cell to a float, or None if it is empty."""
+    if value is None or value == '':
+        return None
+    try:
+        return float(str(value).replace(',', ''))
+    except ValueError:
+        return None
+
+
+def college_duration(college: Dict[str, Any]) -> int:
+    """
+    Get the number of school years for a college.
+
+    Args:
+        college: College record
+
+    Returns:
+        2 for community colleges and 2-year schools, otherwise 4
+    """
+    text = f"{college.get('name', '')} {college.get('type', '')}".lower()
+    if 'community' in text or '2-year' in text or 'two-year' in text:
+        return 2
+    return 4
+
+
+class _TaxTable:
+    """Piecewise-linear table of total tax by gross income, built from TaxCalculator."""
+
+    def __init__(self, max_income: float, filing_status: str):
+        if filing_status.lower() == 'married':
+            standard_deduction = DEFAULT_TAX_STANDARD_DEDUCTION_MARRIED
+        else:
+            standard_deduction = DEFAULT_TAX_STANDARD_DEDUCTION_SINGLE
+        top = int(max_income // TAX_TABLE_STEP + 2) * TAX_TABLE_STEP
+        self.incomes = list(range(0, top + 1, TAX_TABLE_STEP))
+        self.taxes = [
+            TaxCalculator(income=income, filing_status=filing_status).calculate_all_taxes(
+                standard_deduction=standard_deduction,
+                additional_deductions=DEFAULT_TAX_ADDITIONAL_DEDUCTIONS,
+                tax_credits=DEFAULT_TAX_CREDITS
+            )['total_tax']
+            for income in self.incomes
+        ]
+        if np is not None:
+            self._incomes_array = np.array(self.incomes, dtype=float)
+            self._taxes_array = np.array(self.taxes, dtype=float)
+
+    def tax(self, income: float) -> float:
+        """Total tax for one income."""
+        if income <= 0:
+            return 0.0
+        index = min(int(income // TAX_TABLE_STEP), len(self.incomes) - 2)
+        low, high = self.taxes[index], self.taxes[index + 1]
+        return low + (high - low) * (income - self.incomes[index]) / TAX_TABLE_STEP
+
+    def tax_array(self, incomes: Any) -> Any:
+        """Total tax for an array of incomes."""
+        return np.interp(incomes, self._incomes_array, self._taxes_array)
+
+
+class PathGrid:
+    """Screening model over every combination of a set of colleges and occupations."""
+
+    def __init__(self, colleges: List[Dict[str, Any]], occupations: List[Dict[str, Any]],
+                 years_to_project: int = 20,
+                 education_multipliers: Optional[Dict[int, float]] = None,
+                 income_growth: float = 0.03,
+                 cost_of_living_growth: float = 0.02,
+                 education_cost_growth: float = 0.04,
+                 discount_rate: float = 0.03,
+                 initial_savings: float = 0,
+                 living_expenses: float = DEFAULT_LIVING_EXPENSES,
+                 part_time_income: float = 0,
+                 savings_rate: float = DEFAULT_SAVINGS_RATE,
+                 filing_status: str = DEFAULT_TAX_FILING_STATUS):
+        """
+        Initialize the grid.
+
+        Colleges without a (non-zero) tuition and occupations without a salary are skipped.
+
+        Args:
+            colleges: College records (id, name, type, tuition, roomAndBoard)
+            occupations: Occupation records (id, title, salary)
+            years_to_project: Number of years after the start of school to project
+            education_multipliers: Salary multiplier by school duration in years
+            income_growth: Annual income growth rate
+            cost_of_living_growth: Annual growth rate of living expenses
+            education_cost_growth: Annual growth rate of education costs
+            discount_rate: Discount rate for the present value of earnings
+            initial_savings: Savings at the start of school
+            living_expenses: Annual living expenses after graduation, in today's dollars
+            part_time_income: Annual part-time income while in school, in today's dollars
+            savings_rate: Annual return on positive savings
+            filing_status: Tax filing status
+        """
+        self.colleges = [c for c in colleges if _number(c.get('tuition'))]
+        self.occupations = [o for o in occupations if _number(o.get('salary'))]
+        self.years = years_to_project
+        self.multipliers = dict(education_multipliers or {2: 1.15, 4: 1.30})
+        self.income_growth = income_growth
+        self.cost_of_living_growth = cost_of_living_growth
+        self.education_cost_growth = education_cost_growth
+        self.discount_rate = discount_rate
+        self.initial_savings = initial_savings
+        self.living_expenses = living_expenses
+        self.part_time_income = part_time_income
+        self.savings_rate = savings_rate
+
+        self.durations = [college_duration(c) for c in self.colleges]
+        for duration in set(self.durations):
+            self.multipliers.setdefault(duration, 1.0)
+        self._multiplier_rows = {duration: row for row, duration in enumerate(sorted(self.multipliers))}
+        self._tables: Optional[Tuple[Any, Any]] = None
+        self.annual_costs = [
+            _number(c.get('tuition')) + (_number(c.get('roomAndBoard')) or 0)
+            for c in self.colleges
+        ]
+        self.salaries = [_number(o.get('salary')) for o in self.occupations]
+
+        top_salary = max(self.salaries, default=0) * max(self.multipliers.values(), default=1)
+        max_income = max(top_salary, part_time_income) * (1 + income_growth) ** years_to_project
+        self.tax_table = _TaxTable(max_income, filing_status)
+
+    def __len__(self) -> int:
+        return len(self.colleges) * len(self.occupations)
+
+    def _describe(self, college_index: int, occupation_index: int,
+                  metrics: Tuple[float, float, int]) -> Dict[str, Any]:
+        """Build the result entry for one combination."""
+        college = self.colleges[college_index]
+        occupation = self.occupations[occupation_index]
+        net_worth, present_value, debt_free_year = metrics
+        return {
+            'collegeId': college.get('id'),
+            'collegeName': college.get('name'),
+            'occupationId': occupation.get('id'),
+            'occupationTitle': occupation.get('title'),
+            'educationYears': self.durations[college_index],
+            'netWorth': round(float(net_worth), 2),
+            'presentValueOfEarnings': round(float(present_value), 2),
+            'debtFreeYear': None if debt_free_year >= NEVER else int(debt_free_year)
+        }
+
+    def _simulate_pair(self, college_index: int, occupation_index: int) -> Tuple[float, float, int]:
+        """
+        Run the screening model for one combination (pure Python).
+
+        Returns:
+            (final net worth, present value of earnings, debt-free year)
+        """
+        duration = self.durations[college_index]
+        annual_cost = self.annual_costs[college_index]
+        salary = self.salaries[occupation_index] * self.multipliers.get(duration, 1.0)
+
+        savings = float(self.initial_savings)
+        loan = 0.0
+        present_value = 0.0
+        debt_free_year = NEVER
+        for year in range(self.years + 1):
+            growth = (1 + self.income_growth) ** year
+            if year < duration:
+                gross = self.part_time_income * growth
+                loan = loan * (1 + EDUCATION_LOAN_INTEREST_RATE) + annual_cost * (1 + self.education_cost_growth) ** year
+                cash = gross - self.tax_table.tax(gross)
+            else:
+                gross = salary * growth
+                living = self.living_expenses * (1 + self.cost_of_living_growth) ** year
+                cash = gross - self.tax_table.tax(gross) - living
+                loan *= 1 + EDUCATION_LOAN_INTEREST_RATE
+                payment = min(loan, max(cash, 0.0))
+                loan -= payment
+                cash -= payment
+                if loan <= 0.5 and debt_free_year == NEVER:
+                    debt_free_year = year
+            rate = self.savings_rate if savings >= 0 else DEFAULT_PERSONAL_LOAN_INTEREST_RATE
+            savings = savings * (1 + rate) + cash
+            present_value += gross / (1 + self.discount_rate) ** year
+        return savings - loan, present_value, debt_free_year
+
+    def _income_tables(self) -> Tuple[Any, Any]:
+        """
+        Build the post-graduation gross and after-tax salary tables (NumPy).
+
+        Salaries depend only on the education multiplier, the occupation and the
+        year, so taxes are computed once per grid rather than once per college.
+
+        Returns:
+            (gross, after-tax) arrays of shape (multipliers, occupations, years)
+        """
+        if self._tables is None:
+            multipliers = np.array([self.multipliers[d] for d in sorted(self.multipliers)], dtype=float)
+            salaries = np.array(self.salaries, dtype=float)
+            growth = (1 + self.income_growth) ** np.arange(self.years + 1, dtype=float)
+            gross = multipliers[:, None, None] * salaries[None, :, None] * growth[None, None, :]
+            self._tables = (gross, gross - self.tax_table.tax_array(gross))
+        return self._tables
+
+    def _simulate_block(self, college_slice: slice) -> Tuple[Any, Any, Any]:
+        """
+        Run the screening model for a block of colleges against every occupation (NumPy).
+
+        Returns:
+            (net worth, present value, debt-free year) arrays of shape (colleges, occupations)
+        """
+        gross_table, net_table = self._income_tables()
+        durations = np.array(self.durations[college_slice], dtype=np.int64)
+        annual_costs = np.array(self.annual_costs[college_slice], dtype=float)
+        multiplier_rows = np.array([self._multiplier_rows[int(d)] for d in durations], dtype=np.int64)
+        shape = (len(durations), len(self.occupations))
+
+        savings = np.full(shape, float(self.initial_savings))
+        loan = np.zeros(shape)
+        present_value = np.zeros(shape)
+        debt_free_year = np.full(shape, NEVER, dtype=np.int64)
+
+        for year in range(self.years + 1):
+            growth = (1 + self.income_growth) ** year
+            in_school = (durations > year)[:, None]
+
+            part_time = self.part_time_income * growth
+            part_time_net = part_time - self.tax_table.tax(part_time)
+            gross_work = gross_table[multiplier_rows, :, year]
+            living = self.living_expenses * (1 + self.cost_of_living_growth) ** year
+            work_cash = net_table[multiplier_rows, :, year] - living
+
+            school_cost = (annual_costs * (1 + self.education_cost_growth) ** year)[:, None]
+            loan = loan * (1 + EDUCATION_LOAN_INTEREST_RATE) + np.where(in_school, school_cost, 0.0)
+            payment = np.where(in_school, 0.0, np.minimum(loan, np.maximum(work_cash, 0.0)))
+            loan -= payment
+            cash = np.where(in_school, part_time_net, work_cash - payment)
+
+            newly_free = ~in_school & (loan <= 0.5) & (debt_free_year == NEVER)
+            debt_free_year[newly_free] = year
+
+            rate = np.where(savings >= 0, self.savings_rate, DEFAULT_PERSONAL_LOAN_INTEREST_RATE)
+            savings = savings * (1 + rate) + cash
+            gross = np.where(in_school, part_time, gross_work)
+            present_value += gross / (1 + self.discount_rate) ** year
+
+        return savings - loan, present_value, debt_free_year
+
+    def top_k(self, metric: str = 'netWorth', k: int = 20,
+              chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        """
+        Rank every combination and return the best k.
+
+        Args:
+            metric: One of GRID_METRICS
+            k: Number of combinations to return
+            chunk_size: Colleges evaluated per NumPy block (bounds memory use)
+
+        Returns:
+            The best combinations, best first, with all three metrics
+        """
+        if metric not in GRID_METRICS:
+            raise ValueError(f"Unknown grid metric '{metric}', expected one of {sorted(GRID_METRICS)}")
+        if k <= 0 or not self.colleges or not self.occupations:
+            return []
+        descending = GRID_METRICS[metric]
+        metric_index = ('netWorth', 'presentValueOfEarnings', 'debtFreeYear').index(metric)
+
+        if np is None:
+            return self._top_k_python(metric_index, descending, k)
+
+        # Running best: (score, college index, occupation index, metrics)
+        best: List[Tuple[float, int, int, Tuple[float, float, int]]] = []
+        num_occupations = len(self.occupations)
+        for start in range(0, len(self.colleges), chunk_size):
+            block = self._simulate_block(slice(start, start + chunk_size))
+            scores = block[metric_index].astype(float).ravel()
+            if descending:
+                scores = -scores
+            take = min(k, scores.size)
+            if take < scores.size:
+                # Keep every score tied with the k-th best so the heap, not argpartition, breaks the ties
+                kth = np.partition(scores, take - 1)[take - 1]
+                candidates = np.flatnonzero(scores <= kth)
+            else:
+                candidates = np.arange(scores.size)
+            for flat in candidates.tolist():
+                row, column = divmod(flat, num_occupations)
+                metrics = (block[0][row, column], block[1][row, column], int(block[2][row, column]))
+                best.append((float(scores[flat]), start + row, column, metrics))
+            best = heapq.nsmallest(k, best, key=lambda item: (item[0], item[1], item[2]))
+
+        return [self._describe(college, occupation, metrics) for _, college, occupation, metrics in best]
+
+    def _top_k_python(self, metric_index: int, descending: bool, k: int) -> List[Dict[str, Any]]:
+        """Rank every combination without NumPy (practical for small grids only)."""
+        def scored() -> Iterable[Tuple[float, int, int, Tuple[float, float, int]]]:
+            for college in range(len(self.colleges)):
+                for occupation in range(len(self.occupations)):
+                    metrics = self._simulate_pair(college, occupation)
+                    score = float(metrics[metric_index])
+                    yield (-score if descending else score, college, occupation, metrics)
+
+        best = heapq.nsmallest(k, scored(), key=lambda item: (item[0], item[1], item[2]))
+        return [self._describe(college, occupation, metrics) for _, college, occupation, metrics in best]
@@ -0,0 +1,204 @@
+"""
+Projection results with on-demand sections.
+
+A full projection carries a few sections that are rarely looked at: the loan
+breakdowns, the per-year tax rates, the milestone echo and the per-liability
+loan schedules. A ProjectionResult keeps those out of the response until they
+are read. The loan schedules are held as a builder over the retained engine
+state and only computed on first read; the other sections come out of the
+main projection pass anyway, so they are withheld already computed and only
+their serialization is saved.
+
+Results are kept in a ResultStore under an opaque id so that the API can return
+the common series first and serve the deferred sections on a follow-up request.
+The store lives in the memory of the process that ran the projection, so the
+follow-up request has to reach that same process: serve lazy projections from a
+single API worker (not multi-worker uvicorn or the PreforkServer pool), or the
+follow-up answers 404 as if the result had expired.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Any, Callable, List, Optional
+
+
+class ProjectionResult(dict):
+    """
+    Dictionary of projection series whose deferred sections are added on first access.
+
+    Deferred sections, whether withheld values or builders, behave like missing
+    keys for iteration, len() and "in", which is what keeps them out of the
+    serialized response, but indexing or get() adds them (running the builder
+    if there is one).
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None,
+                 sections: Optional[Dict[str, Callable[[], Any]]] = None,
+                 withheld: Optional[Dict[str, Any]] = None):
+        """
+        Initialize a projection result.
+
+        Args:
+            data: Series that are part of the response
+            sections: Builders for sections computed on first read, keyed by section name
+            withheld: Already computed sections kept out of the response until read
+        """
+        super().__init__(data or {})
+        self._sections: Dict[str, Callable[[], Any]] = dict(sections or {})
+        self._withheld: Dict[str, Any] = dict(withheld or {})
+
+    def __missing__(self, key: str) -> Any:
+        if key in self._withheld:
+            value = self._withheld.pop(key)
+        else:
+            builder = self._sections.pop(key, None)
+            if builder is None:
+                raise KeyError(key)
+            value = builder()
+        self[key] = value
+        return value
+
+    def __reduce__(self):
+        # Builders close over engine state and cannot be pickled; send everything evaluated
+        return (ProjectionResult, (dict(self.materialize()),))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if self.has_section(key):
+            return self[key]
+        return default
+
+    def has_section(self, name: str) -> bool:
+        """
+        Check whether a section is available, evaluated or not.
+
+        Args:
+            name: Section name
+
+        Returns:
+            True if the section is present or deferred
+        """
+        return dict.__contains__(self, name) or name in self._withheld or name in self._sections
+
+    def pending_sections(self) -> List[str]:
+        """
+        List the deferred sections that have not been read yet.
+
+        Returns:
+            Section names
+        """
+        return list(self._withheld) + list(self._sections)
+
+    def materialize(self) -> 'ProjectionResult':
+        """
+        Add every deferred section to the result.
+
+        Returns:
+            This result, with all sections present
+        """
+        for name in self.pending_sections():
+            self[name]
+        return self
+
+
+class ResultStore:
+    """
+    Bounded, thread-safe store of recent projection results keyed by result id.
+
+    Results are held in this process only; another worker process cannot see
+    them and treats their ids as unknown.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 900.0):
+        """
+        Initialize the store.
+
+        Args:
+            max_entries: Number of results to keep before evicting the least recently used
+            ttl_seconds: Seconds a result stays available after it was stored
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, result: ProjectionResult) -> str:
+        """
+        Store a result.
+
+        Args:
+            result: Projection result to keep
+
+        Returns:
+            The id to fetch it with
+        """
+        result_id = uuid.uuid4().hex
+        with self._lock:
+            self._entries[result_id] = (time.monotonic() + self.ttl_seconds, result)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result_id
+
+    def get(self, result_id: str) -> Optional[ProjectionResult]:
+        """
+        Look up a stored result.
+
+        Args:
+            result_id: Id returned by put()
+
+        Returns:
+            The result, or None if it is unknown or has expired
+        """
+        with self._lock:
+            entry = self._entries.get(result_id)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._entries[result_id]
+                return None
+            self._entries.move_to_end(result_id)
+            return result
+
+    def get_section(self, result_id: str, name: str) -> Any:
+        """
+        Evaluate (if needed) and return one section of a stored result.
+
+        Args:
+            result_id: Id returned by put()
+            name: Section name
+
+        Returns:
+            The section value
+
+        Raises:
+            KeyError: If the result or the section does not exist
+        """
+        result = self.get(result_id)
+        if result is None:
+            raise KeyError(f"Result '{result_id}' has expired or is held by another worker")
+        if not result.has_section(name):
+            raise KeyError(f"Result has no section '{name}'")
+        # Builders touch shared engine state, so evaluate under the store lock
+        with self._lock:
+            return result[name]
+
+
+_default_store: Optional[ResultStore] = None
+
+
+def get_default_result_store() -> ResultStore:
+    """
+    Get the process-wide result store.
+
+    Each worker process has its own store, so a deferred section can only be
+    fetched from the worker that ran the projection.
+
+    Returns:
+        The shared ResultStore
+    """
+    global _default_store
+    if _default_store is None:
+        _default_store = ResultStore()
+    return _default_store
@@ -0,0 +1,100 @@
+"""
+Serialization helpers for projection responses.
+
+Projection results contain dozens of yearly series, so encoding them is a
+noticeable share of response time on long horizons. This module uses orjson
+when it is installed and falls back to the standard library encoder, and both
+paths accept NumPy arrays and scalars directly without converting them to
+Python lists first.
+"""
+
+import json
+from array import array
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Name of the encoder in use, reported by diagnostics and benchmarks
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+if orjson is not None:
+    # OPT_NON_STR_KEYS keeps parity with json.dumps, which accepts int keys
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """
+    Convert values neither encoder handles natively.
+
+    orjson serializes NumPy arrays itself and only reaches this hook for
+    unusual dtypes; the standard library encoder reaches it for every array.
+
+    Args:
+        obj: Object the encoder could not serialize
+
+    Returns:
+        A JSON-compatible equivalent
+    """
+    if np is not None:
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+    if isinstance(obj, array):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=_default, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def dumps_str(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as str
+    """
+    return dumps(obj).decode('utf-8')
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
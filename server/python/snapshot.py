@@ -0,0 +1,250 @@
+"""
+Binary snapshot of the DataLoader reference tables.
+
+A snapshot holds the college and occupation tables with their values already
+typed, so DataLoader can load them without parsing any text: integer and
+decimal columns are stored as typed little-endian arrays, every string is
+stored once in a shared, interned string table (text columns hold indexes into
+it), and each table carries its id index. The colleges' net prices are stored
+as the parsed fee matrix, so feesByIncome is never evaluated at load time.
+
+Layout:
+    4 bytes   magic b'LPDS'
+    1 byte    format version
+    1 byte    reserved (0)
+    4 bytes   header length, unsigned little-endian
+    N bytes   UTF-8 JSON header
+    ...       block payloads, concatenated in the order the header lists them
+
+The header is {"strings": [...], "tables": {...}, "feeMatrices": {...}}. Each
+table is {"rows": n, "columns": [[field, kind], ...], "ids": k}; its blocks
+are its columns in order, then the id index (k string indexes of the ids and
+k row positions). A column's kind is 'q' (int64, None stored as the minimum
+int64), 'd' (float64, None stored as NaN) or 's' (int32 string indexes).
+Each fee matrix is {"brackets": [...]} followed by one block of rows x
+brackets float64 prices.
+
+Build a snapshot from the CSV files in the data directory with
+    python snapshot.py [data_dir]
+or from the database with  python export_data.py --snapshot
+"""
+
+import json
+import math
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGIC = b'LPDS'
+FORMAT_VERSION = 1
+SNAPSHOT_FILE = 'reference_data.snapshot'
+
+_PREAMBLE = struct.Struct('<4sBBI')
+_INT_NULL = -2 ** 63
+_TYPECODES = {'q': 'q', 'd': 'd', 's': 'i'}
+_BIG_ENDIAN_HOST = sys.byteorder == 'big'
+
+
+def _column_kind(values: List[Any]) -> str:
+    kind = 'q'
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return 's'
+        if isinstance(value, float) or not _INT_NULL < value < 2 ** 63:
+            kind = 'd'
+    return kind
+
+
+def _to_bytes(values: array) -> bytes:
+    if _BIG_ENDIAN_HOST:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if _BIG_ENDIAN_HOST:
+        values.byteswap()
+    return values
+
+
+class Snapshot:
+    """Tables, id indexes and fee matrix prices read from a snapshot file."""
+
+    def __init__(self, tables: Dict[str, List[Dict[str, Any]]], id_indexes: Dict[str, Dict[str, int]],
+                 fee_matrices: Dict[str, Tuple[List[str], Any]], mtime: float = 0.0):
+        """
+        Initialize the snapshot.
+
+        Args:
+            tables: Records of each table, keyed by the table's CSV file name
+            id_indexes: str(id) -> row position of each table
+            fee_matrices: (bracket labels, row-major prices) by table name
+            mtime: Modification time of the snapshot file
+        """
+        self.tables = tables
+        self.id_indexes = id_indexes
+        self.fee_matrices = fee_matrices
+        self.mtime = mtime
+
+
+def write_snapshot(path: str, tables: Dict[str, List[Dict[str, Any]]],
+                   fee_matrices: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Write tables to a snapshot file.
+
+    The file is written to a temporary name and renamed into place, so readers
+    never see a partial snapshot.
+
+    Args:
+        path: Snapshot file path
+        tables: Records of each table, keyed by the table's CSV file name
+        fee_matrices: FeeMatrix of each table that has one, keyed the same way
+    """
+    strings: List[str] = []
+    string_codes: Dict[str, int] = {}
+
+    def encode(value: Any) -> int:
+        text = '' if value is None else value if isinstance(value, str) else str(value)
+        code = string_codes.get(text)
+        if code is None:
+            code = string_codes[text] = len(strings)
+            strings.append(text)
+        return code
+
+    header: Dict[str, Any] = {'strings': strings, 'tables': {}, 'feeMatrices': {}}
+    blocks: List[bytes] = []
+    for name, records in tables.items():
+        fields: Dict[str, None] = {}
+        for record in records:
+            fields.update(dict.fromkeys(record))
+        columns = []
+        for field in fields:
+            values = [record.get(field) for record in records]
+            kind = _column_kind(values)
+            if kind == 's':
+                packed = array('i', [encode(value) for value in values])
+            elif kind == 'q':
+                packed = array('q', [_INT_NULL if value is None else value for value in values])
+            else:
+                packed = array('d', [math.nan if value is None else float(value) for value in values])
+            blocks.append(_to_bytes(packed))
+            columns.append([field, kind])
+
+        id_positions: Dict[str, int] = {}
+        for position, record in enumerate(records):
+            id_positions.setdefault(str(record.get('id', '')), position)
+        blocks.append(_to_bytes(array('i', [encode(key) for key in id_positions])))
+        blocks.append(_to_bytes(array('i', id_positions.values())))
+        header['tables'][name] = {'rows': len(records), 'columns': columns, 'ids': len(id_positions)}
+
+    for name, matrix in (fee_matrices or {}).items():
+        if np is not None:
+            prices = array('d', np.asarray(matrix.prices, dtype=float).ravel().tolist())
+        else:
+            prices = array('d', [price for row in matrix.prices for price in row])
+        blocks.append(_to_bytes(prices))
+        header['feeMatrices'][name] = {'brackets': list(matrix.brackets)}
+
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, len(header_bytes)))
+        f.write(header_bytes)
+        for block in blocks:
+            f.write(block)
+    os.replace(temp_path, path)
+
+
+def read_snapshot(path: str) -> Snapshot:
+    """
+    Read a snapshot file.
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        The snapshot's tables, id indexes and fee matrix prices
+
+    Raises:
+        ValueError: If the file is not a snapshot or is truncated
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+        mtime = os.fstat(f.fileno()).st_mtime
+    if len(data) < _PREAMBLE.size:
+        raise ValueError("Not a data snapshot")
+    magic, version, _, header_length = _PREAMBLE.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Not a data snapshot, or an unsupported snapshot version")
+    offset = _PREAMBLE.size + header_length
+    header = json.loads(data[_PREAMBLE.size:offset].decode('utf-8'))
+    strings = [sys.intern(text) for text in header['strings']]
+
+    def block(typecode: str, count: int) -> array:
+        nonlocal offset
+        size = count * array(typecode).itemsize
+        if offset + size > len(data):
+            raise ValueError("Truncated data snapshot")
+        values = _from_bytes(typecode, data[offset:offset + size])
+        offset += size
+        return values
+
+    tables: Dict[str, List[Dict[str, Any]]] = {}
+    id_indexes: Dict[str, Dict[str, int]] = {}
+    for name, table in header['tables'].items():
+        rows = table['rows']
+        fields = []
+        columns = []
+        for field, kind in table['columns']:
+            values = block(_TYPECODES[kind], rows)
+            if kind == 's':
+                column = [strings[code] for code in values]
+            elif kind == 'q':
+                column = [None if value == _INT_NULL else value for value in values]
+            else:
+                column = [None if value != value else value for value in values]
+            fields.append(field)
+            columns.append(column)
+        tables[name] = [dict(zip(fields, row)) for row in zip(*columns)] if fields else [{} for _ in range(rows)]
+        keys = block('i', table['ids'])
+        positions = block('i', table['ids'])
+        id_indexes[name] = dict(zip([strings[code] for code in keys], positions))
+
+    fee_matrices: Dict[str, Tuple[List[str], Any]] = {}
+    for name, matrix in header['feeMatrices'].items():
+        rows = header['tables'][name]['rows'] if name in header['tables'] else 0
+        fee_matrices[name] = (matrix['brackets'], block('d', rows * len(matrix['brackets'])))
+
+    return Snapshot(tables, id_indexes, fee_matrices, mtime)
+
+
+def main() -> None:
+    """Write a snapshot of the CSV tables in a data directory."""
+    try:
+        from data_loader import DataLoader
+    except ImportError:
+        from server.python.data_loader import DataLoader
+
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else None
+    loader = DataLoader(data_dir)
+    colleges = loader.get_college_data()
+    tables = {'college_data.csv': colleges, 'occupation_data.csv': loader.get_occupation_data()}
+    path = os.path.join(loader.data_dir, SNAPSHOT_FILE)
+    write_snapshot(path, tables, {'college_data.csv': loader.get_fee_matrix()})
+    print(f"Wrote {path} ({len(colleges)} colleges, {len(tables['occupation_data.csv'])} occupations)")
+
+
+if __name__ == "__main__":
+    main()
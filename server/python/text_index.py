@@ -0,0 +1,87 @@
+"""
+In-memory trigram index for substring search over reference tables.
+
+The typeahead search boxes send a query per keystroke, and a case-insensitive
+substring test against every row of a 6,500 row table adds up quickly. The
+index maps every three-character sequence of the searchable fields to the rows
+that contain it, so a query only has to be checked against the rows that
+contain all of its trigrams. Shorter sequences are indexed too, which makes
+queries of up to three characters a single lookup.
+"""
+
+from typing import Dict, Any, List, Sequence, Set, Tuple
+
+GRAM_SIZE = 3
+
+
+def _grams(text: str, size: int = GRAM_SIZE) -> Set[str]:
+    """
+    Get the distinct n-grams of a string.
+
+    Args:
+        text: Lower-cased text
+        size: Length of the n-grams
+
+    Returns:
+        Set of n-grams (empty if the text is shorter than one n-gram)
+    """
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class TrigramIndex:
+    """Case-insensitive substring index over one or more fields of a list of records."""
+
+    def __init__(self, records: List[Dict[str, Any]], fields: Sequence[str]):
+        """
+        Build the index.
+
+        Args:
+            records: Records to index; search results are positions in this list
+            fields: Names of the fields to search
+        """
+        self.records = records
+        self.fields = tuple(fields)
+        self._texts: List[Tuple[str, ...]] = []
+        self._postings: Dict[str, Set[int]] = {}
+
+        for position, record in enumerate(records):
+            texts = tuple(
+                str(record.get(field)).lower() if record.get(field) is not None else ''
+                for field in self.fields
+            )
+            self._texts.append(texts)
+            for text in texts:
+                for size in range(1, GRAM_SIZE + 1):
+                    for gram in _grams(text, size):
+                        self._postings.setdefault(gram, set()).add(position)
+
+    def search(self, query: str) -> List[int]:
+        """
+        Find the records with a field containing the query.
+
+        Args:
+            query: Substring to look for (case-insensitive)
+
+        Returns:
+            Positions of the matching records, in record order
+        """
+        query = query.lower()
+
+        if len(query) <= GRAM_SIZE:
+            # The query is itself an indexed n-gram, so its postings are exact
+            return sorted(self._postings.get(query, ()))
+
+        postings = []
+        for gram in _grams(query):
+            rows = self._postings.get(gram)
+            if not rows:
+                return []
+            postings.append(rows)
+        postings.sort(key=len)
+        candidates = sorted(postings[0].intersection(*postings[1:]))
+
+        # A row can contain every trigram without containing the whole query, so verify
+        return [
+            position for position in candidates
+            if any(query in text for text in self._texts[position])
+        ]
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Pre-fork worker server for the financial calculator.
+
+The parent process loads the reference data (colleges, occupations, location
+tables), the tax tables and the projection constants once, then forks a fixed
+number of workers that serve projection requests over a Unix domain socket.
+Workers inherit the loaded data through copy-on-write pages, so a request pays
+no per-process setup cost and N workers use far less memory than N
+independently started calculator processes.
+
+Protocol:
+    Every message in either direction is a 4-byte big-endian length prefix
+    followed by a UTF-8 encoded JSON document. A request is the same payload
+    calculator.py reads from stdin (including 'pathType'); the response is the
+    same JSON document calculator.py prints. A connection may carry any number
+    of request/response pairs.
+
+Reloading:
+    Send the parent SIGHUP after updating the data files. The parent loads the
+    new data, forks a new set of workers, and tells the old workers to retire:
+    each one stops accepting connections and exits once its current connection
+    is closed, so in-flight requests finish on the data they started with.
+
+Usage:
+    python worker_server.py --socket /tmp/launch_plan.sock --workers 4
+"""
+
+import argparse
+import errno
+import gc
+import json
+import os
+import select
+import signal
+import socket
+import struct
+import traceback
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    # First try direct imports (these will work when executed directly)
+    from calculator import run_projection
+    from data_loader import get_default_data_loader, reload_default_data_loader
+    from serialization import dumps, loads
+except ImportError:
+    # Fallback to full imports (these will work when executed from parent directory)
+    from server.python.calculator import run_projection
+    from server.python.data_loader import get_default_data_loader, reload_default_data_loader
+    from server.python.serialization import dumps, loads
+
+
+DEFAULT_SOCKET_PATH = '/tmp/launch_plan_calculator.sock'
+DEFAULT_BACKLOG = 128
+
+# Frame header: unsigned 32-bit payload length, network byte order
+FRAME_HEADER = struct.Struct('!I')
+MAX_FRAME_SIZE = 64 * 1024 * 1024  # Reject anything larger than 64 MB
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    """
+    Read exactly size bytes from a socket.
+
+    Args:
+        sock: Connected socket
+        size: Number of bytes to read
+
+    Returns:
+        The bytes read, or None if the peer closed the connection before sending any
+    """
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = sock.recv(remaining)
+        if not chunk:
+            if remaining == size:
+                return None
+            raise ConnectionError("Connection closed in the middle of a frame")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def send_message(sock: socket.socket, payload: bytes) -> None:
+    """
+    Send one length-prefixed frame.
+
+    Args:
+        sock: Connected socket
+        payload: Encoded message body
+    """
+    sock.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def recv_message(sock: socket.socket) -> Optional[bytes]:
+    """
+    Receive one length-prefixed frame.
+
+    Args:
+        sock: Connected socket
+
+    Returns:
+        The message body, or None when the peer has closed the connection
+    """
+    header = _recv_exact(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {size} bytes exceeds the {MAX_FRAME_SIZE} byte limit")
+    body = _recv_exact(sock, size)
+    return body if body is not None else b''
+
+
+def handle_request(body: bytes) -> bytes:
+    """
+    Decode a request frame, run the projection and encode the response.
+
+    Args:
+        body: JSON request body
+
+    Returns:
+        JSON response body
+    """
+    try:
+        input_data = loads(body)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        return dumps({"error": f"Invalid JSON input: {str(e)}"})
+
+    try:
+        result = run_projection(input_data)
+    except Exception as e:
+        stack_trace = traceback.format_exc()
+        with open('calculator_error.log', 'a') as f:
+            f.write("\n--- ERROR IN WORKER SERVER ---\n")
+            f.write(f"Error: {str(e)}\n")
+            f.write(f"Stack trace:\n{stack_trace}\n")
+            f.write("--- END ERROR ---\n\n")
+        result = {"error": str(e), "stack_trace": stack_trace}
+
+    return dumps(result)
+
+
+class PreforkServer:
+    """Serves projection requests from a pool of forked worker processes."""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, workers: int = 2,
+                 max_requests: int = 0):
+        """
+        Initialize the server.
+
+        Args:
+            socket_path: Filesystem path of the Unix domain socket
+            workers: Number of worker processes to fork
+            max_requests: Recycle a worker after this many requests (0 = never)
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.socket_path = socket_path
+        self.num_workers = workers
+        self.max_requests = max_requests
+        self.listener: Optional[socket.socket] = None
+        self.worker_pids: List[int] = []
+        # Workers of previous data generations that are finishing their connections
+        self.retiring_pids: List[int] = []
+        self._running = False
+        self._reload_requested = False
+        # Self-pipe the parent's signal handlers wake the supervision loop through
+        self._wakeup_fds: Optional[Tuple[int, int]] = None
+        # Set in a worker when it has been told to retire
+        self._retiring = False
+
+    def load_reference_data(self) -> None:
+        """
+        Load everything the workers share before any worker is forked.
+
+        The calculator, tax and constants modules are already imported at this
+        point; this loads the DataLoader tables into the shared process-wide loader.
+        """
+        get_default_data_loader().preload()
+        # Move everything loaded so far out of the collector's view so that
+        # garbage collection in the workers does not write to (and therefore
+        # copy) the pages holding the shared reference data
+        gc.collect()
+        gc.freeze()
+
+    def reload_reference_data(self) -> None:
+        """
+        Load a new generation of the reference data and replace the workers.
+
+        New workers are forked from the reloaded parent before the old ones are
+        told to retire, so the socket is never left without a worker.
+        """
+        reload_default_data_loader()
+        gc.collect()
+        gc.freeze()
+        previous = self.worker_pids
+        self.worker_pids = []
+        for _ in range(self.num_workers):
+            self._spawn_worker()
+        for pid in previous:
+            try:
+                os.kill(pid, signal.SIGHUP)
+                self.retiring_pids.append(pid)
+            except ProcessLookupError:
+                pass
+        print(f"Reference data reloaded; retiring {len(previous)} workers")
+
+    def bind(self) -> None:
+        """Create the listening Unix domain socket, replacing a stale socket file."""
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(self.socket_path)
+        self.listener.listen(DEFAULT_BACKLOG)
+
+    def serve_forever(self) -> None:
+        """
+        Load data, fork the workers and supervise them until shut down.
+
+        Must be called from the main thread, which receives the signals.
+        """
+        self.load_reference_data()
+        self.bind()
+        self._running = True
+
+        # The signal handlers only set flags; Python writes every handled signal
+        # to the wakeup pipe, which ends the select in the supervision loop
+        wakeup_r, wakeup_w = os.pipe()
+        os.set_blocking(wakeup_r, False)
+        os.set_blocking(wakeup_w, False)
+        self._wakeup_fds = (wakeup_r, wakeup_w)
+        signal.set_wakeup_fd(wakeup_w)
+        signal.signal(signal.SIGTERM, self._handle_shutdown)
+        signal.signal(signal.SIGINT, self._handle_shutdown)
+        signal.signal(signal.SIGHUP, self._handle_reload)
+        signal.signal(signal.SIGCHLD, self._handle_child_exit)
+
+        for _ in range(self.num_workers):
+            self._spawn_worker()
+
+        print(f"Calculator server listening on {self.socket_path} with {self.num_workers} workers")
+
+        try:
+            while self._running:
+                if self._reload_requested:
+                    self._reload_requested = False
+                    self.reload_reference_data()
+                if not self._reap_workers():
+                    break
+                # A signal that arrived since the flags were checked has already
+                # written to the pipe, so this returns at once instead of missing it
+                select.select([wakeup_r], [], [])
+                try:
+                    while os.read(wakeup_r, 512):
+                        pass
+                except BlockingIOError:
+                    pass
+        finally:
+            self.shutdown()
+            signal.set_wakeup_fd(-1)
+            for fd in self._wakeup_fds:
+                os.close(fd)
+            self._wakeup_fds = None
+
+    def _reap_workers(self) -> bool:
+        """
+        Collect every worker that has exited, replacing current workers
+        (crash or max_requests recycling) while the server is running.
+
+        Returns:
+            False when there are no worker processes left at all
+        """
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return False
+            if pid == 0:
+                return True
+            if pid in self.retiring_pids:
+                self.retiring_pids.remove(pid)
+            elif pid in self.worker_pids:
+                self.worker_pids.remove(pid)
+                if self._running:
+                    self._spawn_worker()
+
+    def shutdown(self) -> None:
+        """Stop all workers and remove the socket file."""
+        self._running = False
+        for pid in self.worker_pids + self.retiring_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in self.worker_pids + self.retiring_pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self.worker_pids = []
+        self.retiring_pids = []
+        if self.listener is not None:
+            self.listener.close()
+            self.listener = None
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+    def _handle_shutdown(self, signum, frame) -> None:
+        """Signal handler for SIGTERM/SIGINT in the parent: stop the supervision loop."""
+        self._running = False
+
+    def _handle_reload(self, signum, frame) -> None:
+        """Signal handler for SIGHUP in the parent: reload from the supervision loop."""
+        self._reload_requested = True
+
+    def _handle_child_exit(self, signum, frame) -> None:
+        """Signal handler for SIGCHLD in the parent; installed so the signal wakes the loop."""
+
+    def _spawn_worker(self) -> None:
+        """Fork one worker process."""
+        pid = os.fork()
+        if pid == 0:
+            # Child: never return into the parent's supervision loop
+            exit_code = 0
+            try:
+                signal.set_wakeup_fd(-1)
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                if self._wakeup_fds is not None:
+                    for fd in self._wakeup_fds:
+                        os.close(fd)
+                self._worker_loop()
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        self.worker_pids.append(pid)
+
+    def _worker_loop(self) -> None:
+        """Accept connections and answer requests until told to stop."""
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        # SIGHUP (retire) wakes the select below through this pipe
+        retire_r, retire_w = os.pipe()
+        os.set_blocking(retire_w, False)
+
+        def handle_retire(signum, frame):
+            self._retiring = True
+            try:
+                os.write(retire_w, b'\0')
+            except BlockingIOError:
+                pass
+
+        signal.signal(signal.SIGHUP, handle_retire)
+        # Workers wait in select and may lose the race for a connection, so accept must not block
+        self.listener.setblocking(False)
+
+        handled = 0
+        while (self.max_requests <= 0 or handled < self.max_requests) and not self._retiring:
+            readable, _, _ = select.select([self.listener, retire_r], [], [])
+            if retire_r in readable:
+                break
+            try:
+                conn, _ = self.listener.accept()
+            except (BlockingIOError, InterruptedError):
+                continue
+            conn.setblocking(True)
+            with conn:
+                while True:
+                    try:
+                        body = recv_message(conn)
+                    except (ConnectionError, ValueError) as e:
+                        print(f"Worker {os.getpid()}: dropping connection: {str(e)}")
+                        break
+                    if body is None:
+                        break
+                    response = handle_request(body)
+                    handled += 1
+                    try:
+                        send_message(conn, response)
+                    except OSError as e:
+                        if e.errno not in (errno.EPIPE, errno.ECONNRESET):
+                            raise
+                        break
+                    if self._retiring or (self.max_requests > 0 and handled >= self.max_requests):
+                        break
+
+
+def request_projection(payload: Dict[str, Any], socket_path: str = DEFAULT_SOCKET_PATH,
+                       timeout: Optional[float] = 30.0) -> Dict[str, Any]:
+    """
+    Client helper: send one projection request to a running worker server.
+
+    Args:
+        payload: Request payload (same format as calculator.py stdin input)
+        socket_path: Path of the server's Unix domain socket
+        timeout: Socket timeout in seconds (None to block)
+
+    Returns:
+        Decoded projection result
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        send_message(sock, dumps(payload))
+        response = recv_message(sock)
+    if response is None:
+        raise ConnectionError("Server closed the connection without responding")
+    return loads(response)
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Pre-fork financial calculator server")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH,
+                        help="Path of the Unix domain socket to listen on")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2,
+                        help="Number of worker processes")
+    parser.add_argument('--max-requests', type=int, default=0,
+                        help="Recycle each worker after this many requests (0 = never)")
+    args = parser.parse_args()
+
+    server = PreforkServer(args.socket, args.workers, args.max_requests)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Zip-code income, investment and home value table built from attached_assets/Zip_Code_Income.csv.
+
+The file has about 27,700 rows of State, zipcode, Mean Income, Estimated
+Investments and Home_Value, with the numbers comma-formatted ("88,909.31") and
+blank where unknown. Each state also has a summary row under zip code 00000.
+The values are parsed once into typed arrays (NaN where blank) and a zip code
+maps to its row through a 100,000-entry array indexed by the numeric zip.
+"""
+
+import csv
+import math
+from array import array
+from typing import Dict, Any, List, Optional
+
+try:
+    from location_costs import normalize_zip, ZIP_CODE_SPACE
+except ImportError:
+    from server.python.location_costs import normalize_zip, ZIP_CODE_SPACE
+
+# Dataset column -> key used in income records (the keys get_irs_data has always returned)
+INCOME_COLUMNS = {
+    'Mean Income': 'avgIncome',
+    'Estimated Investments': 'avgInvestments',
+    'Home_Value': 'avgHomeValue'
+}
+
+STATE_SUMMARY_ZIP = '00000'
+
+
+def parse_amount(value: Optional[str]) -> float:
+    """
+    Parse a comma-formatted dollar amount.
+
+    Args:
+        value: Cell text such as '88,909.31', '4703' or ''
+
+    Returns:
+        The amount, or NaN if the cell is blank or not a number
+    """
+    text = (value or '').replace(',', '').replace('$', '').strip()
+    if not text:
+        return math.nan
+    try:
+        return float(text)
+    except ValueError:
+        return math.nan
+
+
+def _record(values: Dict[str, float]) -> Dict[str, Any]:
+    return {key: (None if math.isnan(value) else value) for key, value in values.items()}
+
+
+class ZipIncomeTable:
+    """Mean income, estimated investments and home value by zip code, with state-level fallbacks."""
+
+    def __init__(self, rows: List[Dict[str, str]]):
+        """
+        Build the table.
+
+        Args:
+            rows: Rows of Zip_Code_Income.csv as read by csv.DictReader
+        """
+        self._row_of_zip = array('i', [-1]) * ZIP_CODE_SPACE
+        self.zip_codes: List[str] = []
+        self.states: List[str] = []
+        self.columns: Dict[str, array] = {key: array('d') for key in INCOME_COLUMNS.values()}
+        summaries: Dict[str, Dict[str, float]] = {}
+
+        for row in rows:
+            zip_code = normalize_zip(row.get('zipcode'))
+            state = (row.get('State') or '').strip().upper()
+            if zip_code is None:
+                continue
+            values = {key: parse_amount(row.get(column)) for column, key in INCOME_COLUMNS.items()}
+            if zip_code == STATE_SUMMARY_ZIP:
+                summaries[state] = values
+                continue
+            if self._row_of_zip[int(zip_code)] >= 0:
+                continue
+            self._row_of_zip[int(zip_code)] = len(self.zip_codes)
+            self.zip_codes.append(zip_code)
+            self.states.append(state)
+            for key, value in values.items():
+                self.columns[key].append(value)
+
+        # State values: the state's summary row, with blanks filled by the mean of its zip codes
+        sums: Dict[str, Dict[str, List[float]]] = {}
+        for position, state in enumerate(self.states):
+            state_sums = sums.setdefault(state, {key: [0.0, 0] for key in self.columns})
+            for key, values in self.columns.items():
+                if not math.isnan(values[position]):
+                    state_sums[key][0] += values[position]
+                    state_sums[key][1] += 1
+        self.state_values: Dict[str, Dict[str, float]] = {}
+        for state in set(summaries) | set(sums):
+            summary = summaries.get(state, {})
+            values = {}
+            for key in self.columns:
+                value = summary.get(key, math.nan)
+                if math.isnan(value):
+                    total, count = sums.get(state, {}).get(key, (0.0, 0))
+                    value = round(total / count, 2) if count else math.nan
+                values[key] = value
+            self.state_values[state] = values
+
+    @classmethod
+    def from_csv(cls, path: str) -> 'ZipIncomeTable':
+        """
+        Load the table from Zip_Code_Income.csv.
+
+        Args:
+            path: Path to the CSV file
+
+        Returns:
+            Loaded table
+        """
+        with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+            return cls(list(csv.DictReader(f)))
+
+    def __len__(self) -> int:
+        return len(self.zip_codes)
+
+    def get(self, zip_code: Any) -> Optional[Dict[str, Any]]:
+        """
+        Look up one zip code.
+
+        Args:
+            zip_code: Zip code
+
+        Returns:
+            Income record (None for values the dataset leaves blank), or None if the zip is not in the table
+        """
+        zip_code = normalize_zip(zip_code)
+        if zip_code is None or zip_code == STATE_SUMMARY_ZIP:
+            return None
+        position = self._row_of_zip[int(zip_code)]
+        if position < 0:
+            return None
+        record = {'zipCode': zip_code, 'state': self.states[position]}
+        record.update(_record({key: values[position] for key, values in self.columns.items()}))
+        return record
+
+    def get_state(self, state: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Get a state's summary values.
+
+        Args:
+            state: Two-letter state code
+
+        Returns:
+            Income record for the state, or None if the state is unknown
+        """
+        state = (state or '').strip().upper()
+        values = self.state_values.get(state)
+        if values is None:
+            return None
+        record = {'zipCode': None, 'state': state, 'stateAverage': True}
+        record.update(_record(values))
+        return record
+
+    def lookup(self, zip_code: Any, state: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a zip code, falling back to its state.
+
+        Blank values of a known zip code are filled from the zip's state.
+
+        Args:
+            zip_code: Zip code
+            state: State to fall back to if the zip code is not in the table
+
+        Returns:
+            Income record, or None if neither the zip code nor the state is known
+        """
+        record = self.get(zip_code)
+        if record is None:
+            return self.get_state(state)
+        state_record = self.get_state(record['state']) or {}
+        for key in self.columns:
+            if record[key] is None:
+                record[key] = state_record.get(key)
+        return record
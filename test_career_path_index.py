@@ -0,0 +1,73 @@
+"""
+Test script for the field-of-study career path index.
+Checks that careers from Top_5_Career_Paths_by_Field_of_Study.csv are linked to
+occupation records at load time, that ambiguous careers are left unlinked, and that
+loose field names resolve to a field only on a distinctive word.
+"""
+
+import sys
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+from data_loader import DataLoader
+
+
+def test_careers_linked_to_occupations():
+    """Careers carry the id and salary of their occupation record."""
+    loader = DataLoader()
+    careers = loader.get_career_path_data("Engineering")
+    assert [career["option"] for career in careers] == [1, 2, 3, 4, 5]
+
+    civil = next(career for career in careers if career["title"] == "Civil Engineer")
+    occupation = loader.get_occupation_by_id(civil["occupationId"])
+    assert occupation["title"] == "Civil Engineers"
+    assert civil["salary"] == occupation["salary"]
+
+    for career in careers:
+        print(f"{career['title']} -> {career['occupationTitle']} ({career['salary']})")
+
+
+def test_ambiguous_careers_left_unlinked():
+    """Careers that only a qualified occupation contains get no occupation rather than a wrong salary."""
+    index = DataLoader().get_career_path_index()
+    links = {career["title"]: career for careers in index.fields.values() for career in careers}
+
+    for title in ("Laboratory Technician", "Medical Technician", "Researcher", "Biologist", "Language Teacher"):
+        assert links[title]["occupationId"] is None and links[title]["salary"] is None, title
+    # An occupation that lists the career as one of its alternatives is a match
+    assert links["Writer"]["occupationTitle"] == "Writers and Authors"
+    assert links["Translator"]["occupationTitle"] == "Interpreters and Translators"
+    linked = sum(career["occupationId"] is not None for career in links.values())
+    print(f"{linked} of {len(links)} careers linked to an occupation")
+
+
+def test_field_name_resolution():
+    """Field names resolve by token overlap; unknown fields fall back to the sample paths."""
+    loader = DataLoader()
+    index = loader.get_career_path_index()
+    assert index.resolve_field("Computer Science") == "Computer and Information Sciences and Support Services"
+    assert index.resolve_field("  engineering ") == "Engineering"
+    assert loader.get_career_path_data("Computer Science") is loader.get_career_path_data("computer sciences")
+
+    # No dataset field mentions nursing: the existing career path data answers
+    assert loader.get_career_path_data("Nursing")[0]["title"] == "Registered Nurse"
+    assert loader.get_career_path_data("Underwater Basket Weaving") == []
+
+    # 'Science' is in too many fields to make a match on its own
+    for name in ("Nursing Science", "Political Science", "Health Science", "Data Science", "Fire Science"):
+        assert index.resolve_field(name) != "Physical Sciences", name
+    assert index.resolve_field("Political Science") is None
+    assert index.resolve_field("Health Science") == "Health Professions and Related Programs"
+    print(f"{len(index.fields)} fields of study indexed")
+
+
+if __name__ == "__main__":
+    print("Testing career path links...")
+    test_careers_linked_to_occupations()
+    print("\nTesting ambiguous careers...")
+    test_ambiguous_careers_left_unlinked()
+    print("\nTesting field name resolution...")
+    test_field_name_resolution()
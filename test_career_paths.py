@@ -110,5 +110,35 @@ def test_career_path_comparison():
     print("\nAll assertions passed!")
     return True
 
+def test_iter_career_paths():
+    """Streamed career path results should be keyed uniquely and match the batch comparison."""
+    import threading
+    
+    calculator = FinancialCalculator.from_input_data({"startAge": 18, "yearsToProject": 10})
+    paths = [
+        {"type": "immediate_work", "startYear": 0, "initialIncome": 45000},
+        {"type": "immediate_work", "startYear": 0, "initialIncome": 60000},
+        {"id": "trade-school", "type": "vocational", "educationType": "vocational", "startYear": 0, "duration": 2,
+         "workStatus": "part-time", "partTimeIncome": 12000}
+    ]
+    
+    streamed = dict(calculator.iter_career_paths(paths))
+    assert list(streamed) == ["immediate_work", "immediate_work_2", "trade-school"]
+    assert streamed["immediate_work_2"]["totalIncome"] > streamed["immediate_work"]["totalIncome"]
+    
+    parallel = calculator.compare_career_paths(paths, max_workers=2)
+    assert list(parallel) == list(streamed)
+    assert json.dumps(parallel, sort_keys=True, default=str) == json.dumps(streamed, sort_keys=True, default=str)
+    
+    # Setting the cancel event stops the remaining paths
+    cancel = threading.Event()
+    received = []
+    for path_id, _ in calculator.iter_career_paths(paths, cancel_event=cancel):
+        received.append(path_id)
+        cancel.set()
+    assert received == ["immediate_work"]
+    print("Streamed career paths:", list(streamed))
+
 if __name__ == "__main__":
-    test_career_path_comparison() 
\ No newline at end of file
+    test_career_path_comparison()
+    test_iter_career_paths() 
\ No newline at end of file
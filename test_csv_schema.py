@@ -0,0 +1,55 @@
+"""
+Test script for the schema-driven CSV loading in DataLoader.
+Checks that declared columns get one deterministic type per column, including
+thousands separators, negative numbers, blank cells and zero-padded zip codes.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+from data_loader import DataLoader
+
+
+def test_typed_columns():
+    """Declared columns are typed by the schema; undeclared columns are inferred."""
+    with tempfile.TemporaryDirectory() as data_dir:
+        (Path(data_dir) / "irs_data.csv").write_text(
+            "zipCode,avgIncome,medianIncome,avgHomeValue,avgInvestments,note\n"
+            '02138,"125,750",-1200,,825000.5,007\n'
+            "98101,110250,87500,725000,215000,-42\n"
+        )
+        # No asset tables in the directory, so get_irs_data reads irs_data.csv
+        loader = DataLoader(data_dir=data_dir, assets_dir=data_dir)
+        cambridge = loader.get_irs_data("02138")
+        seattle = loader.get_irs_data("98101")
+
+    print(cambridge)
+    assert cambridge["avgIncome"] == 125750.0
+    assert cambridge["medianIncome"] == -1200.0
+    assert cambridge["avgHomeValue"] is None
+    assert all(isinstance(seattle[key], float) for key in ("avgIncome", "medianIncome", "avgHomeValue"))
+    # Undeclared columns: zero-padded values stay strings, plain numbers are parsed
+    assert cambridge["note"] == "007" and seattle["note"] == -42
+
+
+def test_college_types():
+    """Every college row has the same type per numeric column, None where blank."""
+    colleges = DataLoader().get_college_data()
+    for college in colleges:
+        assert isinstance(college["tuition"], int)
+        assert college["acceptanceRate"] is None or isinstance(college["acceptanceRate"], float)
+        assert college["rating"] is None or isinstance(college["rating"], float)
+        assert isinstance(college["feesByIncome"], str)
+    print(f"{len(colleges)} colleges typed consistently")
+
+
+if __name__ == "__main__":
+    print("Testing typed columns...")
+    test_typed_columns()
+    print("\nTesting college column types...")
+    test_college_types()
@@ -0,0 +1,55 @@
+"""
+Test script for hot reloading the reference data.
+Checks that a changed data file produces a new loader generation once the file
+stops changing, and that a request pinned to the old generation keeps seeing it.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+import data_loader
+from data_loader import DataFileWatcher, DataLoader, get_default_data_loader, pinned_data_loader
+
+OCCUPATIONS = "id,title,description,salary,growthRate,education,category\n1,Actuaries,Actuaries,{salary},fast,Bachelor's,Finance\n"
+
+
+def test_reload_swaps_generation():
+    """Pinned requests finish on the old tables; new requests see the reloaded file."""
+    previous_default = data_loader._default_loader
+    with tempfile.TemporaryDirectory() as data_dir:
+        occupation_file = Path(data_dir) / "occupation_data.csv"
+        occupation_file.write_text(OCCUPATIONS.format(salary=100000))
+        data_loader._default_loader = DataLoader(data_dir=data_dir, assets_dir=data_dir).preload()
+        try:
+            watcher = DataFileWatcher()
+            assert not watcher.check()
+
+            with pinned_data_loader() as pinned:
+                occupation_file.write_text(OCCUPATIONS.format(salary=125000))
+                stat = occupation_file.stat()
+                os.utime(occupation_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+                # The first check only notices the change, the second one (file unchanged since) reloads
+                assert not watcher.check()
+                assert watcher.check()
+
+                assert get_default_data_loader() is pinned
+                assert pinned.get_occupation_by_id("1")["salary"] == 100000
+
+            reloaded = get_default_data_loader()
+            assert reloaded is not pinned
+            assert reloaded.get_occupation_by_id("1")["salary"] == 125000
+            assert not watcher.check()
+            print("Pinned generation kept salary 100000, reloaded generation has 125000")
+        finally:
+            data_loader._default_loader = previous_default
+
+
+if __name__ == "__main__":
+    print("Testing data reload...")
+    test_reload_swaps_generation()
@@ -0,0 +1,295 @@
+"""
+Test script for the database export in export_data.py.
+Runs the exports against an in-memory stand-in for psycopg2 (the real driver and
+database are not needed) and checks the file handling: id ranges, joining partition
+files, merging changed rows, the row hash watermark of incremental exports, and that
+pooled exports, partitioned or not, write the same CSV as the original exporter.
+"""
+
+import csv
+import hashlib
+import os
+import re
+import sys
+import tempfile
+import threading
+import types
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+
+class FakeDatabase:
+    """Tables of rows, answering the handful of statement shapes export_data.py issues."""
+
+    def __init__(self, tables):
+        # name -> (columns, rows); the first column is the id
+        self.tables = tables
+
+    def run(self, sql, params):
+        if "pg_export_snapshot" in sql:
+            return ["snapshot"], [("00000003-1",)]
+        if sql.startswith("SET TRANSACTION"):
+            return [], []
+        columns, rows = self.tables[re.search(r"FROM (\w+)", sql).group(1)]
+        if "min(t.id)" in sql:
+            ids = [row[0] for row in rows]
+            return ["min", "max"], [(min(ids), max(ids)) if ids else (None, None)]
+        if "md5(t::text)" in sql:
+            return ["id", "md5"], [(str(row[0]), hashlib.md5(repr(row).encode()).hexdigest()) for row in rows]
+        if "= ANY(%s)" in sql:
+            rows = [row for row in rows if str(row[0]) in params[0]]
+        elif "t.id >= %s AND t.id < %s" in sql:
+            rows = [row for row in rows if params[0] <= row[0] < params[1]]
+        return columns, list(rows)
+
+
+class FakeCursor:
+    def __init__(self, database):
+        self.database = database
+        self.description = None
+        self.itersize = 2000
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        while self._rows:
+            yield self._rows.pop(0)
+
+    def execute(self, sql, params=None):
+        columns, self._rows = self.database.run(" ".join(sql.split()), params)
+        self.description = [(column,) for column in columns]
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size):
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, database):
+        self.database = database
+
+    def cursor(self, name=None, cursor_factory=None):
+        return FakeCursor(self.database)
+
+    def set_session(self, **kwargs):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakePool:
+    """Stand-in for psycopg2.pool.ThreadedConnectionPool."""
+
+    def __init__(self, minconn, maxconn, dsn):
+        self.maxconn = maxconn
+        self.in_use = 0
+        self._lock = threading.Lock()
+
+    def getconn(self):
+        with self._lock:
+            self.in_use += 1
+            assert self.in_use <= self.maxconn, "pool exhausted"
+        return FakeConnection(fake_psycopg2.database)
+
+    def putconn(self, conn):
+        with self._lock:
+            self.in_use -= 1
+
+    def closeall(self):
+        assert self.in_use == 0, "connection not returned to the pool"
+
+
+def import_export_data():
+    """Import export_data with psycopg2 (and python-dotenv, if missing) replaced by stand-ins."""
+    fake_psycopg2 = types.ModuleType("psycopg2")
+    fake_psycopg2.connect = lambda dsn: FakeConnection(fake_psycopg2.database)
+    fake_pool = types.ModuleType("psycopg2.pool")
+    fake_pool.ThreadedConnectionPool = FakePool
+    fake_psycopg2.pool = fake_pool
+    stand_ins = {"psycopg2": fake_psycopg2, "psycopg2.pool": fake_pool}
+    try:
+        import dotenv  # noqa: F401
+    except ImportError:
+        stand_ins["dotenv"] = types.ModuleType("dotenv")
+        stand_ins["dotenv"].load_dotenv = lambda *args, **kwargs: None
+
+    saved = {name: sys.modules.get(name) for name in stand_ins}
+    sys.modules.update(stand_ins)
+    try:
+        sys.modules.pop("export_data", None)
+        import export_data
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+    return export_data, fake_psycopg2
+
+
+export_data, fake_psycopg2 = import_export_data()
+
+QUERY = "SELECT id, name FROM widgets"
+
+
+def read_rows(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_id_ranges():
+    """Ranges cover every id exactly once with exclusive upper bounds."""
+    conn = FakeConnection(FakeDatabase({"widgets": (["id", "name"], [(i, f"w{i}") for i in range(3, 13)])}))
+    ranges = export_data.id_ranges(conn, QUERY, 3)
+    assert ranges == [(3, 7), (7, 11), (11, 13)]
+    assert export_data.id_ranges(conn, QUERY, 100)[-1] == (12, 13)
+    empty = FakeConnection(FakeDatabase({"widgets": (["id", "name"], [])}))
+    assert export_data.id_ranges(empty, QUERY, 4) == []
+
+
+def test_concatenate_parts():
+    """Parts are joined under a single header; empty parts and the part files go away."""
+    with tempfile.TemporaryDirectory() as data_dir:
+        parts = [os.path.join(data_dir, f"widgets.csv.part{i}") for i in range(3)]
+        Path(parts[0]).write_bytes(b"id,name\r\n1,a\r\n2,b\r\n")
+        Path(parts[1]).write_bytes(b"")
+        Path(parts[2]).write_bytes(b"id,name\r\n5,\"c, d\"\r\n")
+        target = os.path.join(data_dir, "widgets.csv")
+        export_data.concatenate_parts(parts, target)
+        assert Path(target).read_bytes() == b"id,name\r\n1,a\r\n2,b\r\n5,\"c, d\"\r\n"
+        assert not any(os.path.exists(part) for part in parts)
+
+
+def test_merge_rows():
+    """Changed rows are replaced in place, new rows appended and deleted rows dropped."""
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = os.path.join(data_dir, "widgets.csv")
+        Path(path).write_text("id,name\r\n1,a\r\n2,b\r\n3,c\r\n")
+        export_data.merge_rows(path, ["id", "name"], {"2": (2, "B"), "4": (4, "d")}, {"3"})
+        assert read_rows(path) == [["id", "name"], ["1", "a"], ["2", "B"], ["4", "d"]]
+
+
+def test_incremental_watermark():
+    """Incremental exports merge only changes, and a full export in between discards the watermark."""
+    rows = [(1, "A"), (2, "B"), (3, "C")]
+    database = FakeDatabase({"widgets": (["id", "name"], rows)})
+    conn = FakeConnection(database)
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = os.path.join(data_dir, "widgets.csv")
+
+        # No watermark yet: a full export that leaves one behind
+        assert export_data.export_incremental(conn, "widgets", QUERY, path) == (3, 0)
+        assert os.path.exists(export_data.watermark_path(path))
+        assert export_data.export_incremental(conn, "widgets", QUERY, path) == (0, 0)
+
+        rows[1] = (2, "ZZ")
+        del rows[2]
+        rows.append((4, "D"))
+        assert export_data.export_incremental(conn, "widgets", QUERY, path) == (2, 1)
+        assert read_rows(path) == [["id", "name"], ["1", "A"], ["2", "ZZ"], ["4", "D"]]
+
+        # A full export rewrites the CSV, so the watermark no longer describes it
+        rows[1] = (2, "YY")
+        export_data.export_query(conn, "widgets", QUERY, path)
+        assert not os.path.exists(export_data.watermark_path(path))
+        rows[1] = (2, "ZZ")
+        export_data.export_incremental(conn, "widgets", QUERY, path)
+        assert read_rows(path) == [["id", "name"], ["1", "A"], ["2", "ZZ"], ["4", "D"]]
+        assert export_data.export_incremental(conn, "widgets", QUERY, path) == (0, 0)
+    print("Incremental exports track changes across full exports")
+
+
+def test_snapshot_discards_watermarks():
+    """A snapshot export discards the watermarks of the CSV files next to it."""
+    college_columns = ["id", "name", "location", "state", "type", "tuition", "roomAndBoard",
+                       "acceptanceRate", "rating", "size", "rank", "feesByIncome"]
+    fake_psycopg2.database = FakeDatabase({
+        "colleges": (college_columns, [(1, "State U", "Austin, TX", "TX", "Public", 9000, 12000,
+                                        60.5, 3.9, "large", 1, {"0-30000": 4000, "30001-48000": 6000})]),
+        "careers": (["id", "title", "description", "salary", "growthRate", "education", "category"],
+                    [(7, "Nurse", "Registered Nurse", 75000, "fast", "Bachelor's", "Health")])
+    })
+    with tempfile.TemporaryDirectory() as data_dir:
+        watermarks = [export_data.watermark_path(os.path.join(data_dir, name))
+                      for name in ("college_data.csv", "occupation_data.csv")]
+        for watermark in watermarks:
+            Path(watermark).write_text("{}")
+        export_data.export_snapshot(os.path.join(data_dir, "reference_data.snapshot"))
+        assert os.path.exists(os.path.join(data_dir, "reference_data.snapshot"))
+        assert not any(os.path.exists(watermark) for watermark in watermarks)
+
+
+def write_original_export(rows, path):
+    """Write a table the way export_data.py did before the streaming export (fetchall + DictWriter)."""
+    with open(path, 'w', newline='') as f:
+        if rows:
+            writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def test_pooled_exports_match_original():
+    """Unpartitioned exports are byte-identical to the original exporter; partitioned ones match row for row."""
+    columns = ["id", "name", "location", "state", "type", "tuition", "roomAndBoard",
+               "acceptanceRate", "rating", "size", "rank", "feesByIncome"]
+    colleges = [(college_id, f"College {college_id}", 'Austin, "TX"', "TX", "Public", 9000 + college_id, None,
+                 55.25, None, "large", college_id % 7, {"0-30000": 4000 + college_id})
+                for college_id in (17, 3, 42, 8, 99, 23, 61, 5, 77, 30, 12, 88)]
+    fake_psycopg2.database = FakeDatabase({"colleges": (columns, colleges)})
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        expected = os.path.join(data_dir, "original.csv")
+        write_original_export([dict(zip(columns, row)) for row in colleges], expected)
+
+        single = os.path.join(data_dir, "single", "college_data.csv")
+        export_data.export_tables([("colleges", export_data.COLLEGES_QUERY, single)], workers=2)
+        assert Path(single).read_bytes() == Path(expected).read_bytes()
+
+        partitioned = os.path.join(data_dir, "partitioned", "college_data.csv")
+        export_data.export_tables([("colleges", export_data.COLLEGES_QUERY, partitioned)], partitions=4, workers=2)
+        header, *rows = read_rows(partitioned)
+        expected_header, *expected_rows = read_rows(expected)
+        assert header == expected_header
+        assert sorted(rows, key=lambda row: int(row[0])) == sorted(expected_rows, key=lambda row: int(row[0]))
+        assert os.listdir(os.path.dirname(partitioned)) == ["college_data.csv"]
+
+        try:
+            export_data.export_tables([("colleges", export_data.COLLEGES_QUERY, single)], incremental=True, partitions=4)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Partitioned incremental export was accepted")
+    print(f"Pooled exports match the original export of {len(colleges)} colleges")
+
+
+if __name__ == "__main__":
+    print("Testing id ranges...")
+    test_id_ranges()
+    print("\nTesting partition joining...")
+    test_concatenate_parts()
+    print("\nTesting row merging...")
+    test_merge_rows()
+    print("\nTesting the incremental watermark...")
+    test_incremental_watermark()
+    print("\nTesting snapshot exports...")
+    test_snapshot_discards_watermarks()
+    print("\nTesting pooled exports...")
+    test_pooled_exports_match_original()
@@ -0,0 +1,54 @@
+"""
+Test script for the feesByIncome net price matrix.
+Checks the parsed matrix against the raw college_data.csv strings.
+"""
+
+import ast
+import math
+import sys
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+from data_loader import DataLoader
+from fee_matrix import FeeMatrix
+
+
+def test_net_price_matches_raw_fees():
+    """net_price should return each college's price for the family's bracket."""
+    loader = DataLoader()
+    colleges = loader.get_college_data()
+    sample = colleges[::250]
+    ids = [college["id"] for college in sample]
+
+    prices = loader.net_price(ids, 52000)
+    assert len(prices) == len(sample)
+    for college, price in zip(sample, prices):
+        expected = ast.literal_eval(college["feesByIncome"])["48001-75000"]
+        if expected > 0:
+            assert price == expected, college["name"]
+        else:
+            # Zero means the college reported nothing for this bracket
+            assert math.isnan(price), college["name"]
+    print(f"Net prices for {len(sample)} colleges at $52,000: OK")
+
+
+def test_brackets_and_unknown_colleges():
+    """Open-ended brackets, gaps between brackets and unknown ids are handled."""
+    matrix = FeeMatrix([
+        {"id": "a", "feesByIncome": {"0-30000": 1000, "30001-48000": 2000, "110001+": 9000}},
+        {"id": "b", "feesByIncome": "{'0-30000': 500, '30001-48000': 0}"},
+        {"id": "c", "feesByIncome": None}
+    ])
+    assert matrix.brackets == ["0-30000", "30001-48000", "110001+"]
+    assert list(matrix.net_price(["a", "b"], 30000.5)) == [1000, 500]
+    assert list(matrix.net_price(["a"], 250000)) == [9000]
+    assert all(math.isnan(price) for price in matrix.net_price(["b", "c", "missing"], 40000))
+
+
+if __name__ == "__main__":
+    test_net_price_matches_raw_fees()
+    test_brackets_and_unknown_colleges()
+    print("Fee matrix tests passed!")
@@ -0,0 +1,102 @@
+"""
+Test script for field-pruned projections and lazy result sections.
+Checks that asking for a subset of fields, or deferring sections, returns exactly the same
+series as a full projection.
+"""
+
+import json
+import pickle
+import sys
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+from calculator import parse_fields, run_projection
+from financial_updated import FinancialCalculator
+from projection_result import ResultStore
+from serialization import dumps
+
+
+INPUT_DATA = {
+    "startAge": 22,
+    "yearsToProject": 20,
+    "assets": [{"type": "investment", "name": "Savings", "initialValue": 5000}],
+    "liabilities": [{"type": "student_loan", "name": "Student Loan", "initialBalance": 30000}],
+    "incomes": [{"type": "salary", "name": "Salary", "annualAmount": 45000}],
+    "expenditures": [
+        {"type": "housing", "name": "Rent", "annualAmount": 18000},
+        {"type": "living", "name": "Healthcare", "annualAmount": 4000},
+        {"type": "living", "name": "Food", "annualAmount": 9000}
+    ],
+    "milestones": [
+        {"type": "marriage", "year": 27},
+        {"type": "car_purchase", "year": 25},
+        {"type": "home_purchase", "year": 30}
+    ]
+}
+
+
+def test_pruned_fields_match_full_projection():
+    """Every requested field should match the full projection exactly."""
+    full = FinancialCalculator.from_input_data(INPUT_DATA).calculate_projection()
+
+    for fields in (["netWorth"], ["cashFlow", "healthcare"], ["housing", "food", "savingsValue", "assets"]):
+        pruned = FinancialCalculator.from_input_data(INPUT_DATA).calculate_projection(fields=fields)
+        assert set(pruned) == set(fields) | {"ages"}
+        for field in pruned:
+            assert pruned[field] == full[field], f"{field} differs from the full projection"
+        print(f"Fields {fields}: OK")
+
+
+def test_fields_option_parsing():
+    """The request option accepts lists and comma-separated strings and rejects unknown names."""
+    assert parse_fields(None) is None
+    assert parse_fields("netWorth, cashFlow") == ["netWorth", "cashFlow"]
+    assert parse_fields(["income"]) == ["income"]
+
+    result = run_projection(dict(INPUT_DATA, fields="netWorth,bogus"))
+    assert "error" in result and "bogus" in result["error"]
+
+    result = run_projection(dict(INPUT_DATA, fields=["netWorth"]))
+    assert set(result) == {"ages", "netWorth"}
+
+
+def test_lazy_sections():
+    """Deferred sections stay out of the response until read, then match the full projection."""
+    full = FinancialCalculator.from_input_data(INPUT_DATA).calculate_projection()
+    lazy = FinancialCalculator.from_input_data(INPUT_DATA).calculate_projection(lazy_sections=True)
+
+    pending = set(lazy.pending_sections())
+    assert pending == set(FinancialCalculator.LAZY_SECTIONS)
+    assert not pending & set(json.loads(dumps(lazy)))
+
+    store = ResultStore()
+    result_id = store.put(lazy)
+    assert store.get_section(result_id, "personalLoans") == full["personalLoans"]
+    assert lazy.get("effectiveTaxRate") == full["effectiveTaxRate"]
+    assert "personalLoans" in json.loads(dumps(lazy))
+
+    schedules = store.get_section(result_id, "loanSchedules")
+    assert schedules and all(len(schedule["balance"]) == len(full["ages"]) for schedule in schedules)
+
+    # Results live in one process's store; any other id reads as expired
+    try:
+        ResultStore().get_section(result_id, "personalLoans")
+    except KeyError as e:
+        assert "another worker" in e.args[0]
+    else:
+        raise AssertionError("Result found in a store that never held it")
+
+    # Pickling (e.g. returning from a worker process) evaluates everything
+    restored = pickle.loads(pickle.dumps(lazy))
+    assert set(FinancialCalculator.LAZY_SECTIONS) <= set(restored)
+    print(f"Deferred sections: {sorted(pending)}")
+
+
+if __name__ == "__main__":
+    test_pruned_fields_match_full_projection()
+    test_fields_option_parsing()
+    test_lazy_sections()
+    print("Field projection tests passed!")
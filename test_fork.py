@@ -0,0 +1,55 @@
+"""
+Test script for FinancialCalculator.fork().
+Checks that forked scenarios match independently parsed calculators and never affect each other.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+from financial_updated import FinancialCalculator
+
+
+INPUT_DATA = {
+    "startAge": 22,
+    "yearsToProject": 20,
+    "assets": [{"type": "investment", "name": "Savings", "initialValue": 5000}],
+    "liabilities": [{"type": "student_loan", "name": "Student Loan", "initialBalance": 30000}],
+    "incomes": [{"type": "salary", "name": "Salary", "annualAmount": 45000}],
+    "expenditures": [{"type": "housing", "name": "Rent", "annualAmount": 18000}],
+    "milestones": [{"type": "marriage", "year": 27}]
+}
+
+
+def _dump(result):
+    return json.dumps(result, sort_keys=True, default=str)
+
+
+def test_forks_are_independent():
+    """Projections on forks and on the parent should all match a freshly parsed calculator."""
+    expected = _dump(FinancialCalculator.from_input_data(INPUT_DATA).calculate_projection())
+
+    base = FinancialCalculator.from_input_data(INPUT_DATA)
+    first = base.fork()
+    second = base.fork()
+    assert _dump(first.calculate_projection()) == expected
+    assert _dump(second.calculate_projection()) == expected
+    assert _dump(base.calculate_projection()) == expected
+
+    # Changing a branch's inputs does not leak into the parent or its siblings
+    branch = FinancialCalculator.from_input_data(INPUT_DATA)
+    what_if = branch.fork()
+    what_if.add_milestone({"type": "car_purchase", "year": 25})
+    assert len(what_if.milestones) == len(branch.milestones) + 1
+    assert _dump(what_if.calculate_projection()) != expected
+    assert _dump(branch.calculate_projection()) == expected
+    print("Forked projections match the parsed calculator")
+
+
+if __name__ == "__main__":
+    test_forks_are_independent()
+    print("Fork tests passed!")
@@ -0,0 +1,139 @@
+"""
+Test script for the zip-code location tables and server-side defaults.
+Checks lookups against COLI by Location.csv and Zip_Code_Income.csv, that a zip code
+alone produces the same projection as sending the equivalent expenditures, and that
+housing milestones default to the local home value and are financed in proportion to it.
+"""
+
+import csv
+import json
+import sys
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+from constants import HOME_DOWN_PAYMENT_PERCENT
+from data_loader import DataLoader
+from financial_updated import FinancialCalculator
+
+
+def test_zip_lookup_and_state_fallback():
+    """Known zips return their row; unknown zips fall back to the state average."""
+    loader = DataLoader()
+    with open(Path(loader.assets_dir) / "COLI by Location.csv", newline="", encoding="utf-8-sig") as f:
+        row = next(r for r in csv.DictReader(f) if r["Zipcode"] == "98101")
+
+    costs = loader.get_location_costs("98101")
+    assert costs["state"] == "WA"
+    assert costs["housing"] == float(row["Housing"])
+    assert costs["income_adjustment_factor"] == float(row["Income Adjustment Factor"])
+
+    fallback = loader.get_location_costs("99999", state="wa")
+    assert fallback["stateAverage"] and fallback["state"] == "WA"
+    assert loader.get_location_costs("99999") is None
+    print(f"Seattle housing ${costs['housing']:,.0f}/month, WA average ${fallback['housing']:,.0f}/month")
+
+
+def test_zip_code_only_projection():
+    """Sending just a zip code should match sending the location's expenditures explicitly."""
+    costs = DataLoader().get_location_costs("98101")
+    base = {
+        "startAge": 22,
+        "yearsToProject": 10,
+        "incomes": [{"type": "salary", "name": "Salary", "annualAmount": 60000}]
+    }
+    explicit = dict(base, zipCode="98101", costOfLivingFactor=costs["income_adjustment_factor"], expenditures=[
+        {"type": "housing", "name": "Housing", "annualAmount": costs["housing"] * 12, "inflationRate": 0.03},
+        {"type": "transportation", "name": "Transportation", "annualAmount": costs["transportation"] * 12,
+         "inflationRate": 0.03, "auto_replace": False},
+        {"type": "living", "name": "Food", "annualAmount": costs["food"] * 12, "inflationRate": 0.03},
+        {"type": "living", "name": "Healthcare", "annualAmount": costs["healthcare"] * 12, "inflationRate": 0.04},
+        {"type": "living", "name": "Personal Insurance", "annualAmount": costs["personal_insurance"] * 12, "inflationRate": 0.03},
+        {"type": "living", "name": "Apparel", "annualAmount": costs["apparel"] * 12, "inflationRate": 0.02},
+        {"type": "living", "name": "Services", "annualAmount": costs["services"] * 12, "inflationRate": 0.03},
+        {"type": "living", "name": "Entertainment", "annualAmount": costs["entertainment"] * 12, "inflationRate": 0.02},
+        {"type": "living", "name": "Other", "annualAmount": costs["other"] * 12, "inflationRate": 0.02}
+    ])
+
+    from_zip = FinancialCalculator.from_input_data(dict(base, zipCode="98101")).calculate_projection()
+    from_expenditures = FinancialCalculator.from_input_data(explicit).calculate_projection()
+    assert json.dumps(from_zip, sort_keys=True, default=str) == json.dumps(from_expenditures, sort_keys=True, default=str)
+    print(f"Year 1 expenses from zip code only: ${from_zip['expenses'][1]:,.0f}")
+
+
+def test_state_tax_follows_zip_code():
+    """State income tax should come from the zip code's state instead of always Massachusetts."""
+    base = {
+        "startAge": 25,
+        "yearsToProject": 3,
+        "incomes": [{"type": "salary", "name": "Salary", "annualAmount": 90000}],
+        "expenditures": [{"type": "housing", "name": "Rent", "annualAmount": 20000}]
+    }
+    no_location = FinancialCalculator.from_input_data(base).calculate_projection()
+    seattle = FinancialCalculator.from_input_data(dict(base, zipCode="98101")).calculate_projection()
+    cambridge = FinancialCalculator.from_input_data(dict(base, zipCode="02138")).calculate_projection()
+    assert seattle["taxes"][1] < cambridge["taxes"][1]
+    assert cambridge["taxes"] == no_location["taxes"]
+
+
+def test_zip_income_and_home_value():
+    """Comma-formatted amounts are parsed, and blanks fall back to the state's values."""
+    loader = DataLoader()
+    anchorage = loader.get_irs_data("99501")
+    assert anchorage["state"] == "AK"
+    assert anchorage["avgIncome"] == 95266.67 and anchorage["avgHomeValue"] == 317684
+
+    alaska = loader.get_irs_data("00123", state="AK")
+    assert alaska["stateAverage"] and alaska["avgIncome"] == 88909.31
+    # 99505 has no home value in the file, so the state's is used
+    assert loader.get_irs_data("99505")["avgHomeValue"] == alaska["avgHomeValue"]
+
+    milestone_input = {
+        "startAge": 25,
+        "yearsToProject": 6,
+        "incomes": [{"type": "salary", "name": "Salary", "annualAmount": 90000}],
+        "expenditures": [{"type": "housing", "name": "Rent", "annualAmount": 20000}],
+        "milestones": [{"type": "home", "year": 3}]
+    }
+    default = FinancialCalculator.from_input_data(milestone_input).calculate_projection()
+    local = FinancialCalculator.from_input_data(dict(milestone_input, zipCode="99501")).calculate_projection()
+    assert default["homeValue"][3] == 300000
+    assert local["homeValue"][3] == 317684
+    print(f"Home value for 99501: ${local['homeValue'][3]:,}")
+
+
+def test_local_home_financing():
+    """Homes priced from local data get a proportional down payment and an amortized mortgage payment."""
+    milestone_input = {
+        "startAge": 25,
+        "yearsToProject": 6,
+        "zipCode": "62914",
+        "incomes": [{"type": "salary", "name": "Salary", "annualAmount": 90000}],
+        "expenditures": [{"type": "housing", "name": "Rent", "annualAmount": 20000}],
+        "milestones": [{"type": "home", "year": 3}]
+    }
+    # The lowest home value in the file, well below the old fixed $60,000 down payment
+    local = FinancialCalculator.from_input_data(milestone_input).calculate_projection()
+    assert local["homeValue"][3] == 26238
+    principal = 26238 - int(26238 * HOME_DOWN_PAYMENT_PERCENT)
+    assert local["mortgage"][3] == principal > 0
+
+    # The default payment is the loan amortized at the default term and rate, not a flat $1,800
+    monthly_payment = int(FinancialCalculator._mortgage_monthly_payment(principal))
+    assert 0 < monthly_payment < 200
+    for payment, matches in ((monthly_payment, True), (1800, False)):
+        explicit = dict(milestone_input, milestones=[{"type": "home", "year": 3, "homeMonthlyPayment": payment}])
+        debt = FinancialCalculator.from_input_data(explicit).calculate_projection()["debt"]
+        assert (debt == local["debt"]) == matches
+    print(f"Mortgage for 62914: ${principal:,} at ${monthly_payment}/month")
+
+
+if __name__ == "__main__":
+    test_zip_lookup_and_state_fallback()
+    test_zip_code_only_projection()
+    test_state_tax_follows_zip_code()
+    test_zip_income_and_home_value()
+    test_local_home_financing()
+    print("Location cost tests passed!")
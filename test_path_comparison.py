@@ -0,0 +1,105 @@
+"""
+Test script for PathBuilder comparisons run in worker processes and for the batched
+college x occupation ranking grid.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+from path_builder import create_path_comparison, EducationType
+
+
+def test_parallel_compare_paths():
+    """Running the paths in worker processes should give the same comparison as running them serially."""
+    input_data = {
+        "startAge": 18,
+        "yearsToProject": 20,
+        "careersData": [
+            {"id": "software-engineer", "title": "Software Engineer", "salary": 80000},
+            {"id": "software-engineer-entry", "title": "Junior Software Developer", "salary": 45000}
+        ]
+    }
+    
+    builder = create_path_comparison(input_data)
+    builder.add_immediate_work_path(occupation_id="software-engineer-entry")
+    builder.add_education_path(EducationType.FOUR_YEAR_COLLEGE, "software-engineer", base_education_cost=25000)
+    builder.add_education_path(EducationType.TWO_YEAR_COLLEGE, "software-engineer-entry", base_education_cost=15000)
+    
+    serial = builder.compare_paths()
+    parallel = builder.compare_paths(parallel=True, max_workers=2)
+    
+    # Paths sharing a type get distinct keys, in the order they were added
+    assert list(serial) == ["immediate_work", "education", "education_2"]
+    assert list(parallel) == list(serial)
+    assert json.dumps(parallel, sort_keys=True, default=str) == json.dumps(serial, sort_keys=True, default=str)
+    
+    # Paths run on forks of the base calculator, which is parsed once and never mutated
+    base = builder._get_base_calculator()
+    assert base.milestones == [] and base.results == {}
+    
+    # Streaming yields every path exactly once
+    streamed = dict(builder.iter_compare_paths(parallel=True, max_workers=2))
+    assert sorted(streamed) == sorted(serial)
+    
+    # A path's own id keys it, the same way compare_career_paths does
+    builder.paths[2]["id"] = "community_college"
+    assert list(builder.compare_paths()) == ["immediate_work", "education", "community_college"]
+    print("Parallel comparison matches serial comparison")
+
+
+def test_college_occupation_grid():
+    """The batched grid should rank combinations the same way with and without NumPy."""
+    import path_grid
+    
+    colleges = [
+        {"id": 1, "name": "State University", "type": "Public", "tuition": 9000, "roomAndBoard": 12000},
+        {"id": 2, "name": "Private College", "type": "Private", "tuition": 45000, "roomAndBoard": 15000},
+        {"id": 3, "name": "Valley Community College", "type": "Public", "tuition": 4000, "roomAndBoard": 9000},
+        {"id": 4, "name": "No Tuition Listed", "type": "Public", "tuition": "", "roomAndBoard": 9000}
+    ]
+    occupations = [
+        {"id": "nurse", "title": "Registered Nurse", "salary": 75000},
+        {"id": "teacher", "title": "Teacher", "salary": 52000},
+        {"id": "unknown", "title": "No Salary Listed", "salary": ""}
+    ]
+    builder = create_path_comparison({"startAge": 18, "yearsToProject": 20, "initialSavings": 5000})
+    
+    for metric in path_grid.GRID_METRICS:
+        ranked = builder.rank_college_occupation_grid(colleges, occupations, metric=metric, top_k=4, chunk_size=2)
+        saved_numpy = path_grid.np
+        path_grid.np = None
+        try:
+            fallback = builder.rank_college_occupation_grid(colleges, occupations, metric=metric, top_k=4)
+        finally:
+            path_grid.np = saved_numpy
+        
+        assert [(r["collegeId"], r["occupationId"]) for r in ranked] == \
+               [(r["collegeId"], r["occupationId"]) for r in fallback]
+        for fast, slow in zip(ranked, fallback):
+            assert abs(fast["netWorth"] - slow["netWorth"]) < 0.01
+    
+    # Combinations with missing data are skipped; the cheap public school beats the private one
+    best = builder.rank_college_occupation_grid(colleges, occupations, metric="netWorth", top_k=10)
+    assert len(best) == 6
+    nurse = [r["collegeId"] for r in best if r["occupationId"] == "nurse"]
+    assert nurse.index(1) < nurse.index(2)
+    print(f"Best grid combination: {best[0]['collegeName']} -> {best[0]['occupationTitle']}")
+    
+    # Ties at the k-th place go to the lowest college index, as in the pure Python ranking
+    tuitions = [20000, 20000, 4000, 20000, 20000, 4000, 20000, 20000]
+    tied = [{"id": i, "name": f"College {i}", "type": "Public", "tuition": tuition, "roomAndBoard": 9000}
+            for i, tuition in enumerate(tuitions)]
+    ranked = builder.rank_college_occupation_grid(tied, occupations[:1], metric="debtFreeYear", top_k=3)
+    assert [r["collegeId"] for r in ranked] == [2, 5, 0]
+
+
+if __name__ == "__main__":
+    print("Testing parallel path comparison...")
+    test_parallel_compare_paths()
+    print("\nTesting the college x occupation grid...")
+    test_college_occupation_grid()
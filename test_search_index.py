@@ -0,0 +1,106 @@
+"""
+Test script for the search indexes behind search_colleges and search_occupations.
+Checks that indexed substring search, filtering and paginated sorting return exactly
+what a full scan returns.
+"""
+
+import sys
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+from data_loader import DataLoader
+from text_index import TrigramIndex
+
+
+def _scan(records, query, fields):
+    query = query.lower()
+    return [r for r in records if any(query in str(r.get(f) or '').lower() for f in fields)]
+
+
+def test_index_matches_scan():
+    """Short, long, multi-word and missing queries should all match a linear scan."""
+    loader = DataLoader()
+    colleges = loader.get_college_data()
+    occupations = loader.get_occupation_data()
+
+    for query in ["a", "ny", "col", "Stan", "university of", ", CA", "engineer", "zzzq", ""]:
+        assert loader.search_colleges(query) == _scan(colleges, query, ("name", "location")), query
+        assert loader.search_occupations(query) == _scan(occupations, query, ("title", "description")), query
+        print(f"{query!r}: {len(loader.search_colleges(query))} colleges")
+
+
+def test_index_follows_table_changes():
+    """Replacing the table should rebuild the index instead of returning stale rows."""
+    loader = DataLoader()
+    loader.get_college_data()
+    loader._college_data = [{"name": "Test Institute", "location": "Nowhere, ZZ"}]
+    assert loader.search_colleges("institute") == loader._college_data
+
+    index = TrigramIndex([{"title": None}, {"title": 12345}], ["title"])
+    assert index.search("234") == [1]
+
+
+def test_filters_match_scan():
+    """Combined numeric and categorical filters should match filtering every row."""
+    loader = DataLoader()
+    colleges = loader.get_college_data()
+    filters = {"maxTuition": 12000, "acceptanceRange": (40, 95), "states": ["CA", "NY", "TX"], "sizes": ["small", "medium"]}
+
+    expected = [
+        c for c in _scan(colleges, "college", ("name", "location"))
+        if isinstance(c["tuition"], (int, float)) and c["tuition"] <= 12000
+        and isinstance(c["acceptanceRate"], (int, float)) and 40 <= c["acceptanceRate"] <= 95
+        and c["state"] in ("CA", "NY", "TX") and c["size"] in ("small", "medium")
+    ]
+    assert expected and loader.search_colleges("college", filters) == expected
+
+    occupations = loader.get_occupation_data()
+    expected = [
+        o for o in occupations
+        if isinstance(o["salary"], (int, float)) and o["salary"] >= 90000 and o["education"] == "Bachelor's"
+    ]
+    assert loader.search_occupations("", {"minSalary": 90000, "education": ["Bachelor's"]}) == expected
+    print(f"Filtered: {len(expected)} occupations")
+
+
+def test_paginated_college_search():
+    """Walking every page should visit each match once, in sort order."""
+    loader = DataLoader()
+    filters = {"states": ["CA"]}
+    expected = sorted(
+        loader.search_colleges("", filters),
+        key=lambda c: (not isinstance(c["tuition"], (int, float)), c["tuition"] if isinstance(c["tuition"], (int, float)) else 0)
+    )
+
+    seen, cursor = [], None
+    while True:
+        page = loader.search_colleges_page("", filters, sort="tuition", limit=50, cursor=cursor)
+        assert len(page["results"]) <= 50 and page["total"] == len(expected)
+        seen.extend(page["results"])
+        cursor = page["nextCursor"]
+        if cursor is None:
+            break
+    assert [c["tuition"] for c in seen] == [c["tuition"] for c in expected]
+    assert len({c["id"] for c in seen}) == len(expected)
+
+    # Rating sorts best first by default; cursors are tied to their sort order
+    top = loader.search_colleges_page("", filters, sort="rating", limit=5)
+    ratings = [c["rating"] for c in top["results"]]
+    assert ratings == sorted(ratings, reverse=True)
+    try:
+        loader.search_colleges_page("", filters, sort="rank", cursor=top["nextCursor"])
+        assert False, "Cursor from another sort order should be rejected"
+    except ValueError:
+        pass
+    print(f"Paged {len(seen)} California colleges")
+
+
+if __name__ == "__main__":
+    test_index_matches_scan()
+    test_index_follows_table_changes()
+    test_filters_match_scan()
+    test_paginated_college_search()
+    print("Search index tests passed!")
@@ -0,0 +1,92 @@
+"""
+Test script for the projection response serializers.
+Checks that the fast encoder and the standard library fallback produce the same documents,
+and that the columnar encoding round-trips every series.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+import columnar
+import serialization
+from financial_updated import FinancialCalculator
+
+
+def _sample_projection():
+    """Run a small projection to get a realistic result dictionary."""
+    input_data = {
+        "startAge": 22,
+        "yearsToProject": 10,
+        "assets": [{"type": "investment", "name": "Savings", "initialValue": 15000}],
+        "incomes": [{"type": "salary", "name": "Salary", "annualAmount": 55000}],
+        "expenditures": [
+            {"type": "housing", "name": "Rent", "annualAmount": 14000},
+            {"type": "living", "name": "Food", "annualAmount": 6000}
+        ],
+        "milestones": [{"type": "car", "year": 2, "car_value": 20000}]
+    }
+    calculator = FinancialCalculator.from_input_data(input_data)
+    return calculator.calculate_projection()
+
+
+def test_serializer_round_trip():
+    """Both encoder backends should produce documents that decode to the same data."""
+    result = _sample_projection()
+
+    encoded = serialization.dumps(result)
+    assert isinstance(encoded, bytes)
+    assert serialization.loads(encoded) == json.loads(json.dumps(result))
+
+    # Force the standard library path and compare
+    saved_orjson = serialization.orjson
+    serialization.orjson = None
+    try:
+        fallback = serialization.dumps(result)
+    finally:
+        serialization.orjson = saved_orjson
+    assert json.loads(fallback) == json.loads(encoded)
+
+    print(f"Serializer backend: {serialization.BACKEND}, {len(encoded)} bytes")
+
+
+def test_serializer_accepts_tuples_and_int_keys():
+    """Values the stdlib encoder accepts must keep working with the fast path."""
+    data = {"series": (1, 2, 3), 5: "five"}
+    assert json.loads(serialization.dumps(data)) == {"series": [1, 2, 3], "5": "five"}
+
+
+def test_columnar_round_trip():
+    """Every encoding should decode to the same document as the JSON response."""
+    result = json.loads(serialization.dumps(_sample_projection()))
+    json_size = len(serialization.dumps(result))
+
+    for encoding in columnar.ENCODINGS:
+        encoded = columnar.encode(result, encoding)
+        assert columnar.decode(encoded) == result, f"{encoding} encoding did not round-trip"
+        print(f"Columnar ({encoding}): {len(encoded)} bytes vs {json_size} bytes of JSON")
+
+    # Nested series (e.g. a path comparison) and 64-bit values round-trip too
+    nested = {"paths": {"a": {"netWorth": [0, -5, 2 ** 40]}}, "title": "x"}
+    assert columnar.decode(columnar.encode(nested, "delta-varint")) == nested
+
+
+def test_columnar_negotiation():
+    """Only clients that ask for the columnar media type should get it."""
+    assert columnar.negotiate(None) is None
+    assert columnar.negotiate("application/json") is None
+    assert columnar.negotiate(columnar.MEDIA_TYPE) == "raw"
+    assert columnar.negotiate(f"application/json, {columnar.MEDIA_TYPE}; encoding=delta-varint") == "delta-varint"
+    assert columnar.negotiate(f"{columnar.MEDIA_TYPE}; q=0") is None
+
+
+if __name__ == "__main__":
+    test_serializer_round_trip()
+    test_serializer_accepts_tuples_and_int_keys()
+    test_columnar_round_trip()
+    test_columnar_negotiation()
+    print("Serialization tests passed!")
@@ -0,0 +1,68 @@
+"""
+Test script for the binary data snapshot.
+Checks that DataLoader serves the same tables, id lookups and net prices from a
+snapshot as from the CSV files, and that a newer CSV file takes precedence.
+"""
+
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+from data_loader import DataLoader
+from snapshot import SNAPSHOT_FILE, write_snapshot
+
+
+def test_snapshot_round_trip():
+    """Tables loaded from a snapshot equal the tables parsed from CSV."""
+    csv_loader = DataLoader()
+    colleges = csv_loader.get_college_data()
+    occupations = csv_loader.get_occupation_data()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        write_snapshot(os.path.join(data_dir, SNAPSHOT_FILE),
+                       {"college_data.csv": colleges, "occupation_data.csv": occupations},
+                       {"college_data.csv": csv_loader.get_fee_matrix()})
+        loader = DataLoader(data_dir=data_dir, assets_dir=data_dir)
+        start = time.perf_counter()
+        assert loader.get_college_data() == colleges
+        assert loader.get_occupation_data() == occupations
+        print(f"Loaded {len(colleges)} colleges from the snapshot in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        college = loader.get_college_by_id(colleges[100]["id"])
+        assert college is loader.get_college_data()[100]
+        assert loader.get_occupation_by_id("no-such-id") is None
+
+        ids = [college["id"] for college in colleges[:200]]
+        expected = csv_loader.net_price(ids, 60000)
+        actual = loader.net_price(ids, 60000)
+        assert all(a == e or (math.isnan(a) and math.isnan(e)) for a, e in zip(actual, expected))
+
+
+def test_newer_csv_wins():
+    """A CSV file written after the snapshot is loaded instead of the snapshot's table."""
+    with tempfile.TemporaryDirectory() as data_dir:
+        write_snapshot(os.path.join(data_dir, SNAPSHOT_FILE), {"occupation_data.csv": [
+            {"id": 1, "title": "Snapshot Title", "salary": 1}
+        ]})
+        csv_path = os.path.join(data_dir, "occupation_data.csv")
+        shutil.copy(server_path / "data" / "occupation_data.csv", csv_path)
+        later = os.path.getmtime(os.path.join(data_dir, SNAPSHOT_FILE)) + 5
+        os.utime(csv_path, (later, later))
+
+        occupations = DataLoader(data_dir=data_dir, assets_dir=data_dir).get_occupation_data()
+        assert len(occupations) > 1 and occupations[0]["title"] != "Snapshot Title"
+
+
+if __name__ == "__main__":
+    print("Testing snapshot round trip...")
+    test_snapshot_round_trip()
+    print("\nTesting CSV precedence...")
+    test_newer_csv_wins()
@@ -0,0 +1,119 @@
+"""
+Test script for the pre-fork worker server.
+Starts a server with two workers on a temporary socket, checks the framing and that a
+baseline request answered by a worker matches run_projection, then shuts the server down.
+Also checks that exited workers are replaced and that a SIGHUP reload keeps serving.
+"""
+
+import copy
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make sure we can import from the server/python directory
+server_path = Path("server/python")
+sys.path.append(str(server_path.absolute()))
+
+from calculator import run_projection
+from serialization import dumps, loads
+from worker_server import PreforkServer, recv_message, request_projection, send_message
+
+
+INPUT_DATA = {
+    "pathType": "baseline",
+    "startAge": 22,
+    "yearsToProject": 10,
+    "assets": [{"type": "investment", "name": "Savings", "initialValue": 5000}],
+    "liabilities": [],
+    "incomes": [{"type": "salary", "name": "Salary", "annualAmount": 45000}],
+    "expenditures": [{"type": "housing", "name": "Rent", "annualAmount": 18000}],
+    "milestones": [{"type": "marriage", "year": 3}]
+}
+
+
+def start_server(socket_path, workers=2, max_requests=0):
+    """Run PreforkServer in a forked process and wait until its socket accepts connections."""
+    server = PreforkServer(socket_path, workers, max_requests)
+    process = multiprocessing.get_context("fork").Process(target=server.serve_forever)
+    process.start()
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(socket_path)
+            return process
+        except (FileNotFoundError, ConnectionRefusedError):
+            time.sleep(0.05)
+    process.terminate()
+    raise RuntimeError("Worker server did not start")
+
+
+def stop_server(process, socket_path):
+    """Shut the server down with SIGTERM and check that it cleaned up."""
+    os.kill(process.pid, signal.SIGTERM)
+    process.join(30)
+    assert process.exitcode == 0
+    assert not os.path.exists(socket_path)
+
+
+def test_frame_round_trip():
+    """Frames survive a socket pair; a closed peer reads as None."""
+    left, right = socket.socketpair()
+    with left, right:
+        send_message(left, b'{"a": 1}')
+        send_message(left, b"")
+        assert recv_message(right) == b'{"a": 1}'
+        assert recv_message(right) == b""
+        left.close()
+        assert recv_message(right) is None
+
+
+def test_baseline_request():
+    """A worker answers a baseline request exactly as run_projection does."""
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = os.path.join(socket_dir, "calculator.sock")
+        process = start_server(socket_path)
+        try:
+            result = request_projection(copy.deepcopy(INPUT_DATA), socket_path)
+        finally:
+            stop_server(process, socket_path)
+
+    # Compare after the same JSON round trip the server's response went through
+    expected = loads(dumps(run_projection(copy.deepcopy(INPUT_DATA))))
+    assert "error" not in result
+    assert result == expected
+    print(f"Worker result matches run_projection ({len(result)} fields)")
+
+
+def test_respawn_and_reload():
+    """A recycled worker is replaced, and the server keeps answering across a SIGHUP reload."""
+    payload = dict(INPUT_DATA, fields=["netWorth"])
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = os.path.join(socket_dir, "calculator.sock")
+        # One worker that exits after every request: each request needs a respawned worker
+        process = start_server(socket_path, workers=1, max_requests=1)
+        try:
+            results = [request_projection(copy.deepcopy(payload), socket_path) for _ in range(3)]
+            for _ in range(3):
+                os.kill(process.pid, signal.SIGHUP)
+                results.append(request_projection(copy.deepcopy(payload), socket_path))
+            assert process.is_alive()
+        finally:
+            stop_server(process, socket_path)
+
+    assert all(result == results[0] and "netWorth" in result for result in results)
+    print(f"{len(results)} requests answered across worker respawns and reloads")
+
+
+if __name__ == "__main__":
+    print("Testing framing...")
+    test_frame_round_trip()
+    print("\nTesting a baseline request...")
+    test_baseline_request()
+    print("\nTesting respawn and reload...")
+    test_respawn_and_reload()